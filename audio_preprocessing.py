@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Client-side audio preconditioning before Speech-to-Text upload
+Downmixes, resamples, cuts silence (edges or every pause, via energy VAD) and re-encodes compactly with numpy/soundfile
+"""
+
+import io
+import os
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from long_audio import FRAME_MS, frame_energy, load_audio
+
+# Sample rate that keeps the speech band and drops everything above it
+SPEECH_SAMPLE_RATE = 16000
+
+# (soundfile format, subtype, file extension, MIME type) per output format
+OUTPUT_FORMATS = {
+    "opus": ("OGG", "OPUS", ".ogg", "audio/ogg"),
+    "flac": ("FLAC", "PCM_16", ".flac", "audio/flac"),
+    "wav": ("WAV", "PCM_16", ".wav", "audio/wav"),
+}
+
+# Sample rates the Opus encoder accepts
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Taps of the anti-aliasing filter used when downsampling
+LOWPASS_TAPS = 101
+
+# Silence kept between voiced segments so words on either side of a cut stay apart
+SEGMENT_GAP_SECONDS = 0.3
+
+# Percentile of frame energy taken as the noise floor; low so recordings with few pauses still work
+NOISE_FLOOR_PERCENTILE = 2
+
+# Frames louder than this (RMS, dB full scale) always count as sound. Room noise sits far below it,
+# so a bad noise-floor estimate on a recording without pauses cannot drop quieter speakers
+SPEECH_LEVEL_DBFS = -40.0
+
+
+def resample(samples: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample mono audio
+
+    Downsampling first applies a windowed-sinc low-pass filter below the new Nyquist
+    frequency, then samples are linearly interpolated at the new rate. This is plenty
+    for speech recognition and avoids a scipy dependency.
+
+    Args:
+        samples: Mono samples
+        sample_rate: Current sample rate
+        target_rate: Sample rate to produce
+
+    Returns:
+        np.ndarray: Resampled float32 samples
+    """
+    if sample_rate == target_rate or len(samples) == 0:
+        return samples.astype(np.float32, copy=False)
+
+    if target_rate < sample_rate:
+        cutoff = 0.95 * target_rate / (2 * sample_rate)
+        n = np.arange(LOWPASS_TAPS) - (LOWPASS_TAPS - 1) / 2
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(LOWPASS_TAPS)
+        samples = np.convolve(samples, taps / taps.sum(), mode='same')
+
+    count = int(round(len(samples) * target_rate / sample_rate))
+    positions = np.arange(count) * (sample_rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def trim_silence(samples: np.ndarray, sample_rate: int, threshold_db: float = 40.0,
+                 pad_seconds: float = 0.1) -> tuple:
+    """
+    Find the span between the first and last frame within threshold_db of the loudest frame
+
+    Args:
+        samples: Mono samples
+        sample_rate: Samples per second
+        threshold_db: How far below the loudest frame a frame still counts as sound
+        pad_seconds: Audio kept on either side of the detected sound
+
+    Returns:
+        tuple: (start sample, end sample); the whole clip if nothing is loud enough
+    """
+    energy = frame_energy(samples, sample_rate)
+    if len(energy) == 0 or energy.max() <= 0:
+        return 0, len(samples)
+
+    loud = np.flatnonzero(energy >= energy.max() * 10 ** (-threshold_db / 20))
+    frame = max(1, sample_rate * FRAME_MS // 1000)
+    pad = int(pad_seconds * sample_rate)
+    start = max(0, loud[0] * frame - pad)
+    end = min(len(samples), (loud[-1] + 1) * frame + pad)
+    return start, end
+
+
+def detect_speech(samples: np.ndarray, sample_rate: int, threshold_db: float = 40.0, margin_db: float = 10.0,
+                  min_speech_seconds: float = 0.1, min_silence_seconds: float = 0.6,
+                  pad_seconds: float = 0.2) -> np.ndarray:
+    """
+    Find voiced regions with an energy detector
+
+    A frame is voiced when it is within threshold_db of the loudest frame and at least
+    margin_db above the noise floor (a low percentile of frame energy), or when it is
+    louder than SPEECH_LEVEL_DBFS. Voiced runs
+    shorter than min_speech_seconds are dropped as clicks, the rest are padded and
+    merged across pauses shorter than min_silence_seconds.
+
+    Args:
+        samples: Mono samples
+        sample_rate: Samples per second
+        threshold_db: How far below the loudest frame a frame still counts as sound
+        margin_db: How far above the noise floor a frame must be to count as sound
+        min_speech_seconds: Shortest voiced run kept
+        min_silence_seconds: Shortest pause that splits two regions
+        pad_seconds: Audio kept on either side of each region
+
+    Returns:
+        np.ndarray: (regions, 2) array of start and end sample indices, in order
+    """
+    energy = frame_energy(samples, sample_rate)
+    if len(energy) == 0 or energy.max() <= 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    frame = max(1, sample_rate * FRAME_MS // 1000)
+    threshold = max(energy.max() * 10 ** (-threshold_db / 20),
+                    np.percentile(energy, NOISE_FLOOR_PERCENTILE) * 10 ** (margin_db / 20))
+    threshold = min(threshold, 10 ** (SPEECH_LEVEL_DBFS / 20))
+    voiced = np.concatenate(([0], (energy >= threshold).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(voiced))
+    starts, ends = edges[::2], edges[1::2]
+
+    keep = ends - starts >= min_speech_seconds * 1000 / FRAME_MS
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    pad = int(round(pad_seconds * 1000 / FRAME_MS))
+    starts = np.maximum(starts - pad, 0)
+    ends = np.minimum(ends + pad, len(energy))
+    split = starts[1:] - ends[:-1] >= min_silence_seconds * 1000 / FRAME_MS
+    starts = np.concatenate((starts[:1], starts[1:][split]))
+    ends = np.concatenate((ends[:-1][split], ends[-1:]))
+
+    regions = np.stack([starts, ends], axis=1).astype(np.int64) * frame
+    # The last partial frame is not analysed; keep it if the final region reaches it
+    if ends[-1] == len(energy):
+        regions[-1, 1] = len(samples)
+    return regions
+
+
+def remap_timestamps(times: np.ndarray, segments: List[List[float]]) -> np.ndarray:
+    """
+    Map times in an uploaded, cut-down clip back onto the original recording
+
+    Times inside the silence between two segments are clamped to the end of the
+    segment before it; times past the last segment run on from its start.
+
+    Args:
+        times: Times in seconds within the uploaded clip
+        segments: [upload start, original start, duration] per segment, as reported
+            by precondition_samples
+
+    Returns:
+        np.ndarray: Times in seconds within the original recording
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 3)
+    upload_start, original_start, duration = segments.T.copy()
+    duration[-1] = np.inf
+    index = np.maximum(np.searchsorted(upload_start, times, side='right') - 1, 0)
+    return original_start[index] + np.minimum(times - upload_start[index], duration[index])
+
+
+def precondition_samples(samples: np.ndarray, sample_rate: int, target_rate: int = SPEECH_SAMPLE_RATE,
+                         trim: bool = True, threshold_db: float = 40.0,
+                         audio_format: str = "opus", vad: bool = False) -> Dict[str, Any]:
+    """
+    Turn decoded audio into a compact upload for Speech-to-Text
+
+    Args:
+        samples: Samples, mono or shaped (frames, channels)
+        sample_rate: Samples per second
+        target_rate: Sample rate of the upload
+        trim: Whether to cut leading and trailing silence
+        threshold_db: Silence threshold below the loudest frame, used when trimming
+        audio_format: One of OUTPUT_FORMATS ("opus", "flac" or "wav")
+        vad: Upload only the voiced regions found by detect_speech, joined by short
+            silences, instead of one trimmed span
+
+    Returns:
+        Dictionary containing the encoded audio, its MIME type and file extension,
+        segments (for remap_timestamps), leading_trim, and skipped_fraction (share
+        of the original duration left out of the upload)
+    """
+    import soundfile as sf
+
+    container, subtype, extension, content_type = OUTPUT_FORMATS[audio_format]
+    if audio_format == "opus" and target_rate not in OPUS_SAMPLE_RATES:
+        raise ValueError(f"Opus needs one of {OPUS_SAMPLE_RATES} Hz, not {target_rate}")
+
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    original_duration = len(samples) / sample_rate
+
+    if vad:
+        regions = detect_speech(samples, sample_rate, threshold_db)
+    elif trim:
+        regions = np.array([trim_silence(samples, sample_rate, threshold_db)])
+    else:
+        regions = np.array([[0, len(samples)]])
+    if len(regions) == 0:
+        # Nothing sounds like speech; upload everything rather than guess
+        regions = np.array([[0, len(samples)]])
+
+    gap = np.zeros(int(SEGMENT_GAP_SECONDS * sample_rate), dtype=samples.dtype)
+    pieces, segments = [], []
+    position = 0
+    for start, end in regions.tolist():
+        if pieces:
+            pieces.append(gap)
+            position += len(gap)
+        pieces.append(samples[start:end])
+        segments.append([position / sample_rate, start / sample_rate, (end - start) / sample_rate])
+        position += end - start
+    voiced_duration = sum(segment[2] for segment in segments)
+    samples = resample(np.concatenate(pieces), sample_rate, target_rate)
+
+    buffer = io.BytesIO()
+    sf.write(buffer, samples, target_rate, format=container, subtype=subtype)
+    return {
+        "data": buffer.getvalue(),
+        "content_type": content_type,
+        "extension": extension,
+        "sample_rate": target_rate,
+        "duration": len(samples) / target_rate,
+        "original_duration": original_duration,
+        "segments": segments,
+        "voiced_duration": voiced_duration,
+        "skipped_fraction": 1 - voiced_duration / original_duration if original_duration else 0.0,
+        "leading_trim": segments[0][1],
+        "trailing_trim": original_duration - segments[-1][1] - segments[-1][2]
+    }
+
+
+def precondition_file(path: str, **kwargs) -> Dict[str, Any]:
+    """
+    Decode and precondition an audio file
+
+    Args:
+        path: Audio file to read
+        **kwargs: Options passed to precondition_samples (target_rate, trim, threshold_db, audio_format, vad)
+
+    Returns:
+        Dictionary from precondition_samples plus original_bytes, processed_bytes,
+        bytes_saved and processing_time
+    """
+    started = time.perf_counter()
+    samples, sample_rate = load_audio(path)
+    result = precondition_samples(samples, sample_rate, **kwargs)
+
+    original_bytes = os.path.getsize(path)
+    result["original_sample_rate"] = sample_rate
+    result["original_bytes"] = original_bytes
+    result["processed_bytes"] = len(result["data"])
+    result["bytes_saved"] = original_bytes - len(result["data"])
+    result["processing_time"] = time.perf_counter() - started
+    return result
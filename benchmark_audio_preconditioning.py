@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: uploading the original recording vs a preconditioned one to Speech-to-Text
+Runs against a local stand-in server with a simulated upload link, so the end-to-end
+numbers reflect upload size; server-side processing time saved is not included
+
+Run with: python benchmark_audio_preconditioning.py [--file PATH] [--bandwidth BYTES_PER_SECOND]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+from audio_preprocessing import precondition_file
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+
+DEFAULT_FILE = "TestAudioFileAPI.m4a"
+
+
+def synthetic_recording(path: str, seconds: float = 30.0, rate: int = 48000):
+    """Stereo 48 kHz WAV with speech-like bursts and silent lead-in/tail, standing in for a raw recording"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * rate)) / rate
+    envelope = (np.sin(2 * np.pi * 0.7 * t) > -0.3).astype(np.float32)
+    voice = envelope * (0.3 * np.sin(2 * np.pi * 180 * t) + 0.05 * rng.standard_normal(len(t)))
+    voice[:int(2 * rate)] = 0
+    voice[-int(3 * rate):] = 0
+    sf.write(path, np.stack([voice, voice], axis=1).astype(np.float32), rate)
+
+
+def timed_upload(service: ElevenLabsAudioService, path: str, runs: int, **kwargs) -> float:
+    """Mean seconds for a speech_to_text call"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = service.speech_to_text(path, **kwargs)
+        assert result["success"], result.get("error")
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    args = sys.argv[1:]
+    path = args[args.index("--file") + 1] if "--file" in args else DEFAULT_FILE
+    bandwidth = float(args[args.index("--bandwidth") + 1]) if "--bandwidth" in args else 1_000_000
+    runs = 3
+
+    print("=== STT Audio Preconditioning Benchmark ===")
+    print(f"Simulated upload link: {bandwidth / 1e6:.2f} MB/s, {runs} runs each\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            precondition_file(path)
+        except Exception as e:
+            # Compressed formats (m4a/mp3) decode through pydub, which needs ffmpeg
+            print(f"  Could not decode {path}: {e}")
+            path = os.path.join(tmp, "synthetic_recording.wav")
+            synthetic_recording(path)
+            print("  Using a synthetic 30 s stereo 48 kHz WAV instead\n")
+
+        with LocalElevenLabsServer(upload_bytes_per_second=bandwidth) as server:
+            service = ElevenLabsAudioService(api_key="benchmark", transport=ElevenLabsTransport())
+            service.base_url = server.base_url
+
+            print(f"  {'upload':<20} {'bytes':>10} {'prep ms':>9} {'total ms':>9}")
+            baseline = timed_upload(service, path, runs)
+            original_bytes = os.path.getsize(path)
+            print(f"  {'original':<20} {original_bytes:10d} {0:9.1f} {baseline * 1000:9.1f}")
+
+            for audio_format in ("opus", "flac"):
+                report = precondition_file(path, audio_format=audio_format)
+                elapsed = timed_upload(service, path, runs, precondition={"audio_format": audio_format})
+                print(f"  {audio_format + ' 16 kHz mono':<20} {report['processed_bytes']:10d} "
+                      f"{report['processing_time'] * 1000:9.1f} {elapsed * 1000:9.1f}")
+                print(f"    saved {report['bytes_saved']} bytes "
+                      f"({report['bytes_saved'] / original_bytes:.0%}), "
+                      f"trimmed {report['leading_trim'] + report['trailing_trim']:.2f} s of silence, "
+                      f"{(baseline - elapsed) * 1000:.1f} ms faster end-to-end")
+
+
+if __name__ == "__main__":
+    main()
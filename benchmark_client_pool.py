@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call client setup cost, fresh GeminiClient vs shared registry session
+No requests are sent; only the setup done before each prompt is measured
+Run with: python benchmark_client_pool.py
+"""
+
+import os
+import time
+import warnings
+
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
+warnings.filterwarnings('ignore')
+
+from config import Config
+
+# genai.configure does not contact the API, so a placeholder key is enough here
+Config.GEMINI_API_KEY = Config.GEMINI_API_KEY or "benchmark-placeholder-key"
+
+from gemini_client import GeminiClient
+from gemini_pool import GeminiRegistry
+
+
+def per_call_ms(func, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main():
+    calls = 200
+    print("=== Gemini Client Setup Benchmark ===")
+    print(f"{calls} calls each\n")
+
+    before = per_call_ms(lambda i: GeminiClient(), calls)
+    print(f"  {'fresh GeminiClient per call (before)':<45} {before:8.3f} ms/call")
+
+    registry = GeminiRegistry(pool_size=2)
+    registry.session("warmup")
+    same_session = per_call_ms(lambda i: registry.session("chat"), calls)
+    print(f"  {'registry.session, same session (after)':<45} {same_session:8.3f} ms/call")
+
+    new_sessions = per_call_ms(lambda i: registry.session(f"session-{i}"), calls)
+    print(f"  {'registry.session, new session each call':<45} {new_sessions:8.3f} ms/call")
+
+    print(f"\n  speedup (same session): {before / same_session:10.1f}x")
+    print(f"  speedup (new sessions): {before / new_sessions:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark: list-of-dicts words vs ColumnarTranscript
+Compares parse time from the JSON response, memory held and filter time on synthetic transcripts
+
+Run with: python benchmark_columnar_transcript.py [--hours H]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from columnar_transcript import ColumnarTranscript
+from synthetic_transcript import make_response
+
+
+def held_memory(build):
+    """Run build(); return (result, bytes still allocated by the result)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held
+
+
+def best_of(runs, fn):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    args = sys.argv[1:]
+    hours = float(args[args.index("--hours") + 1]) if "--hours" in args else 3.0
+
+    payload = json.dumps(make_response(hours))
+    print("=== Columnar Transcript Benchmark ===")
+    print(f"{hours:g} h synthetic transcript, {len(payload) / 1e6:.1f} MB of JSON\n")
+
+    # Parse cost is json.loads plus whatever representation is built from it
+    words, dict_bytes = held_memory(lambda: json.loads(payload)["words"])
+    columnar, col_bytes = held_memory(lambda: ColumnarTranscript.from_response(json.loads(payload)))
+    dict_parse = best_of(3, lambda: json.loads(payload)["words"])
+    col_parse = best_of(3, lambda: ColumnarTranscript.from_response(json.loads(payload)))
+    tokens = len(words)
+
+    dict_filter = best_of(5, lambda: [w for w in words if w["type"] == "word" and w["speaker_id"] == "speaker_1"])
+    col_filter = best_of(5, lambda: columnar.filter(word_type="word", speaker_id="speaker_1"))
+    dict_span = best_of(5, lambda: [w for w in words if 600 <= w["start"] < 1200])
+    col_span = best_of(5, lambda: columnar[(columnar.start >= 600) & (columnar.start < 1200)])
+
+    print(f"  {tokens} tokens")
+    print(f"  {'':<28} {'list of dicts':>14} {'columnar':>12}")
+    print(f"  {'parse from JSON (ms)':<28} {dict_parse * 1000:14.1f} {col_parse * 1000:12.1f}")
+    print(f"  {'memory held (MB)':<28} {dict_bytes / 1e6:14.1f} {col_bytes / 1e6:12.1f}")
+    print(f"  {'bytes per token':<28} {dict_bytes / tokens:14.0f} {col_bytes / tokens:12.0f}")
+    print(f"  {'filter type+speaker (ms)':<28} {dict_filter * 1000:14.2f} {col_filter * 1000:12.2f}")
+    print(f"  {'filter time span (ms)':<28} {dict_span * 1000:14.2f} {col_span * 1000:12.2f}")
+    print(f"\n  memory: {dict_bytes / col_bytes:.1f}x smaller, parse: {col_parse / dict_parse:.2f}x the time, "
+          f"filters: {dict_filter / col_filter:.0f}x / {dict_span / col_span:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark: module-level requests.post vs the pooled ElevenLabsTransport
+Runs against a local stand-in server, so only connection setup cost is compared
+(no TLS locally; against the real API each new connection also pays a TLS handshake)
+
+Run with: python benchmark_http_transport.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+
+
+def run_load(send, total: int, threads: int) -> float:
+    """Send total requests from a pool of threads; return mean ms per request"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: send(), range(total)))
+    return (time.perf_counter() - start) / total * 1000
+
+
+def main():
+    total = 2000
+    print("=== 11Labs HTTP Transport Benchmark ===")
+    print(f"{total} TTS requests against a local stand-in server\n")
+
+    with LocalElevenLabsServer() as server:
+        url = f"{server.base_url}/text-to-speech/local"
+        payload = {"text": "Hello", "model_id": "eleven_multilingual_v2"}
+        headers = {"xi-api-key": "benchmark"}
+
+        for threads in (1, 8):
+            transport = ElevenLabsTransport(pool_maxsize=threads)
+
+            connections_before = server.connections
+            plain = run_load(lambda: requests.post(url, headers=headers, json=payload, timeout=60), total, threads)
+            plain_connections = server.connections - connections_before
+
+            connections_before = server.connections
+            pooled = run_load(lambda: transport.post(url, headers=headers, json=payload), total, threads)
+            pooled_connections = server.connections - connections_before
+            transport.close()
+
+            print(f"  {threads} thread(s)")
+            print(f"    requests.post        {plain:8.3f} ms/request  {plain_connections:5d} connections")
+            print(f"    ElevenLabsTransport  {pooled:8.3f} ms/request  {pooled_connections:5d} connections")
+            print(f"    saved per request    {plain - pooled:8.3f} ms ({plain / pooled:.2f}x)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: precompiled PromptRewriter vs the original per-rule str.replace loop
+Run with: python benchmark_prompt_rewriter.py
+"""
+
+import random
+import timeit
+
+from prompt_rewriter import PromptRewriter, DEFAULT_RULES
+
+
+def legacy_preprocess(prompt: str, replacements: dict) -> str:
+    """The original GeminiClient._preprocess_prompt: lowercase, then one replace pass per rule"""
+    processed = prompt.lower()
+    for old_word, new_word in replacements.items():
+        processed = processed.replace(old_word, new_word)
+    return processed
+
+
+def make_prompt(n_chars: int) -> str:
+    """Synthetic conversation text with a sprinkling of rule words"""
+    random.seed(0)
+    vocabulary = ("I would like to move the gym session on Tuesday morning so that I can "
+                  "get more sleep and protect focus time before lunch with the team").split()
+    rule_words = "schedule meeting client book booking clients Meeting Schedule".split()
+    words = []
+    size = 0
+    while size < n_chars:
+        # Roughly one word in fifty hits a rule, as in real conversation text
+        word = random.choice(rule_words) if random.random() < 0.02 else random.choice(vocabulary)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def bench(label: str, func, repeat: int = 5, number: int = 10) -> float:
+    best = min(timeit.repeat(func, repeat=repeat, number=number)) / number
+    print(f"  {label:<40} {best * 1000:10.3f} ms")
+    return best
+
+
+def main():
+    print("=== Prompt Rewriter Benchmark ===")
+
+    large_rules = dict(DEFAULT_RULES)
+    large_rules.update({f"keyword{i}": f"replacement{i}" for i in range(500)})
+
+    for n_chars in (10_000, 100_000, 1_000_000):
+        prompt = make_prompt(n_chars)
+        print(f"\nPrompt size: {n_chars:,} chars")
+
+        for label, rules in (("default rules", DEFAULT_RULES), (f"{len(large_rules)} rules", large_rules)):
+            rewriter = PromptRewriter(rules)
+            legacy = bench(f"legacy str.replace ({label})", lambda: legacy_preprocess(prompt, rules))
+            compiled = bench(f"PromptRewriter ({label})", lambda: rewriter.rewrite(prompt))
+            print(f"  {'speedup':<40} {legacy / compiled:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: diarization analytics, vectorized vs a per-word Python loop
+Runs on synthetic multi-hour transcripts with hundreds of thousands of words
+
+Run with: python benchmark_speaker_analytics.py [--hours H]
+"""
+
+import sys
+import time
+from collections import defaultdict
+
+from columnar_transcript import ColumnarTranscript
+from speaker_analytics import diarization_stats
+from synthetic_transcript import make_words
+
+
+def python_turns(words):
+    """Reference implementation: talk time per speaker and gap/overlap totals with a plain loop"""
+    turns = []
+    for w in words:
+        if w["type"] != "word" or w.get("speaker_id") is None:
+            continue
+        if turns and turns[-1][0] == w["speaker_id"]:
+            turns[-1][2] = max(turns[-1][2], w["end"])
+        else:
+            turns.append([w["speaker_id"], w["start"], w["end"]])
+
+    talk = defaultdict(float)
+    overlap = gap = 0.0
+    latest = None
+    for speaker, start, end in turns:
+        talk[speaker] += end - start
+        if latest is not None:
+            if start < latest:
+                overlap += min(latest, end) - start
+            else:
+                gap += start - latest
+        latest = end if latest is None else max(latest, end)
+    return talk, overlap, gap
+
+
+def best_of(runs, fn):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    args = sys.argv[1:]
+    hours = float(args[args.index("--hours") + 1]) if "--hours" in args else 30.0
+
+    words = make_words(hours)
+    transcript = ColumnarTranscript.from_words(words)
+    stats = diarization_stats(transcript)
+
+    talk, overlap, gap = python_turns(words)
+    assert abs(overlap - stats["overlap_time"]) < 1e-6 and abs(gap - stats["gap_time"]) < 1e-6
+    assert all(abs(talk[s] - v["talk_time"]) < 1e-6 for s, v in stats["speakers"].items())
+
+    vectorized = best_of(5, lambda: diarization_stats(transcript))
+    loop = best_of(3, lambda: python_turns(words))
+
+    print("=== Speaker Analytics Benchmark ===")
+    print(f"{hours:g} h synthetic transcript, {stats['words']} words, {stats['turn_count']} turns\n")
+    print(f"  vectorized diarization_stats: {vectorized * 1000:8.1f} ms (all metrics)")
+    print(f"  Python loop over word dicts:  {loop * 1000:8.1f} ms (turns, talk time, gaps, overlaps only)")
+    print(f"  speedup: {loop / vectorized:.0f}x\n")
+    for speaker_id, speaker in stats["speakers"].items():
+        print(f"  {speaker_id}: {speaker['talk_time'] / 3600:.2f} h ({speaker['share']:.0%}), "
+              f"{speaker['turns']} turns, {speaker['words_per_minute']:.0f} wpm")
+    longest = stats["longest_monologue"]
+    print(f"  overlap {stats['overlap_time']:.0f} s over {stats['overlap_count']} turns, "
+          f"gaps {stats['gap_time']:.0f} s, longest monologue {longest['duration']:.0f} s by "
+          f"{longest['speaker_id']} at {longest['start']:.0f} s")
+
+
+if __name__ == "__main__":
+    main()
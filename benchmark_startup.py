@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Import-time profile for the Gemini entry points
+Each module is imported in a fresh interpreter with -X importtime
+
+Run with: python benchmark_startup.py [--runs N] [--max-ms LIMIT]
+Exits with status 1 if an entry point exceeds LIMIT ms or pulls in the Gemini SDK at import
+"""
+
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = [
+    "config",
+    "gemini_client",
+    "gemini_chat",
+    "gemini_clean",
+    "gemini_silent",
+    "run_gemini_clean",
+]
+
+SDK_MODULE = "google.generativeai"
+
+
+def profile_import(module: str):
+    """
+    Import a module in a fresh interpreter
+
+    Returns:
+        tuple: (cumulative import time in ms, whether the SDK got imported)
+    """
+    code = f"import sys, {module}; print({SDK_MODULE!r} in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative_us = int(parts[1])
+
+    return cumulative_us / 1000, result.stdout.strip() == "True"
+
+
+def main():
+    args = sys.argv[1:]
+    runs = int(args[args.index("--runs") + 1]) if "--runs" in args else 5
+    max_ms = float(args[args.index("--max-ms") + 1]) if "--max-ms" in args else None
+
+    print("=== Entry Point Import Profile ===")
+    print(f"{runs} runs per module, median cumulative import time\n")
+    print(f"  {'module':<20} {'median ms':>10} {'max ms':>10}  SDK imported")
+
+    failures = []
+    for module in ENTRY_POINTS:
+        timings = []
+        sdk_loaded = False
+        for _ in range(runs):
+            elapsed_ms, loaded = profile_import(module)
+            timings.append(elapsed_ms)
+            sdk_loaded = sdk_loaded or loaded
+
+        median = statistics.median(timings)
+        print(f"  {module:<20} {median:10.1f} {max(timings):10.1f}  {'YES' if sdk_loaded else 'no'}")
+
+        if sdk_loaded:
+            failures.append(f"{module} imports {SDK_MODULE} at import time")
+        if max_ms is not None and median > max_ms:
+            failures.append(f"{module} took {median:.1f} ms (limit {max_ms:.1f} ms)")
+
+    if failures:
+        print("\nStartup regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
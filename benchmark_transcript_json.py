@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: whole-document JSON vs incremental transcript JSON
+Compares time and peak extra memory for saving and reading synthetic multi-hour transcripts
+
+Run with: python benchmark_transcript_json.py [--hours H]
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic_transcript import make_words
+from transcript_json import TranscriptWriter, iter_words
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def peak_memory(fn):
+    """Bytes allocated at the peak of fn(), on top of what was already held"""
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    args = sys.argv[1:]
+    hours = float(args[args.index("--hours") + 1]) if "--hours" in args else 3.0
+
+    words = make_words(hours)
+    text = "".join(word["text"] for word in words)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "transcription_results.json")
+
+        def save_dumps():
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"language_code": "eng", "text": text, "words": words}))
+
+        def save_dump():
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"language_code": "eng", "text": text, "words": words}, f)
+
+        def save_incremental():
+            with TranscriptWriter(path, language_code="eng") as writer:
+                for word in words:
+                    writer.write_word(word)
+
+        def read_load():
+            with open(path, encoding="utf-8") as f:
+                return sum(1 for w in json.load(f)["words"] if w["type"] == "word")
+
+        def read_incremental():
+            return sum(1 for w in iter_words(path) if w["type"] == "word")
+
+        rows = []
+        for label, fn in (("save: json.dumps + write", save_dumps), ("save: json.dump", save_dump),
+                          ("save: TranscriptWriter", save_incremental)):
+            rows.append((label, timed(fn), peak_memory(fn)))
+        size = os.path.getsize(path)
+        for label, fn in (("read: json.load", read_load), ("read: iter_words", read_incremental)):
+            rows.append((label, timed(fn), peak_memory(fn)))
+        assert read_load() == read_incremental()
+
+    print("=== Transcript JSON Benchmark ===")
+    print(f"{hours:g} h synthetic transcript, {len(words)} tokens, {size / 1e6:.1f} MB of JSON\n")
+    print(f"  {'':<28} {'time (s)':>9} {'peak extra memory (MB)':>23}")
+    for label, seconds, peak in rows:
+        print(f"  {label:<28} {seconds:9.2f} {peak / 1e6:23.2f}")
+    print("\n  Peak memory excludes the word list itself, which the caller already holds when saving.")
+
+
+if __name__ == "__main__":
+    main()
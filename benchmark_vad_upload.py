@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: trimmed uploads vs voice-activity-detected uploads to Speech-to-Text
+Runs a small corpus of recordings with different amounts of silence against a local stand-in
+server with a simulated upload link. The end-to-end numbers reflect upload size only; the
+skipped fraction is also audio the API no longer has to transcribe or bill
+
+Run with: python benchmark_vad_upload.py [--bandwidth BYTES_PER_SECOND] [--file PATH ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+from audio_preprocessing import precondition_file
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+
+RATE = 48000
+
+# name: (length in seconds, share of the time spent talking, typical pause length)
+CORPUS = {
+    "dictation": (120, 0.85, 0.8),
+    "meeting": (300, 0.6, 3.0),
+    "interview": (240, 0.7, 2.0),
+    "voicemail": (60, 0.4, 6.0),
+    "lecture_qa": (300, 0.45, 8.0),
+}
+
+
+def synthetic_recording(path: str, seconds: float, talk_share: float, pause: float, seed: int):
+    """Mono WAV alternating speech-like bursts with pauses drawn around the given lengths"""
+    rng = np.random.default_rng(seed)
+    samples = 0.003 * rng.standard_normal(int(seconds * RATE))
+    speech = pause * talk_share / (1 - talk_share)
+    t = 0.0
+    while t < seconds:
+        t += rng.exponential(pause)
+        length = rng.exponential(speech)
+        start, end = int(t * RATE), min(int((t + length) * RATE), len(samples))
+        if start >= end:
+            break
+        tt = np.arange(end - start) / RATE
+        pitch = rng.uniform(100, 250)
+        samples[start:end] += (0.3 * np.sin(2 * np.pi * pitch * tt) * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * tt))
+                               + 0.03 * rng.standard_normal(end - start))
+        t += length
+    sf.write(path, samples.astype(np.float32), RATE)
+
+
+def timed_upload(service: ElevenLabsAudioService, path: str, **kwargs) -> float:
+    start = time.perf_counter()
+    result = service.speech_to_text(path, **kwargs)
+    assert result["success"], result.get("error")
+    return time.perf_counter() - start
+
+
+def main():
+    args = sys.argv[1:]
+    bandwidth = float(args[args.index("--bandwidth") + 1]) if "--bandwidth" in args else 1_000_000
+    extra = [args[i + 1] for i, arg in enumerate(args) if arg == "--file"]
+
+    print("=== STT Voice Activity Detection Benchmark ===")
+    print(f"Simulated upload link: {bandwidth / 1e6:.2f} MB/s, opus 16 kHz uploads\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for seed, (name, (seconds, share, pause)) in enumerate(CORPUS.items()):
+            path = os.path.join(tmp, f"{name}.wav")
+            synthetic_recording(path, seconds, share, pause, seed)
+            paths.append(path)
+        for path in extra:
+            try:
+                precondition_file(path)
+                paths.append(path)
+            except Exception as e:
+                print(f"  Skipping {path}: {e}")
+
+        with LocalElevenLabsServer(upload_bytes_per_second=bandwidth) as server:
+            service = ElevenLabsAudioService(api_key="benchmark", transport=ElevenLabsTransport())
+            service.base_url = server.base_url
+
+            print(f"  {'recording':<14} {'length s':>8} {'skipped':>8} {'trim ms':>9} {'vad ms':>9} {'saved':>7}")
+            totals = [0.0, 0.0, 0.0, 0.0]
+            for path in paths:
+                trimmed = precondition_file(path)
+                voiced = precondition_file(path, vad=True)
+                trim_time = timed_upload(service, path, precondition=True)
+                vad_time = timed_upload(service, path, precondition={"vad": True})
+
+                name = os.path.splitext(os.path.basename(path))[0]
+                print(f"  {name:<14} {voiced['original_duration']:8.0f} {voiced['skipped_fraction']:8.0%} "
+                      f"{trim_time * 1000:9.0f} {vad_time * 1000:9.0f} {1 - vad_time / trim_time:7.0%}")
+                totals[0] += voiced["original_duration"]
+                totals[1] += trimmed["duration"] - voiced["duration"]
+                totals[2] += trim_time
+                totals[3] += vad_time
+
+    audio, extra_skipped, trim_total, vad_total = totals
+    print(f"\n  corpus: {audio:.0f} s of audio; VAD uploads {extra_skipped:.0f} s less than edge trimming "
+          f"({extra_skipped / audio:.0%} of the corpus)")
+    print(f"  wall clock: {trim_total:.2f} s -> {vad_total:.2f} s ({1 - vad_total / trim_total:.0%} faster), "
+          f"local VAD cost included")
+
+
+if __name__ == "__main__":
+    main()
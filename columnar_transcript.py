@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Compact columnar representation of Speech-to-Text word timestamps
+One NumPy array per field, interned speaker IDs and one shared text buffer instead of a dict per token
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Token types returned by 11Labs Scribe; unknown types are interned after these
+WORD_TYPES = ("word", "spacing", "audio_event")
+
+NO_SPEAKER = -1
+
+
+def _optional(value: np.floating) -> Optional[float]:
+    """Turn the NaN placeholder for a missing value back into None"""
+    return None if np.isnan(value) else float(value)
+
+
+class ColumnarTranscript:
+    """Word timestamps stored as parallel arrays; filtered views share the text buffer"""
+
+    def __init__(self, text_buffer: str, text_start: np.ndarray, text_end: np.ndarray,
+                 start: np.ndarray, end: np.ndarray, type_codes: np.ndarray, types: Sequence[str],
+                 speaker_codes: np.ndarray, speakers: Sequence[str], logprob: np.ndarray):
+        """
+        Wrap existing columns (use from_words / from_response to build one)
+
+        Args:
+            text_buffer: Concatenated token text
+            text_start: Offset of each token's text in text_buffer
+            text_end: End offset of each token's text in text_buffer
+            start: Token start times in seconds (NaN if missing)
+            end: Token end times in seconds (NaN if missing)
+            type_codes: Index into types for each token
+            types: Interned token type names
+            speaker_codes: Index into speakers for each token, NO_SPEAKER if none
+            speakers: Interned speaker IDs
+            logprob: Token log probabilities (NaN if missing)
+        """
+        self.text_buffer = text_buffer
+        self.text_start = text_start
+        self.text_end = text_end
+        self.start = start
+        self.end = end
+        self.type_codes = type_codes
+        self.types = tuple(types)
+        self.speaker_codes = speaker_codes
+        self.speakers = tuple(speakers)
+        self.logprob = logprob
+
+    @classmethod
+    def from_words(cls, words: List[Dict[str, Any]]) -> "ColumnarTranscript":
+        """
+        Build a transcript from the API's list of word dicts
+
+        Args:
+            words: "words" entries of a speech_to_text response
+
+        Returns:
+            ColumnarTranscript: The same tokens in columnar form
+        """
+        count = len(words)
+        texts = [word.get("text", "") for word in words]
+        lengths = np.fromiter(map(len, texts), dtype=np.int32, count=count)
+        text_end = np.cumsum(lengths, dtype=np.int32)
+        text_start = text_end - lengths
+
+        nan = float("nan")
+        start = np.fromiter((word.get("start", nan) for word in words), dtype=np.float64, count=count)
+        end = np.fromiter((word.get("end", nan) for word in words), dtype=np.float64, count=count)
+        logprob = np.fromiter((word.get("logprob", nan) for word in words), dtype=np.float32, count=count)
+
+        type_index = {name: code for code, name in enumerate(WORD_TYPES)}
+        type_codes = np.fromiter(
+            (type_index.setdefault(word.get("type", "word"), len(type_index)) for word in words),
+            dtype=np.uint8, count=count)
+
+        speaker_index: Dict[str, int] = {}
+        speaker_codes = np.fromiter(
+            (NO_SPEAKER if word.get("speaker_id") is None
+             else speaker_index.setdefault(word["speaker_id"], len(speaker_index)) for word in words),
+            dtype=np.int16, count=count)
+
+        return cls("".join(texts), text_start, text_end,
+                   start, end, type_codes, list(type_index), speaker_codes, list(speaker_index), logprob)
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> "ColumnarTranscript":
+        """Build a transcript from a raw speech-to-text JSON response or a speech_to_text result"""
+        return cls.from_words(response.get("words", []))
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def text(self) -> str:
+        """Concatenated text of the tokens in this transcript"""
+        if len(self) and self.text_start[0] == 0 and self.text_end[-1] == len(self.text_buffer) \
+                and np.array_equal(self.text_start[1:], self.text_end[:-1]):
+            return self.text_buffer
+        return "".join(self.text_buffer[s:e] for s, e in zip(self.text_start.tolist(), self.text_end.tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and the text buffer"""
+        arrays = (self.text_start, self.text_end, self.start, self.end,
+                  self.type_codes, self.speaker_codes, self.logprob)
+        return sum(array.nbytes for array in arrays) + len(self.text_buffer.encode('utf-8'))
+
+    def word(self, index: int) -> Dict[str, Any]:
+        """Rebuild one token as the API's dict; missing times and logprob come back as None"""
+        entry = {
+            "text": self.text_buffer[self.text_start[index]:self.text_end[index]],
+            "start": _optional(self.start[index]),
+            "end": _optional(self.end[index]),
+            "type": self.types[self.type_codes[index]],
+            "speaker_id": None,
+            "logprob": _optional(self.logprob[index])
+        }
+        code = self.speaker_codes[index]
+        if code != NO_SPEAKER:
+            entry["speaker_id"] = self.speakers[code]
+        return entry
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Lazily rebuild the tokens as dicts, one at a time"""
+        for index in range(len(self)):
+            yield self.word(index)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rebuild the full list of word dicts, for callers that need the original format"""
+        return list(self.iter_dicts())
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray]) -> Union[Dict[str, Any], "ColumnarTranscript"]:
+        """Index for one token dict; slice or mask for a view that shares the text buffer"""
+        if isinstance(key, (int, np.integer)):
+            return self.word(key)
+        return ColumnarTranscript(
+            self.text_buffer, self.text_start[key], self.text_end[key], self.start[key], self.end[key],
+            self.type_codes[key], self.types, self.speaker_codes[key], self.speakers, self.logprob[key])
+
+    def index_at(self, seconds: float) -> int:
+        """
+        Find the token being spoken at a point in time, in O(log n)
+
+        Relies on tokens being ordered by start time, as the API returns them.
+
+        Args:
+            seconds: Time from the start of the recording
+
+        Returns:
+            int: Index of the token covering that time, or -1 if it falls in a gap
+        """
+        index = int(np.searchsorted(self.start, seconds, side='right')) - 1
+        if index < 0 or seconds >= self.end[index]:
+            return -1
+        return index
+
+    def word_at(self, seconds: float) -> Optional[Dict[str, Any]]:
+        """Token dict covering a point in time, or None"""
+        index = self.index_at(seconds)
+        return None if index < 0 else self.word(index)
+
+    def speaker_at(self, seconds: float) -> Optional[str]:
+        """Speaker talking at a point in time, or None during gaps and unattributed tokens"""
+        index = self.index_at(seconds)
+        if index < 0 or self.speaker_codes[index] == NO_SPEAKER:
+            return None
+        return self.speakers[self.speaker_codes[index]]
+
+    def type_mask(self, word_type: str) -> np.ndarray:
+        """Boolean mask of the tokens of one type"""
+        if word_type not in self.types:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_codes == self.types.index(word_type)
+
+    def speaker_mask(self, speaker_id: str) -> np.ndarray:
+        """Boolean mask of the tokens spoken by one speaker"""
+        if speaker_id not in self.speakers:
+            return np.zeros(len(self), dtype=bool)
+        return self.speaker_codes == self.speakers.index(speaker_id)
+
+    def filter(self, word_type: Optional[str] = None, speaker_id: Optional[str] = None) -> "ColumnarTranscript":
+        """
+        Select tokens by type and/or speaker
+
+        Args:
+            word_type: Keep only this token type ("word", "spacing", "audio_event")
+            speaker_id: Keep only this speaker's tokens
+
+        Returns:
+            ColumnarTranscript: View over the matching tokens
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if word_type is not None:
+            mask &= self.type_mask(word_type)
+        if speaker_id is not None:
+            mask &= self.speaker_mask(speaker_id)
+        return self[mask]
+
+    def words_only(self) -> "ColumnarTranscript":
+        """View without spacing tokens and audio events"""
+        return self.filter(word_type="word")
@@ -1,19 +1,46 @@
+import logging
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-class Config:
+
+class _EnvConfigMeta(type):
+    """Loads the .env file the first time an environment-backed setting is read"""
+
+    def __getattr__(cls, name):
+        if name in cls._ENV_SETTINGS:
+            cls.load()
+            return type.__getattribute__(cls, name)
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+
+class Config(metaclass=_EnvConfigMeta):
     """Configuration class for API settings"""
     
+    # Settings read from the environment (and the .env file) on first access,
+    # so importing this module stays cheap: name -> (parser, default)
+    _ENV_SETTINGS = {
+        # 11Labs API Configuration
+        'ELEVENLABS_API_KEY': (str, None),
+        'ELEVENLABS_POOL_SIZE': (int, 10),
+        'ELEVENLABS_CONNECT_TIMEOUT': (float, 10.0),
+        'ELEVENLABS_READ_TIMEOUT': (float, 60.0),
+        # Concurrent requests allowed by the 11Labs plan, and requests per second (0 = unlimited)
+        'ELEVENLABS_MAX_CONCURRENCY': (int, 4),
+        'ELEVENLABS_RATE_LIMIT': (float, 0.0),
+        # Retries for 429/5xx responses, and the circuit breaker's failure threshold and cool-down (seconds)
+        'ELEVENLABS_MAX_RETRIES': (int, 3),
+        'ELEVENLABS_CIRCUIT_THRESHOLD': (int, 5),
+        'ELEVENLABS_CIRCUIT_RESET': (float, 30.0),
+
+        # Google Gemini API Configuration
+        'GEMINI_API_KEY': (str, None),
+        'GEMINI_MODEL_POOL_SIZE': (int, 1),
+    }
+    
     # 11Labs API Configuration
-    ELEVENLABS_API_KEY = os.getenv('ELEVENLABS_API_KEY')
     ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
     
-    # Google Gemini API Configuration
-    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-    
     # Audio settings
     AUDIO_FORMAT = "mp3"
     AUDIO_QUALITY = "high"
@@ -21,6 +48,26 @@ class Config:
     # Speech-to-Text settings
     STT_MODEL = "scribe_v1"  # Default model for speech recognition (11Labs Scribe v1)
     
+    @classmethod
+    def load(cls):
+        """
+        Load environment variables from .env file and resolve the settings not set explicitly
+
+        A value that cannot be parsed only affects its own setting, which keeps its default.
+        """
+        from dotenv import load_dotenv
+        load_dotenv()
+
+        for name, (parse, default) in cls._ENV_SETTINGS.items():
+            if name in cls.__dict__:
+                continue
+            value = os.getenv(name)
+            try:
+                setattr(cls, name, default if value is None else parse(value))
+            except ValueError:
+                logger.warning("Ignoring %s=%r (not a valid %s); using %r", name, value, parse.__name__, default)
+                setattr(cls, name, default)
+    
     @classmethod
     def validate_config(cls):
         """Validate that required configuration is present"""
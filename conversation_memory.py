@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Token-budgeted conversation memory with rolling summarization
+Keeps prompt size flat across long sessions
+"""
+
+import re
+from typing import Callable, List, Optional
+
+# Rough characters-per-token ratio for English text
+CHARS_PER_TOKEN = 4
+
+# Tokens taken by the "User: " / "Assistant: " prefix and line break of each message
+MESSAGE_OVERHEAD_TOKENS = 3
+
+# Fixed text wrapped around the conversation in the context prompt
+CONTEXT_HEADER = "Previous conversation context:"
+SUMMARY_HEADER = "Summary of earlier conversation:"
+CONTEXT_FOOTER = "Please respond to the current message while considering the conversation context above."
+
+SENTENCE_END = re.compile(r'(?<=[.!?])\s')
+
+# Sentences that set a rule for the answers ("Answer in French.", "Never use bullet points.")
+INSTRUCTION = re.compile(
+    r"^(?:please|answer|respond|reply|write|use|keep|avoid|remember|always|never|only|don't|do not)\b"
+    r"|\b(?:must|should|always|never|don't|do not|make sure|no more than|at most|at least)\b",
+    re.IGNORECASE
+)
+
+# Longest piece of a single sentence kept in the summary
+MAX_SENTENCE_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for budgeting (no tokenizer round trip)"""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+# Budget reserved for the headers plus the "Current user message: " label
+CONTEXT_WRAPPER_TOKENS = estimate_tokens(CONTEXT_HEADER + SUMMARY_HEADER + CONTEXT_FOOTER) + 8
+
+
+def extractive_summarizer(summary: str, messages: List[dict], max_tokens: int = 300) -> str:
+    """
+    Fold older messages into the running summary without calling the model
+
+    Keeps the first sentence of every user turn, since that is where goals are
+    usually stated ("protect 8 hours of sleep"), plus any later sentence that
+    reads as an instruction ("Answer in French."). When the summary outgrows its
+    budget, the opening line is kept and the oldest of the remaining lines are
+    dropped.
+
+    Args:
+        summary: Current running summary
+        messages: Messages being removed from the live history, oldest first
+        max_tokens: Token budget for the summary
+
+    Returns:
+        str: Updated summary
+    """
+    lines = summary.split("\n") if summary else []
+    for msg in messages:
+        if msg["role"] != "user":
+            continue
+        sentences = [sentence.strip() for sentence in SENTENCE_END.split(msg["content"].strip())]
+        kept = sentences[:1] + [sentence for sentence in sentences[1:] if INSTRUCTION.search(sentence)]
+        kept = [sentence[:MAX_SENTENCE_CHARS] for sentence in kept if sentence]
+        if kept:
+            lines.append(f"- User said: {' '.join(kept)}")
+
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        del lines[1]
+
+    return "\n".join(lines)
+
+
+class ConversationMemory:
+    """Bounded conversation history with a token-budgeted context builder"""
+
+    def __init__(self, token_budget: int = 2000, summary_budget: Optional[int] = None,
+                 max_messages: int = 100, min_recent: int = 2,
+                 summarizer: Optional[Callable[[str, List[dict]], str]] = None):
+        """
+        Initialize conversation memory
+
+        Args:
+            token_budget: Approximate token budget for the whole context prompt
+            summary_budget: Part of the budget reserved for the running summary (default: a quarter)
+            max_messages: Hard cap on messages kept verbatim
+            min_recent: Number of newest messages never folded into the summary
+            summarizer: Callable (summary, messages) -> summary. Defaults to extractive_summarizer
+        """
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget if summary_budget is not None else token_budget // 4
+        self.max_messages = max_messages
+        self.min_recent = min_recent
+        self.summarizer = summarizer or (
+            lambda summary, messages: extractive_summarizer(summary, messages, self.summary_budget)
+        )
+
+        self.summary = ""
+        self._messages: List[dict] = []
+        self._token_counts: List[int] = []
+        self._message_tokens = 0
+
+    @property
+    def messages(self) -> List[dict]:
+        """Messages currently kept verbatim, oldest first"""
+        return list(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def add(self, role: str, content: str):
+        """
+        Append a message and fold older turns into the summary if over budget
+
+        Args:
+            role: 'user' or 'assistant'
+            content: Message text
+        """
+        tokens = estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+        self._messages.append({"role": role, "content": content})
+        self._token_counts.append(tokens)
+        self._message_tokens += tokens
+        self._compact()
+
+    def clear(self):
+        """Forget every message and the running summary"""
+        self.summary = ""
+        self._messages = []
+        self._token_counts = []
+        self._message_tokens = 0
+
+    def token_count(self) -> int:
+        """Estimated tokens held in the summary and verbatim messages"""
+        summary_tokens = estimate_tokens(self.summary) if self.summary else 0
+        return summary_tokens + self._message_tokens
+
+    def _compact(self):
+        """Move the oldest messages into the summary until the budget holds"""
+        message_budget = self.token_budget - self.summary_budget - CONTEXT_WRAPPER_TOKENS
+        folded = 0
+        while len(self._messages) - folded > self.min_recent and (
+                self._message_tokens > message_budget
+                or len(self._messages) - folded > self.max_messages):
+            self._message_tokens -= self._token_counts[folded]
+            folded += 1
+
+        if not folded:
+            return
+
+        evicted = self._messages[:folded]
+        del self._messages[:folded]
+        del self._token_counts[:folded]
+
+        # Only the evicted turns are summarized; the existing summary is reused
+        self.summary = self.summarizer(self.summary, evicted)
+
+    def build_context_prompt(self) -> str:
+        """
+        Build a context-aware prompt ending with the newest user message
+
+        Returns:
+            str: Prompt including the running summary and recent conversation
+        """
+        if not self._messages:
+            return ""
+
+        current = self._messages[-1]["content"]
+        earlier = self._messages[:-1]
+
+        if not earlier and not self.summary:
+            # First exchange, just return the current user input
+            return current
+
+        parts = [CONTEXT_HEADER]
+        if self.summary:
+            parts.append(f"{SUMMARY_HEADER}\n{self.summary}")
+        for msg in earlier:
+            role = "User" if msg["role"] == "user" else "Assistant"
+            parts.append(f"{role}: {msg['content']}")
+
+        parts.append(f"\nCurrent user message: {current}")
+        parts.append(CONTEXT_FOOTER)
+
+        return "\n".join(parts)
@@ -4,20 +4,42 @@ Complete 11Labs Audio Service - Speech-to-Text and Text-to-Speech
 Combines both STT and TTS capabilities in one service
 """
 
-import requests
 import os
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from dotenv import load_dotenv
+import numpy as np
+from audio_preprocessing import precondition_file, remap_timestamps
+from columnar_transcript import ColumnarTranscript
+from elevenlabs_streaming import STREAM_CHUNK_SIZE, AudioStream, deliver_audio_stream, open_audio_stream
+from elevenlabs_transport import ElevenLabsTransport, get_transport, request_failure
+from parallel_tts import MAX_CHUNK_CHARS, ParallelTTS
+from stage_pipeline import Stage, run_pipeline
+from tts_cache import TTSCache
+
+# MIME types for uploads, by file extension
+AUDIO_CONTENT_TYPES = {
+    '.m4a': 'audio/mp4',
+    '.mp4': 'audio/mp4',
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.flac': 'audio/flac',
+    '.ogg': 'audio/ogg',
+    '.opus': 'audio/ogg',
+    '.webm': 'audio/webm',
+}
 
 class ElevenLabsAudioService:
     """Complete audio service with both STT and TTS capabilities"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, transport: Optional[ElevenLabsTransport] = None,
+                 cache: Optional[TTSCache] = None):
         """
         Initialize the 11Labs Audio Service
         
         Args:
             api_key: 11Labs API key. If not provided, will use from environment
+            transport: HTTP transport to use. Defaults to the shared pooled transport
+            cache: TTSCache placed in front of text_to_speech (optional)
         """
         load_dotenv()
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
@@ -26,6 +48,8 @@ class ElevenLabsAudioService:
             raise ValueError("11Labs API key is required. Please set ELEVENLABS_API_KEY in your .env file.")
         
         self.base_url = "https://api.elevenlabs.io/v1"
+        self.transport = transport or get_transport()
+        self.cache = cache
     
     def speech_to_text(self, audio_file_path: str, **kwargs) -> Dict[str, Any]:
         """
@@ -33,7 +57,12 @@ class ElevenLabsAudioService:
         
         Args:
             audio_file_path: Path to the audio file
-            **kwargs: Additional parameters (model_id, language_code, diarize, etc.)
+            **kwargs: Additional parameters (model_id, language_code, diarize, precondition, etc.)
+            
+        With precondition=True (or a dict of precondition_samples options) the audio is
+        downmixed, resampled, trimmed and re-encoded locally before upload; with
+        precondition={"vad": True} only the voiced regions are uploaded. Word timestamps
+        still refer to the original file, and the result gains a "preconditioning" report.
             
         Returns:
             Dictionary containing the transcribed text and metadata
@@ -41,6 +70,63 @@ class ElevenLabsAudioService:
         if not os.path.exists(audio_file_path):
             return {"success": False, "error": f"File not found: {audio_file_path}"}
         
+        precondition = kwargs.pop('precondition', False)
+        if precondition:
+            return self._speech_to_text_preconditioned(
+                audio_file_path, precondition if isinstance(precondition, dict) else {}, **kwargs)
+        
+        extension = os.path.splitext(audio_file_path)[1].lower()
+        content_type = AUDIO_CONTENT_TYPES.get(extension, 'application/octet-stream')
+        try:
+            with open(audio_file_path, 'rb') as audio_file:
+                return self.speech_to_text_data(audio_file, os.path.basename(audio_file_path),
+                                                content_type, **kwargs)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def _speech_to_text_preconditioned(self, audio_file_path: str, options: Dict[str, Any],
+                                       **kwargs) -> Dict[str, Any]:
+        """Precondition the file locally, upload the compact version and map timestamps back"""
+        try:
+            processed = precondition_file(audio_file_path, **options)
+        except Exception as e:
+            return {"success": False, "error": f"Could not precondition audio: {e}"}
+        
+        name = os.path.splitext(os.path.basename(audio_file_path))[0] + processed["extension"]
+        result = self.speech_to_text_data(processed.pop("data"), name, processed["content_type"], **kwargs)
+        segments = processed["segments"]
+        unchanged = len(segments) == 1 and segments[0][1] == 0
+        if result["success"] and not unchanged and "transcript" in result:
+            result["transcript"].start = remap_timestamps(result["transcript"].start, segments)
+            result["transcript"].end = remap_timestamps(result["transcript"].end, segments)
+        elif result["success"] and not unchanged:
+            # Words are shared with raw_response, so remapping them in place fixes both
+            for key in ("start", "end"):
+                timed = [word for word in result["words"] if word.get(key) is not None]
+                times = remap_timestamps(np.array([word[key] for word in timed], dtype=np.float64), segments)
+                for word, seconds in zip(timed, times.tolist()):
+                    word[key] = round(seconds, 3)
+        result["preconditioning"] = processed
+        return result
+    
+    def speech_to_text_data(self, audio, filename: str, content_type: str = 'audio/mp4',
+                            **kwargs) -> Dict[str, Any]:
+        """
+        Convert in-memory audio to text using 11Labs Speech-to-Text API
+        
+        Args:
+            audio: Audio bytes or a readable binary file object
+            filename: File name reported to the API
+            content_type: MIME type of the audio
+            **kwargs: Additional parameters (model_id, language_code, diarize, lean, columnar, etc.)
+            
+        With lean=True the raw_response duplicate of the parsed fields is left out. With
+        columnar=True the words come back as a ColumnarTranscript under "transcript" instead
+        of a list of dicts (and without raw_response).
+            
+        Returns:
+            Dictionary containing the transcribed text and metadata
+        """
         url = f"{self.base_url}/speech-to-text"
         headers = {"xi-api-key": self.api_key}
         
@@ -53,31 +139,37 @@ class ElevenLabsAudioService:
         }
         
         try:
-            with open(audio_file_path, 'rb') as audio_file:
-                files = {'file': (os.path.basename(audio_file_path), audio_file, 'audio/mp4')}
-                
-                response = requests.post(url, headers=headers, files=files, data=params, timeout=60)
+            files = {'file': (filename, audio, content_type)}
+            
+            response = self.transport.post(url, headers=headers, files=files, data=params)
+            
+            if response.status_code == 200:
+                result = response.json()
+                transcript = {
+                    "success": True,
+                    "text": result.get("text", ""),
+                    "language": result.get("language_code", "unknown"),
+                    "confidence": result.get("language_probability", 0.0),
+                    "words": result.get("words", []),
+                    "transcription_id": result.get("transcription_id", ""),
+                }
+                if kwargs.get('columnar', False):
+                    # Only the arrays are kept; the word dicts are rebuilt on demand
+                    transcript["transcript"] = ColumnarTranscript.from_words(transcript.pop("words"))
+                elif not kwargs.get('lean', False):
+                    # The raw response repeats every field above; lean results keep one copy
+                    transcript["raw_response"] = result
+                return transcript
+            else:
+                return {
+                    "success": False,
+                    "error": f"API error: {response.status_code}",
+                    "status_code": response.status_code,
+                    "response": response.text
+                }
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    return {
-                        "success": True,
-                        "text": result.get("text", ""),
-                        "language": result.get("language_code", "unknown"),
-                        "confidence": result.get("language_probability", 0.0),
-                        "words": result.get("words", []),
-                        "transcription_id": result.get("transcription_id", ""),
-                        "raw_response": result
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"API error: {response.status_code}",
-                        "response": response.text
-                    }
-                    
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return request_failure(e)
     
     def text_to_speech(self, text: str, **kwargs) -> Dict[str, Any]:
         """
@@ -85,13 +177,19 @@ class ElevenLabsAudioService:
         
         Args:
             text: Text to convert to speech
-            **kwargs: Additional parameters (voice_id, model_id, output_format, etc.)
+            **kwargs: Additional parameters (voice_id, model_id, output_format, save_to_file, filename, lean)
+            
+        With lean=True memory stays flat: a saved clip is streamed straight to the file and
+        left out of the result, and an unsaved one comes back as a read-only memoryview.
             
         Returns:
             Dictionary containing the audio data and metadata
         """
         # Default parameters
         voice_id = kwargs.get('voice_id', 'JBFqnCBsd6RMkjVDRZzb')
+        lean = kwargs.get('lean', False)
+        save_to_file = kwargs.get('save_to_file', False)
+        filename = kwargs.get('filename', f"tts_output_{voice_id}.mp3") if save_to_file else None
         
         url = f"{self.base_url}/text-to-speech/{voice_id}"
         headers = {
@@ -99,45 +197,173 @@ class ElevenLabsAudioService:
             "Content-Type": "application/json"
         }
         model_id = kwargs.get('model_id', 'eleven_multilingual_v2')
+        output_format = kwargs.get('output_format', 'mp3_44100_128')
         
         data = {
             "text": text,
             "model_id": model_id,
-            "output_format": kwargs.get('output_format', 'mp3_44100_128')
+            "output_format": output_format
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            # Nothing to cache, so the body can go straight to disk without being held in memory
+            if lean and save_to_file and self.cache is None:
+                stream = open_audio_stream(self.transport, url, headers, data)
+                metrics = deliver_audio_stream(stream, filename=filename)
+                return {
+                    "success": True,
+                    "text": text,
+                    "voice_id": voice_id,
+                    "model_id": model_id,
+                    "audio_size": metrics["audio_size"],
+                    "saved_file": filename,
+                    "cached": False
+                }
             
-            if response.status_code == 200:
-                audio_data = response.content
-                
+            cache_key = None
+            audio_data = None
+            response = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(text, voice_id, model_id, output_format)
+                audio_data = self.cache.get(cache_key)
+            
+            if audio_data is None:
+                response = self.transport.post(url, headers=headers, json=data)
+                if response.status_code == 200:
+                    audio_data = response.content
+                    if cache_key is not None:
+                        self.cache.put(cache_key, audio_data)
+            
+            if audio_data is not None:
                 result = {
                     "success": True,
                     "text": text,
                     "voice_id": voice_id,
                     "model_id": model_id,
                     "audio_data": audio_data,
-                    "audio_size": len(audio_data)
+                    "audio_size": len(audio_data),
+                    "cached": response is None
                 }
                 
                 # Save to file if requested
-                if kwargs.get('save_to_file', False):
-                    filename = kwargs.get('filename', f"tts_output_{voice_id}.mp3")
+                if save_to_file:
                     with open(filename, 'wb') as f:
                         f.write(audio_data)
                     result["saved_file"] = filename
                 
+                if lean:
+                    if save_to_file:
+                        del result["audio_data"]
+                    else:
+                        result["audio_data"] = memoryview(audio_data)
+                
                 return result
             else:
                 return {
                     "success": False,
                     "error": f"API error: {response.status_code}",
+                    "status_code": response.status_code,
                     "response": response.text
                 }
                 
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return request_failure(e)
+    
+    def iter_text_to_speech(self, text: str, **kwargs) -> AudioStream:
+        """
+        Start a streaming text-to-speech request and iterate over the audio as it arrives
+        
+        Args:
+            text: Text to convert to speech
+            **kwargs: Additional parameters (voice_id, model_id, output_format, chunk_size)
+            
+        Returns:
+            AudioStream yielding audio chunks; its metrics() report time to first byte and total time
+            
+        Raises:
+            requests.HTTPError: If the API rejects the request
+        """
+        voice_id = kwargs.get('voice_id', 'JBFqnCBsd6RMkjVDRZzb')
+        
+        url = f"{self.base_url}/text-to-speech/{voice_id}/stream"
+        headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "text": text,
+            "model_id": kwargs.get('model_id', 'eleven_multilingual_v2'),
+            "output_format": kwargs.get('output_format', 'mp3_44100_128')
+        }
+        
+        return open_audio_stream(self.transport, url, headers, data, kwargs.get('chunk_size', STREAM_CHUNK_SIZE))
+    
+    def stream_text_to_speech(self, text: str, on_chunk: Optional[Callable[[bytes], None]] = None,
+                              **kwargs) -> Dict[str, Any]:
+        """
+        Convert text to speech, handing audio chunks on as they arrive
+        
+        The clip is never held in memory as a whole; deliver it through on_chunk,
+        a file (save_to_file/filename), or both.
+        
+        Args:
+            text: Text to convert to speech
+            on_chunk: Called with every audio chunk as it arrives
+            **kwargs: Additional parameters (voice_id, model_id, output_format, chunk_size, save_to_file, filename)
+            
+        Returns:
+            Dictionary containing the stream metrics (time_to_first_byte, total_time, audio_size) and metadata
+        """
+        voice_id = kwargs.get('voice_id', 'JBFqnCBsd6RMkjVDRZzb')
+        filename = None
+        if kwargs.get('save_to_file', False):
+            filename = kwargs.get('filename', f"tts_output_{voice_id}.mp3")
+        
+        try:
+            stream = self.iter_text_to_speech(text, **kwargs)
+            metrics = deliver_audio_stream(stream, on_chunk, filename)
+        except Exception as e:
+            return request_failure(e)
+        
+        return {
+            "success": True,
+            "text": text,
+            "voice_id": voice_id,
+            "model_id": kwargs.get('model_id', 'eleven_multilingual_v2'),
+            **metrics
+        }
+    
+    def text_to_speech_chunked(self, text: str, on_chunk: Optional[Callable[[bytes], None]] = None,
+                               max_workers: int = 4, max_chars: int = MAX_CHUNK_CHARS,
+                               **kwargs) -> Dict[str, Any]:
+        """
+        Convert a long text to speech sentence by sentence, synthesizing chunks in parallel
+        
+        Audio is delivered in reading order as soon as the head chunk is ready, so the
+        first sentence can play while the rest is still being synthesized.
+        
+        Args:
+            text: Text to convert to speech
+            on_chunk: Called with each chunk's audio, in order
+            max_workers: Chunks synthesized at the same time
+            max_chars: Longest chunk sent in one request
+            **kwargs: Additional parameters (voice_id, model_id, output_format, save_to_file, filename)
+            
+        Returns:
+            Dictionary containing chunk count, audio size, time_to_first_audio and total_time
+        """
+        voice_id = kwargs.get('voice_id', 'JBFqnCBsd6RMkjVDRZzb')
+        filename = None
+        if kwargs.pop('save_to_file', False):
+            filename = kwargs.get('filename', f"tts_output_{voice_id}.mp3")
+        kwargs.pop('filename', None)
+        
+        pipeline = ParallelTTS(lambda chunk: self.text_to_speech(chunk, **kwargs), max_workers, max_chars)
+        result = pipeline.run(text, on_chunk, filename)
+        if result["success"]:
+            result["voice_id"] = voice_id
+        return result
     
     def transcribe_and_speak(self, audio_file_path: str, **kwargs) -> Dict[str, Any]:
         """
@@ -193,11 +419,76 @@ class ElevenLabsAudioService:
             "tts_result": tts_result
         }
     
+    def transcribe_and_speak_many(self, audio_file_paths: List[str], stt_workers: int = 4,
+                                  tts_workers: int = 4, queue_size: int = 8,
+                                  output_dir: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe-and-speak workflow for many files, with STT and TTS running as overlapping stages
+        
+        While one file is being synthesized, the next ones are already being transcribed.
+        The queue between the stages is bounded, so fast transcription waits for synthesis
+        instead of piling up transcripts in memory.
+        
+        Args:
+            audio_file_paths: Paths of the audio files
+            stt_workers: Files transcribed at the same time
+            tts_workers: Transcripts synthesized at the same time
+            queue_size: Jobs allowed to wait between stages
+            output_dir: Directory for the processed_<name>.mp3 files. Defaults to the current directory
+            **kwargs: Additional parameters for both STT and TTS
+            
+        Returns:
+            Dictionary containing the per-file results in input order plus throughput and
+            utilization for each stage
+        """
+        def transcribe(job):
+            stt_result = self.speech_to_text(job["original_audio"], **kwargs)
+            job["stt_result"] = stt_result
+            if not stt_result["success"]:
+                job["success"] = False
+                job["error"] = f"STT failed: {stt_result['error']}"
+            else:
+                job["transcribed_text"] = stt_result["text"]
+            return job
+        
+        def speak(job):
+            filename = f"processed_{os.path.basename(job['original_audio'])}.mp3"
+            tts_result = self.text_to_speech(
+                job["transcribed_text"],
+                save_to_file=True,
+                filename=os.path.join(output_dir, filename) if output_dir else filename,
+                **kwargs
+            )
+            job["tts_result"] = tts_result
+            if not tts_result["success"]:
+                job["success"] = False
+                job["error"] = f"TTS failed: {tts_result['error']}"
+            else:
+                job["success"] = True
+                job["processed_audio"] = tts_result.get("saved_file")
+            return job
+        
+        stages = [Stage("stt", transcribe, stt_workers), Stage("tts", speak, tts_workers)]
+        jobs = ({"original_audio": path} for path in audio_file_paths)
+        results, wall_time = run_pipeline(jobs, stages, queue_size)
+        
+        successful = sum(1 for result in results if result["success"])
+        return {
+            "success": successful == len(results),
+            "total_files": len(results),
+            "successful": successful,
+            "failed": len(results) - successful,
+            "results": results,
+            "total_time": wall_time,
+            "throughput": len(results) / wall_time if wall_time else 0.0,
+            "stages": {stage.name: stage.stats(wall_time) for stage in stages}
+        }
+    
     def get_service_info(self) -> Dict[str, Any]:
         """Get information about the service"""
         return {
             "service": "11Labs Complete Audio Service",
-            "capabilities": ["Speech-to-Text", "Text-to-Speech", "Transcribe-and-Speak"],
+            "capabilities": ["Speech-to-Text", "Text-to-Speech", "Streaming Text-to-Speech", "Chunked Text-to-Speech", "Transcribe-and-Speak"],
             "api_key_configured": bool(self.api_key),
             "base_url": self.base_url
         }
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Streaming audio delivery for the 11Labs Text-to-Speech API
+Audio chunks are handed on as they arrive, so playback can start before synthesis finishes
+"""
+
+import mmap
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import requests
+
+from elevenlabs_transport import ElevenLabsTransport
+
+# Bytes read from the socket per chunk; small enough to start playback early
+STREAM_CHUNK_SIZE = 4096
+
+
+class AudioStream:
+    """Iterator over the audio chunks of a streaming TTS response, with timing metrics"""
+
+    def __init__(self, response: requests.Response, started: float, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        Wrap an open streaming response
+
+        Args:
+            response: Response opened with stream=True
+            started: time.perf_counter() value taken just before the request was sent
+            chunk_size: Bytes per chunk read from the connection
+        """
+        self.response = response
+        self.started = started
+        self.chunk_size = chunk_size
+        self.first_byte_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.bytes_received = 0
+        self.chunk_count = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self.response.iter_content(chunk_size=self.chunk_size):
+                if not chunk:
+                    continue
+                if self.first_byte_at is None:
+                    self.first_byte_at = time.perf_counter()
+                self.bytes_received += len(chunk)
+                self.chunk_count += 1
+                yield chunk
+            self.finished_at = time.perf_counter()
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the connection back to the pool"""
+        self.response.close()
+
+    def __enter__(self) -> "AudioStream":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """Seconds from sending the request to the first audio byte"""
+        return None if self.first_byte_at is None else self.first_byte_at - self.started
+
+    @property
+    def total_time(self) -> Optional[float]:
+        """Seconds from sending the request to the last audio byte"""
+        return None if self.finished_at is None else self.finished_at - self.started
+
+    def metrics(self) -> Dict[str, Any]:
+        """Timing and size of the stream so far"""
+        return {
+            "time_to_first_byte": self.time_to_first_byte,
+            "total_time": self.total_time,
+            "audio_size": self.bytes_received,
+            "chunk_count": self.chunk_count
+        }
+
+
+def open_audio_stream(transport: ElevenLabsTransport, url: str, headers: Dict[str, str],
+                      data: Dict[str, Any], chunk_size: int = STREAM_CHUNK_SIZE) -> AudioStream:
+    """
+    Send a streaming TTS request
+
+    Args:
+        transport: HTTP transport to send the request on
+        url: Text-to-speech endpoint URL (streaming or not)
+        headers: Request headers
+        data: JSON request body
+        chunk_size: Bytes per chunk read from the connection
+
+    Returns:
+        AudioStream: Stream over the response body
+
+    Raises:
+        requests.HTTPError: If the API answers with a non-200 status
+    """
+    started = time.perf_counter()
+    response = transport.post(url, headers=headers, json=data, stream=True)
+
+    if response.status_code != 200:
+        body = response.text
+        response.close()
+        raise requests.HTTPError(f"API error: {response.status_code}: {body}", response=response)
+
+    return AudioStream(response, started, chunk_size)
+
+
+def deliver_audio_stream(stream: AudioStream, on_chunk: Optional[Callable[[bytes], None]] = None,
+                         filename: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Drain a stream into a callback and/or a file without holding the whole clip in memory
+
+    The file is written to a .part sibling and renamed once complete, so readers
+    never see a truncated clip.
+
+    Args:
+        stream: Stream to drain
+        on_chunk: Called with every chunk as it arrives
+        filename: File to write the audio to
+
+    Returns:
+        Dictionary containing the stream metrics and the saved file, if any
+    """
+    partial = f"{filename}.part" if filename else None
+    sink = open(partial, 'wb') if partial else None
+
+    try:
+        for chunk in stream:
+            if sink:
+                sink.write(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+    except BaseException:
+        if sink:
+            sink.close()
+            os.remove(partial)
+        raise
+
+    result = stream.metrics()
+    if sink:
+        sink.close()
+        os.replace(partial, filename)
+        result["saved_file"] = filename
+        result["file_size"] = os.path.getsize(filename)
+    return result
+
+
+def audio_view(path: str) -> memoryview:
+    """
+    Zero-copy, read-only view of a saved audio file
+
+    The file is memory-mapped, so slicing the view reads only the pages touched.
+    Release the view (view.release()) before deleting or rewriting the file.
+
+    Args:
+        path: Audio file, e.g. the saved_file of a lean text_to_speech result
+
+    Returns:
+        memoryview: View over the file contents
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
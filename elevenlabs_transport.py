@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for the 11Labs API
+Pooled keep-alive connections reused by every ElevenLabs client in the process
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import Config
+from rate_limiter import TokenBucket
+from resilience import CONNECTION_ERRORS, CircuitBreaker, Resilience
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+def request_failure(error: Exception) -> Dict[str, Any]:
+    """
+    Build the failed-result dict for an exception raised while calling the API
+
+    HTTP errors carry the response's status_code, like results built from a response.
+    Connection failures and timeouts are marked transient, so callers know a retry may help.
+
+    Args:
+        error: The exception raised
+
+    Returns:
+        Dictionary with success False and the error message
+    """
+    result = {"success": False, "error": str(error)}
+    response = getattr(error, "response", None)
+    if response is not None:
+        result["status_code"] = response.status_code
+    if isinstance(error, CONNECTION_ERRORS):
+        result["transient"] = True
+    return result
+
+
+class ElevenLabsTransport:
+    """Thread-safe, connection-pooling HTTP transport"""
+
+    def __init__(self, pool_maxsize: int = 10, pool_connections: int = 4,
+                 connect_timeout: float = 10.0, read_timeout: float = 60.0,
+                 pool_block: bool = True, resilience: Optional[Resilience] = None):
+        """
+        Initialize the transport
+
+        Args:
+            pool_maxsize: Keep-alive connections kept per host
+            pool_connections: Number of hosts with their own pool
+            connect_timeout: Seconds allowed to establish a connection
+            read_timeout: Seconds allowed between bytes of the response
+            pool_block: Wait for a free connection instead of opening extra ones past pool_maxsize
+            resilience: Rate limiting, retry and circuit-breaker policy applied to every request (optional)
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.resilience = resilience
+
+        # The adapter owns the urllib3 pool, which is thread-safe and shared by all threads
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+
+        # Sessions keep per-thread state (cookies), so each thread gets its own
+        self._local = threading.local()
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Default (connect, read) timeout"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """
+        Send a request over a pooled connection
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Seconds, or a (connect, read) tuple. Defaults to the transport timeouts
+            **kwargs: Passed through to requests (headers, json, data, files, stream, ...)
+
+        Returns:
+            requests.Response: The response
+            
+        Raises:
+            CircuitOpenError: If the resilience layer's circuit is open
+        """
+        session = self._session()
+        timeout = timeout or self.timeout
+        if self.resilience is None:
+            return session.request(method, url, timeout=timeout, **kwargs)
+
+        files = kwargs.get("files")
+
+        def attempt():
+            # File objects were read by the previous attempt; upload them again from the start
+            if files:
+                for value in files.values():
+                    handle = value[1] if isinstance(value, tuple) else value
+                    if hasattr(handle, "seek"):
+                        handle.seek(0)
+            return session.request(method, url, timeout=timeout, **kwargs)
+
+        return self.resilience.send(attempt)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request"""
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Close every pooled connection"""
+        self.adapter.close()
+
+
+_transport: Optional[ElevenLabsTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> ElevenLabsTransport:
+    """Return the process-wide transport, configured from Config"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                rate = Config.ELEVENLABS_RATE_LIMIT
+                resilience = Resilience(
+                    rate_limiter=TokenBucket(rate) if rate else None,
+                    max_concurrency=Config.ELEVENLABS_MAX_CONCURRENCY,
+                    max_retries=Config.ELEVENLABS_MAX_RETRIES,
+                    breaker=CircuitBreaker(
+                        failure_threshold=Config.ELEVENLABS_CIRCUIT_THRESHOLD,
+                        reset_timeout=Config.ELEVENLABS_CIRCUIT_RESET
+                    )
+                )
+                _transport = ElevenLabsTransport(
+                    pool_maxsize=Config.ELEVENLABS_POOL_SIZE,
+                    connect_timeout=Config.ELEVENLABS_CONNECT_TIMEOUT,
+                    read_timeout=Config.ELEVENLABS_READ_TIMEOUT,
+                    resilience=resilience
+                )
+    return _transport
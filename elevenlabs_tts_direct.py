@@ -4,20 +4,25 @@
 Avoids SDK installation issues on Windows
 """
 
-import requests
 import os
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from dotenv import load_dotenv
+from elevenlabs_streaming import STREAM_CHUNK_SIZE, AudioStream, deliver_audio_stream, open_audio_stream
+from elevenlabs_transport import ElevenLabsTransport, get_transport, request_failure
+from tts_cache import TTSCache
 
 class ElevenLabsTTSDirect:
     """11Labs Text-to-Speech using direct HTTP requests"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, transport: Optional[ElevenLabsTransport] = None,
+                 cache: Optional[TTSCache] = None):
         """
         Initialize the 11Labs TTS client
         
         Args:
             api_key: 11Labs API key. If not provided, will use from environment
+            transport: HTTP transport to use. Defaults to the shared pooled transport
+            cache: TTSCache placed in front of text_to_speech (optional)
         """
         load_dotenv()
         self.api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
@@ -26,12 +31,15 @@ class ElevenLabsTTSDirect:
             raise ValueError("11Labs API key is required. Please set ELEVENLABS_API_KEY in your .env file.")
         
         self.base_url = "https://api.elevenlabs.io/v1"
+        self.transport = transport or get_transport()
+        self.cache = cache
     
     def text_to_speech(self, text: str, voice_id: str = "JBFqnCBsd6RMkjVDRZzb", 
                       model_id: str = "eleven_multilingual_v2",
                       output_format: str = "mp3_44100_128",
                       save_to_file: bool = False, 
-                      filename: Optional[str] = None) -> Dict[str, Any]:
+                      filename: Optional[str] = None,
+                      lean: bool = False) -> Dict[str, Any]:
         """
         Convert text to speech using 11Labs Text-to-Speech API
         
@@ -42,6 +50,8 @@ class ElevenLabsTTSDirect:
             output_format: Output format
             save_to_file: Whether to save audio to file
             filename: Custom filename for saved audio
+            lean: Keep memory flat: with save_to_file the audio is streamed to the file and left
+                out of the result; otherwise audio_data is a read-only memoryview
             
         Returns:
             Dictionary containing the audio data and metadata
@@ -58,12 +68,41 @@ class ElevenLabsTTSDirect:
             "output_format": output_format
         }
         
+        if save_to_file and not filename:
+            filename = f"tts_output_{voice_id}_{model_id}.mp3"
+        
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            # Nothing to cache, so the body can go straight to disk without being held in memory
+            if lean and save_to_file and self.cache is None:
+                stream = open_audio_stream(self.transport, url, headers, data)
+                metrics = deliver_audio_stream(stream, filename=filename)
+                return {
+                    "success": True,
+                    "text": text,
+                    "voice_id": voice_id,
+                    "model_id": model_id,
+                    "output_format": output_format,
+                    "audio_size": metrics["audio_size"],
+                    "saved_file": filename,
+                    "file_size": metrics["file_size"],
+                    "cached": False
+                }
             
-            if response.status_code == 200:
-                audio_data = response.content
-                
+            cache_key = None
+            audio_data = None
+            response = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(text, voice_id, model_id, output_format)
+                audio_data = self.cache.get(cache_key)
+            
+            if audio_data is None:
+                response = self.transport.post(url, headers=headers, json=data)
+                if response.status_code == 200:
+                    audio_data = response.content
+                    if cache_key is not None:
+                        self.cache.put(cache_key, audio_data)
+            
+            if audio_data is not None:
                 result = {
                     "success": True,
                     "text": text,
@@ -71,30 +110,113 @@ class ElevenLabsTTSDirect:
                     "model_id": model_id,
                     "output_format": output_format,
                     "audio_data": audio_data,
-                    "audio_size": len(audio_data)
+                    "audio_size": len(audio_data),
+                    "cached": response is None
                 }
                 
                 # Save to file if requested
                 if save_to_file:
-                    if not filename:
-                        filename = f"tts_output_{voice_id}_{model_id}.mp3"
-                    
                     with open(filename, 'wb') as f:
                         f.write(audio_data)
                     
                     result["saved_file"] = filename
                     result["file_size"] = os.path.getsize(filename)
                 
+                if lean:
+                    if save_to_file:
+                        del result["audio_data"]
+                    else:
+                        result["audio_data"] = memoryview(audio_data)
+                
                 return result
             else:
                 return {
                     "success": False,
                     "error": f"API error: {response.status_code}",
+                    "status_code": response.status_code,
                     "response": response.text
                 }
                 
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return request_failure(e)
+    
+    def iter_text_to_speech(self, text: str, voice_id: str = "JBFqnCBsd6RMkjVDRZzb",
+                            model_id: str = "eleven_multilingual_v2",
+                            output_format: str = "mp3_44100_128",
+                            chunk_size: int = STREAM_CHUNK_SIZE) -> AudioStream:
+        """
+        Start a streaming text-to-speech request and iterate over the audio as it arrives
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID to use
+            model_id: Model to use
+            output_format: Output format
+            chunk_size: Bytes per audio chunk
+            
+        Returns:
+            AudioStream yielding audio chunks; its metrics() report time to first byte and total time
+            
+        Raises:
+            requests.HTTPError: If the API rejects the request
+        """
+        url = f"{self.base_url}/text-to-speech/{voice_id}/stream"
+        headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "text": text,
+            "model_id": model_id,
+            "output_format": output_format
+        }
+        
+        return open_audio_stream(self.transport, url, headers, data, chunk_size)
+    
+    def stream_text_to_speech(self, text: str, voice_id: str = "JBFqnCBsd6RMkjVDRZzb",
+                              model_id: str = "eleven_multilingual_v2",
+                              output_format: str = "mp3_44100_128",
+                              on_chunk: Optional[Callable[[bytes], None]] = None,
+                              save_to_file: bool = False,
+                              filename: Optional[str] = None,
+                              chunk_size: int = STREAM_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Convert text to speech, handing audio chunks on as they arrive
+        
+        The clip is never held in memory as a whole; deliver it through on_chunk,
+        a file, or both.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID to use
+            model_id: Model to use
+            output_format: Output format
+            on_chunk: Called with every audio chunk as it arrives
+            save_to_file: Whether to stream the audio to a file
+            filename: Custom filename for saved audio
+            chunk_size: Bytes per audio chunk
+            
+        Returns:
+            Dictionary containing the stream metrics (time_to_first_byte, total_time, audio_size) and metadata
+        """
+        if save_to_file and not filename:
+            filename = f"tts_output_{voice_id}_{model_id}.mp3"
+        
+        try:
+            stream = self.iter_text_to_speech(text, voice_id, model_id, output_format, chunk_size)
+            metrics = deliver_audio_stream(stream, on_chunk, filename if save_to_file else None)
+        except Exception as e:
+            return request_failure(e)
+        
+        return {
+            "success": True,
+            "text": text,
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "output_format": output_format,
+            **metrics
+        }
     
     def get_available_voices(self) -> Dict[str, Any]:
         """
@@ -107,7 +229,7 @@ class ElevenLabsTTSDirect:
         headers = {"xi-api-key": self.api_key}
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.transport.get(url, headers=headers)
             
             if response.status_code == 200:
                 voices = response.json()
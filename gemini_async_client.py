@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Asyncio Gemini AI Client - drives many conversations from one event loop
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from gemini_client import (
+    create_model,
+    make_generation_config,
+    interpret_response,
+    make_fallback_strategy,
+    preprocess_prompt,
+)
+from conversation_memory import ConversationMemory
+
+
+class AsyncGeminiClient:
+    """Async client for Google Gemini AI with per-session conversation memory"""
+
+    def __init__(self, max_concurrency: int = 50, model=None, fallback=None):
+        """
+        Initialize the async Gemini client
+
+        Args:
+            max_concurrency (int): Maximum number of in-flight model requests (default: 50)
+            model: Pre-configured GenerativeModel to share. If not provided, one is created
+            fallback: FallbackStrategy used when a response is safety-blocked (optional)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # One configured model shared by every session
+        self.model = model if model is not None else create_model()
+        self.max_concurrency = max_concurrency
+
+        # Shared across sessions so the rephrasing order adapts to every conversation
+        self.fallback = fallback or make_fallback_strategy()
+
+        # Conversation memory keyed by session id
+        self.sessions: Dict[str, ConversationMemory] = {}
+
+        # Created lazily so the semaphore binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def generate_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
+        """
+        Generate text based on a prompt using Gemini AI
+
+        Args:
+            prompt (str): The input prompt for text generation
+            max_tokens (int): Maximum number of tokens to generate (default: 1000)
+            temperature (float): Controls randomness (0.0 to 1.0, default: 0.7)
+
+        Returns:
+            str: Generated text response
+
+        Raises:
+            Exception: If text generation fails
+        """
+        try:
+            generation_config = make_generation_config(max_tokens, temperature)
+
+            async with self._get_semaphore():
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config
+                )
+
+            return interpret_response(response)
+
+        except Exception as e:
+            raise Exception(f"Failed to generate text with Gemini: {str(e)}")
+
+    async def simple_prompt(self, user_input: str, session_id: str = "default") -> str:
+        """
+        Process user input for one session and return the AI response with conversation context
+
+        Args:
+            user_input (str): The input text/prompt
+            session_id (str): Conversation the message belongs to
+
+        Returns:
+            str: AI-generated response
+        """
+        memory = self.sessions.get(session_id)
+        if memory is None:
+            memory = self.sessions[session_id] = ConversationMemory()
+
+        try:
+            memory.add("user", user_input)
+
+            processed_input = preprocess_prompt(memory.build_context_prompt())
+
+            # If the response is blocked due to safety, alternative phrasings are raced
+            response = await self.fallback.resolve_async(processed_input, user_input, self.generate_text)
+
+            memory.add("assistant", response)
+
+            return response
+
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    async def run_sessions(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """
+        Send one message to each of many sessions concurrently
+
+        Args:
+            prompts (dict): Mapping of session id to user message
+
+        Returns:
+            dict: Mapping of session id to AI response
+        """
+        session_ids = list(prompts)
+        responses = await asyncio.gather(
+            *(self.simple_prompt(prompts[sid], session_id=sid) for sid in session_ids)
+        )
+        return dict(zip(session_ids, responses))
+
+    def clear_history(self, session_id: str = "default"):
+        """Clear conversation history for a session"""
+        self.sessions.pop(session_id, None)
+
+    def get_history(self, session_id: str = "default"):
+        """Get conversation history for a session"""
+        memory = self.sessions.get(session_id)
+        return memory.messages if memory is not None else []
+
+
+async def main():
+    """Example usage of the async Gemini client"""
+    try:
+        client = AsyncGeminiClient(max_concurrency=10)
+
+        print("=== Async Gemini AI Example ===")
+        responses = await client.run_sessions({
+            "alice": "How can I fit more focus time into my Tuesdays?",
+            "bob": "I want to protect 8 hours of sleep. Where do I start?",
+        })
+
+        for session_id, response in responses.items():
+            print(f"\n[{session_id}] Gemini Response:\n{response}")
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
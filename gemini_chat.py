@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
 Simple Gemini Chat - Input text and get Gemini's response
+Attaches to the persistent Gemini worker when one can be started, otherwise runs Gemini in-process
 """
 
 import os
@@ -10,7 +11,7 @@ import warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 warnings.filterwarnings('ignore')
 
-from gemini_client import GeminiClient
+from gemini_worker import connect_worker
 
 
 def chat_with_gemini():
@@ -20,8 +21,13 @@ def chat_with_gemini():
     print("Commands: 'quit' to exit, 'clear' to clear history, 'history' to show conversation\n")
     
     try:
-        # Initialize Gemini
-        client = GeminiClient()
+        # The worker keeps the SDK loaded and the conversation warm between runs
+        client = connect_worker("gemini_chat")
+        if client is None:
+            from gemini_client import GeminiClient
+            # Initialize Gemini - the SDK loads in the background while the user types
+            client = GeminiClient(lazy=True)
+            client.warm_up()
         print("✅ Connected to Gemini AI with conversation memory!\n")
         
         while True:
@@ -57,8 +63,10 @@ def chat_with_gemini():
             try:
                 # Send to Gemini and get response with context
                 print("🤖 Gemini is thinking...")
-                response = client.simple_prompt(user_message)
-                print(f"Gemini: {response}\n")
+                print("Gemini: ", end="", flush=True)
+                for chunk in client.stream_prompt(user_message):
+                    print(chunk, end="", flush=True)
+                print("\n")
                 
             except Exception as e:
                 print(f"❌ Error: {e}\n")
@@ -1,56 +1,29 @@
 #!/usr/bin/env python3
 """
 Ultra-clean Gemini interface - completely suppresses warnings
+Prompts are served by the persistent Gemini worker, whose stderr is discarded
 """
 
-import subprocess
-import sys
-import os
+from typing import Optional
 
-def clean_gemini_call(prompt: str) -> str:
-    """Call Gemini with completely clean output"""
-    
-    # Create a temporary script
-    script_content = f'''
-import os
-import warnings
-import sys
-
-# Suppress everything
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-warnings.filterwarnings("ignore")
+from gemini_worker import GeminiWorkerClient
 
-# Redirect stderr to null
-sys.stderr = open(os.devnull, "w")
+# One connection per process; the worker keeps the conversation between calls
+_worker_client: Optional[GeminiWorkerClient] = None
 
-from gemini_client import GeminiClient
 
-try:
-    client = GeminiClient()
-    response = client.simple_prompt("{prompt}")
-    print(response)
-except Exception as e:
-    print(f"Error: {{e}}")
-'''
-    
-    # Write to temporary file
-    with open('/tmp/gemini_temp.py', 'w') as f:
-        f.write(script_content)
+def clean_gemini_call(prompt: str, session_id: str = "gemini_clean") -> str:
+    """Call Gemini with completely clean output"""
+    global _worker_client
     
     try:
-        # Run the script and capture output
-        result = subprocess.run(
-            [sys.executable, '/tmp/gemini_temp.py'],
-            capture_output=True,
-            text=True,
-            stderr=subprocess.DEVNULL  # Suppress stderr completely
-        )
-        
-        return result.stdout.strip()
-    finally:
-        # Clean up temp file
-        if os.path.exists('/tmp/gemini_temp.py'):
-            os.remove('/tmp/gemini_temp.py')
+        if _worker_client is None or _worker_client.session_id != session_id:
+            _worker_client = GeminiWorkerClient(session_id)
+        return _worker_client.prompt(prompt)
+    except Exception as e:
+        # Reconnect on the next call (the worker may have been restarted)
+        _worker_client = None
+        return f"Error: {e}"
 
 def main():
     """Interactive clean Gemini chat"""
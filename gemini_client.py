@@ -7,65 +7,338 @@ import os
 import warnings
 import sys
 import contextlib
-import google.generativeai as genai
+import threading
+from collections import OrderedDict
+from typing import Iterator, Optional
 from config import Config
+from conversation_memory import ConversationMemory, extractive_summarizer
+from prompt_rewriter import PromptRewriter, DEFAULT_REWRITER
+from safety_fallback import FallbackStrategy
+from text_utils import iter_sentences  # Re-exported for callers regrouping stream_prompt output
 
 # Suppress warnings and logging
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 warnings.filterwarnings('ignore')
 
+# Shared state so overlapping suppress_stderr blocks (e.g. a background warm-up
+# and a request thread) restore the real stderr only when the last one exits
+_stderr_lock = threading.Lock()
+_stderr_depth = 0
+_saved_stderr = None
+_devnull = None
+
+_genai = None
+_genai_lock = threading.Lock()
+
+
 # Redirect stderr to suppress Google's internal warnings
 @contextlib.contextmanager
 def suppress_stderr():
-    with open(os.devnull, "w") as devnull:
-        old_stderr = sys.stderr
-        sys.stderr = devnull
+    global _stderr_depth, _saved_stderr, _devnull
+    with _stderr_lock:
+        if _stderr_depth == 0:
+            _saved_stderr = sys.stderr
+            _devnull = open(os.devnull, "w")
+            sys.stderr = _devnull
+        _stderr_depth += 1
+    try:
+        yield
+    finally:
+        with _stderr_lock:
+            _stderr_depth -= 1
+            if _stderr_depth == 0:
+                sys.stderr = _saved_stderr
+                _devnull.close()
+
+
+def load_sdk():
+    """
+    Import google.generativeai on first use
+    
+    The SDK takes most of a second to import, so entry points stay fast until
+    a model is actually needed (or warmed up in the background).
+    """
+    global _genai
+    if _genai is None:
+        with _genai_lock:
+            if _genai is None:
+                with suppress_stderr():
+                    import google.generativeai as genai
+                _genai = genai
+    return _genai
+
+
+def start_warm_up(target, name: str = "gemini-warm-up") -> threading.Thread:
+    """
+    Run target in a daemon thread, ignoring errors
+    
+    A failed warm-up is harmless: the same error is raised again when the
+    model is first used for real.
+    """
+    def run():
         try:
-            yield
-        finally:
-            sys.stderr = old_stderr
+            target()
+        except Exception:
+            pass
+    
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+# Relaxed safety settings shared by every model instance
+SAFETY_SETTINGS = [
+    {
+        "category": "HARM_CATEGORY_HARASSMENT",
+        "threshold": "BLOCK_ONLY_HIGH"
+    },
+    {
+        "category": "HARM_CATEGORY_HATE_SPEECH",
+        "threshold": "BLOCK_ONLY_HIGH"
+    },
+    {
+        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "threshold": "BLOCK_ONLY_HIGH"
+    },
+    {
+        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "threshold": "BLOCK_ONLY_HIGH"
+    }
+]
+
+MODEL_NAME = 'gemini-2.0-flash'
+
+# Marker found in the fallback text returned for SAFETY-blocked responses
+SAFETY_BLOCKED_MARKER = "safety guidelines"
+
+
+def create_model():
+    """
+    Configure the Gemini SDK and build a GenerativeModel with the shared safety settings
+    
+    Returns:
+        genai.GenerativeModel: Configured model instance
+    """
+    Config.validate_gemini_config()
+    genai = load_sdk()
+    
+    # Suppress warnings during configuration
+    with suppress_stderr():
+        genai.configure(api_key=Config.GEMINI_API_KEY)
+        return genai.GenerativeModel(
+            MODEL_NAME,
+            safety_settings=SAFETY_SETTINGS
+        )
+
+
+def make_generation_config(max_tokens: int = 1000, temperature: float = 0.7):
+    """Build the generation config used for a single request"""
+    return load_sdk().types.GenerationConfig(
+        max_output_tokens=max_tokens,
+        temperature=temperature,
+    )
+
+
+# User-facing messages for finish reasons that do not produce a usable answer
+FINISH_REASON_MESSAGES = {
+    2: "I apologize, but I cannot provide a response to that request due to safety guidelines. Please try rephrasing your question.",  # SAFETY
+    3: "I cannot provide this response as it may contain copyrighted content. Please try a different approach.",  # RECITATION
+    4: "I encountered an issue generating a response. Please try again.",  # OTHER
+    5: "The response was too long. Please try a more specific question.",  # MAX_TOKENS
+}
+
+NO_RESPONSE_MESSAGE = "No response generated. Please try again."
+EMPTY_RESPONSE_MESSAGE = "I received an empty response. Please try rephrasing your request."
+
+# Every canned message that stands in for a real answer
+FALLBACK_MESSAGES = frozenset(FINISH_REASON_MESSAGES.values()) | {NO_RESPONSE_MESSAGE, EMPTY_RESPONSE_MESSAGE}
+
+# Neutral rephrasings tried when the original prompt is blocked
+ALTERNATIVE_PROMPT_TEMPLATES = [
+    "Please help me organize this: {user_input}",
+    "I need assistance with: {user_input}",
+    "Can you help me with this task: {user_input}"
+]
+
+# Mapping from conversation roles to Gemini chat roles
+GEMINI_ROLES = {"user": "user", "assistant": "model"}
+
+# Live chat sessions kept by chat_with_context before the oldest is dropped
+MAX_CHAT_SESSIONS = 128
+
+
+def finish_reason_message(finish_reason) -> Optional[str]:
+    """Return the fallback message for a finish reason, or None if the answer is usable"""
+    return FINISH_REASON_MESSAGES.get(int(finish_reason))
+
+
+def interpret_response(response) -> str:
+    """
+    Map a Gemini response to the text shown to the user
+    
+    Blocked or empty responses are turned into a friendly fallback message
+    based on the candidate's finish reason.
+    
+    Args:
+        response: GenerateContentResponse returned by the model
+        
+    Returns:
+        str: Response text or fallback message
+    """
+    # Check response status
+    if not response.candidates:
+        return NO_RESPONSE_MESSAGE
+    
+    # Handle different finish reasons
+    message = finish_reason_message(response.candidates[0].finish_reason)
+    if message:
+        return message
+    elif not response.text:
+        return EMPTY_RESPONSE_MESSAGE
+    
+    return response.text
+
+
+def chunk_text(chunk) -> str:
+    """Text carried by one streamed chunk (empty for chunks without parts)"""
+    try:
+        return chunk.text or ""
+    except ValueError:
+        # Raised by the SDK for chunks that only carry a finish reason
+        return ""
+
+
+def stream_notice(reply: str, fallback: Optional[str]) -> Optional[str]:
+    """
+    Text to emit once a stream has finished
+    
+    Args:
+        reply (str): Text streamed so far
+        fallback (str): Message mapped from the final finish reason, if any
+        
+    Returns:
+        str: Trailing chunk to emit, or None when the streamed reply is complete
+    """
+    if not reply:
+        return fallback or EMPTY_RESPONSE_MESSAGE
+    if fallback:
+        # Part of the answer was already emitted; flag that it is incomplete
+        return f"\n\n{fallback}"
+    return None
+
+
+def to_gemini_history(history: list) -> list:
+    """
+    Convert (role, content) pairs into the Content dicts expected by start_chat
+    
+    Args:
+        history (list): (role, content) pairs with 'user' or 'assistant' roles
+        
+    Returns:
+        list: History entries with Gemini's 'user' / 'model' roles
+    """
+    return [{"role": GEMINI_ROLES[role], "parts": [content]} for role, content in history]
+
+
+def is_fallback_message(response_text: str) -> bool:
+    """Check whether a response is a canned fallback rather than model output"""
+    return response_text in FALLBACK_MESSAGES
+
+
+def is_safety_blocked(response_text: str) -> bool:
+    """Check whether a response is the safety-blocked fallback message"""
+    return SAFETY_BLOCKED_MARKER in response_text
+
+
+def alternative_prompts(user_input: str) -> list:
+    """Neutral rephrasings tried when the original prompt is blocked"""
+    return [template.format(user_input=user_input) for template in ALTERNATIVE_PROMPT_TEMPLATES]
+
+
+def make_fallback_strategy(hedge_delay: Optional[float] = None) -> FallbackStrategy:
+    """Build the strategy that races the rephrasings when a prompt is blocked"""
+    return FallbackStrategy(ALTERNATIVE_PROMPT_TEMPLATES, is_safety_blocked, hedge_delay=hedge_delay)
+
+
+def preprocess_prompt(prompt: str, rewriter: Optional[PromptRewriter] = None) -> str:
+    """
+    Preprocess prompts to avoid safety filter triggers
+    
+    Potentially problematic words are replaced with neutral alternatives in a
+    single whole-word, case-preserving pass.
+    """
+    return (rewriter or DEFAULT_REWRITER).rewrite(prompt)
 
 
 class GeminiClient:
     """Client for interacting with Google Gemini AI with conversation memory"""
     
-    def __init__(self):
-        """Initialize the Gemini client"""
-        Config.validate_gemini_config()
+    def __init__(self, model=None, cache=None, memory=None, rewriter=None, fallback=None,
+                 lazy: bool = False):
+        """
+        Initialize the Gemini client
         
-        # Suppress warnings during configuration
-        with suppress_stderr():
-            genai.configure(api_key=Config.GEMINI_API_KEY)
-        
-        # Initialize conversation history
-        self.conversation_history = []
-        
-        # Configure safety settings to be less restrictive
-        safety_settings = [
-            {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_ONLY_HIGH"
-            },
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_ONLY_HIGH"
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_ONLY_HIGH"
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                "threshold": "BLOCK_ONLY_HIGH"
-            }
-        ]
+        Args:
+            model: Pre-configured GenerativeModel to use. If not provided, one is created
+            cache: ResponseCache placed in front of generate_text (optional)
+            memory: ConversationMemory holding the conversation. If not provided, a default one is used
+            rewriter: PromptRewriter applied to prompts before sending. Defaults to the built-in rules
+            fallback: FallbackStrategy used when a response is safety-blocked (optional)
+            lazy: Defer loading the SDK and building the model until first use (see warm_up)
+        """
+        # Token-budgeted conversation history
+        self.memory = memory if memory is not None else ConversationMemory()
+        
+        # Live chat sessions for chat_with_context, least recently used first
+        self.chat_sessions = OrderedDict()
         
         # Initialize the model with safety settings
-        with suppress_stderr():
-            self.model = genai.GenerativeModel(
-                'gemini-2.0-flash',
-                safety_settings=safety_settings
-            )
+        self._model = model
+        self._model_lock = threading.Lock()
+        if self._model is None:
+            # Fail fast on a missing key even when the model itself is deferred
+            Config.validate_gemini_config()
+            if not lazy:
+                self._model = create_model()
+        
+        # Opt-in response cache for generate_text
+        self.cache = cache
+        
+        # Word replacements applied before prompts are sent
+        self.rewriter = rewriter or DEFAULT_REWRITER
+        
+        # Concurrent rephrasings for safety-blocked prompts
+        self.fallback = fallback or make_fallback_strategy()
+    
+    @property
+    def model(self):
+        """The GenerativeModel, built on first access for lazy clients"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = create_model()
+        return self._model
+    
+    @model.setter
+    def model(self, model):
+        self._model = model
+    
+    def warm_up(self) -> threading.Thread:
+        """
+        Load the SDK and build the model in a background thread
+        
+        Call right after creating a lazy client, so the import overlaps with
+        the user typing their first message.
+        
+        Returns:
+            threading.Thread: The started warm-up thread
+        """
+        return start_warm_up(lambda: self.model)
+    
+    @property
+    def conversation_history(self) -> list:
+        """Messages currently kept verbatim (older turns live in memory.summary)"""
+        return self.memory.messages
         
     def generate_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
         """
@@ -83,52 +356,108 @@ class GeminiClient:
             Exception: If text generation fails
         """
         try:
+            cache_key = None
+            if self.cache is not None:
+                model_name = getattr(self.model, 'model_name', MODEL_NAME)
+                cache_key = self.cache.make_key(prompt, model_name, max_tokens, temperature, SAFETY_SETTINGS)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            
             # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-            )
+            generation_config = make_generation_config(max_tokens, temperature)
             
             # Generate response
+            model = self.model
             with suppress_stderr():
-                response = self.model.generate_content(
+                response = model.generate_content(
                     prompt,
                     generation_config=generation_config
                 )
             
-            # Check response status
-            if not response.candidates:
-                return "No response generated. Please try again."
+            text = interpret_response(response)
             
-            candidate = response.candidates[0]
-            finish_reason = candidate.finish_reason
+            # Blocked and error responses are never cached
+            if cache_key is not None and not is_fallback_message(text):
+                self.cache.put(cache_key, text)
             
-            # Handle different finish reasons
-            if finish_reason == 2:  # SAFETY
-                return "I apologize, but I cannot provide a response to that request due to safety guidelines. Please try rephrasing your question."
-            elif finish_reason == 3:  # RECITATION
-                return "I cannot provide this response as it may contain copyrighted content. Please try a different approach."
-            elif finish_reason == 4:  # OTHER
-                return "I encountered an issue generating a response. Please try again."
-            elif finish_reason == 5:  # MAX_TOKENS
-                return "The response was too long. Please try a more specific question."
-            elif not response.text:
-                return "I received an empty response. Please try rephrasing your request."
+            return text
+            
+        except Exception as e:
+            raise Exception(f"Failed to generate text with Gemini: {str(e)}")
+    
+    def stream_text(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> Iterator[str]:
+        """
+        Generate text and yield it in chunks as the model produces them
+        
+        Finish reasons are checked once the stream ends; a blocked or truncated
+        answer is reported with the same messages as generate_text.
+        
+        Args:
+            prompt (str): The input prompt for text generation
+            max_tokens (int): Maximum number of tokens to generate (default: 1000)
+            temperature (float): Controls randomness (0.0 to 1.0, default: 0.7)
             
-            return response.text
+        Yields:
+            str: Text chunks
             
+        Raises:
+            Exception: If text generation fails
+        """
+        parts = []
+        try:
+            fallback = yield from self._stream_generation(prompt, parts, max_tokens, temperature)
         except Exception as e:
             raise Exception(f"Failed to generate text with Gemini: {str(e)}")
+        
+        notice = stream_notice("".join(parts), fallback)
+        if notice:
+            yield notice
     
-    def chat_with_context(self, messages: list, max_tokens: int = 1000, temperature: float = 0.7) -> str:
+    def _stream_generation(self, prompt: str, parts: list, max_tokens: int = 1000,
+                           temperature: float = 0.7):
+        """
+        Stream one generation, yielding chunks and collecting them into parts
+        
+        Returns:
+            str: Fallback message for the final finish reason, or None
+        """
+        generation_config = make_generation_config(max_tokens, temperature)
+        
+        model = self.model
+        with suppress_stderr():
+            response = model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                stream=True
+            )
+        
+        for chunk in response:
+            text = chunk_text(chunk)
+            if text:
+                parts.append(text)
+                yield text
+        
+        if not response.candidates:
+            return NO_RESPONSE_MESSAGE
+        return finish_reason_message(response.candidates[0].finish_reason)
+    
+    def chat_with_context(self, messages: list, max_tokens: int = 1000, temperature: float = 0.7,
+                          conversation_id: Optional[str] = None) -> str:
         """
         Have a conversation with Gemini AI using message history
         
+        The earlier user and assistant turns are seeded into the chat session, so
+        the whole history goes to the model in a single request. With a
+        conversation_id the live session is kept and extended on later calls
+        instead of being rebuilt.
+        
         Args:
             messages (list): List of message dictionaries with 'role' and 'content'
                            e.g., [{'role': 'user', 'content': 'Hello'}, {'role': 'assistant', 'content': 'Hi!'}]
             max_tokens (int): Maximum number of tokens to generate (default: 1000)
             temperature (float): Controls randomness (0.0 to 1.0, default: 0.7)
+            conversation_id (str): Key of the live chat session to reuse (optional)
             
         Returns:
             str: Generated response
@@ -136,31 +465,61 @@ class GeminiClient:
         Raises:
             Exception: If chat fails
         """
+        if not messages or messages[-1]['role'] != 'user':
+            return ""
+        
+        history = [(message['role'], message['content']) for message in messages[:-1]
+                   if message['role'] in GEMINI_ROLES]
+        last_message = messages[-1]['content']
+        
         try:
-            # Start a chat session
-            chat = self.model.start_chat(history=[])
+            chat, seeded = self._get_chat_session(history, conversation_id)
             
-            # Add message history
-            for message in messages[:-1]:  # All except the last message
-                if message['role'] == 'user':
-                    chat.send_message(message['content'])
-                elif message['role'] == 'assistant':
-                    # For assistant messages, we need to add them to history differently
-                    # This is a simplified approach - in practice, you might need more complex handling
-                    pass
+            with suppress_stderr():
+                response = chat.send_message(
+                    last_message,
+                    generation_config=make_generation_config(max_tokens, temperature)
+                )
             
-            # Send the last message and get response
-            if messages:
-                last_message = messages[-1]
-                if last_message['role'] == 'user':
-                    response = chat.send_message(last_message['content'])
-                    return response.text
+            reply = interpret_response(response)
             
-            return ""
+            if conversation_id is not None:
+                # The session now holds this exchange as well
+                self.chat_sessions[conversation_id] = (chat, seeded + [("user", last_message), ("assistant", reply)])
+                self.chat_sessions.move_to_end(conversation_id)
+                while len(self.chat_sessions) > MAX_CHAT_SESSIONS:
+                    self.chat_sessions.popitem(last=False)
+            
+            return reply
             
         except Exception as e:
+            # Rebuild the session from the caller's history next time
+            self.chat_sessions.pop(conversation_id, None)
             raise Exception(f"Failed to chat with Gemini: {str(e)}")
     
+    def _get_chat_session(self, history: list, conversation_id: Optional[str]):
+        """
+        Return a chat session holding history, reusing the live one when it matches
+        
+        Args:
+            history (list): (role, content) pairs preceding the new message
+            conversation_id (str): Key of the live chat session (optional)
+            
+        Returns:
+            tuple: (ChatSession, list of (role, content) pairs it contains)
+        """
+        cached = self.chat_sessions.get(conversation_id) if conversation_id is not None else None
+        if cached is not None and cached[1] == history:
+            return cached
+        
+        # Seeding is local - nothing is sent until the next message
+        chat = self.model.start_chat(history=to_gemini_history(history))
+        return chat, list(history)
+    
+    def end_conversation(self, conversation_id: str):
+        """Drop the live chat session kept for a conversation"""
+        self.chat_sessions.pop(conversation_id, None)
+    
     def simple_prompt(self, user_input: str) -> str:
         """
         Simple function to process user input and return AI response with conversation context
@@ -174,7 +533,7 @@ class GeminiClient:
         """
         try:
             # Add user input to conversation history
-            self.conversation_history.append({"role": "user", "content": user_input})
+            self.memory.add("user", user_input)
             
             # Build context-aware prompt
             context_prompt = self._build_context_prompt()
@@ -182,75 +541,106 @@ class GeminiClient:
             # Preprocess the input to avoid safety filter triggers
             processed_input = self._preprocess_prompt(context_prompt)
             
-            response = self.generate_text(processed_input)
-            
-            # If response was blocked due to safety, try alternative phrasings
-            if "safety guidelines" in response:
-                alternative_prompts = [
-                    f"Please help me organize this: {user_input}",
-                    f"I need assistance with: {user_input}",
-                    f"Can you help me with this task: {user_input}"
-                ]
-                
-                for alt_prompt in alternative_prompts:
-                    response = self.generate_text(alt_prompt)
-                    if "safety guidelines" not in response:
-                        break
+            # If the response is blocked due to safety, alternative phrasings are raced
+            response = self.fallback.resolve(processed_input, user_input, self.generate_text)
             
             # Add AI response to conversation history
-            self.conversation_history.append({"role": "assistant", "content": response})
+            self.memory.add("assistant", response)
             
             return response
             
         except Exception as e:
             return f"Error: {str(e)}"
     
-    def _build_context_prompt(self) -> str:
+    def stream_prompt(self, user_input: str) -> Iterator[str]:
         """
-        Build a context-aware prompt from conversation history
-        """
-        if len(self.conversation_history) <= 2:
-            # First exchange, just return the current user input
-            return self.conversation_history[-1]["content"]
+        Streaming version of simple_prompt - yields the AI response in chunks
         
-        # Build context from recent conversation (last 6 messages)
-        recent_history = self.conversation_history[-6:]
+        The assembled reply is added to the conversation history once the stream ends.
         
-        context = "Previous conversation context:\n"
-        for msg in recent_history[:-1]:  # Exclude the current message
-            role = "User" if msg["role"] == "user" else "Assistant"
-            context += f"{role}: {msg['content']}\n"
+        Args:
+            user_input (str): The input text/prompt
+            
+        Yields:
+            str: Response text chunks
+        """
+        # Add user input to conversation history
+        self.memory.add("user", user_input)
+        
+        parts = []
+        try:
+            processed_input = self._preprocess_prompt(self._build_context_prompt())
+            
+            fallback = yield from self._stream_generation(processed_input, parts)
+            
+            # A safety block arrives before any text, so the rephrasings can still be tried
+            if not parts and fallback and is_safety_blocked(fallback):
+                for alt_prompt in alternative_prompts(user_input):
+                    fallback = yield from self._stream_generation(alt_prompt, parts)
+                    if parts or not (fallback and is_safety_blocked(fallback)):
+                        break
+            
+            notice = stream_notice("".join(parts), fallback)
+            
+        except Exception as e:
+            notice = f"Error: {str(e)}"
         
-        context += f"\nCurrent user message: {recent_history[-1]['content']}\n"
-        context += "Please respond to the current message while considering the conversation context above."
+        if notice:
+            parts.append(notice)
+            yield notice
         
-        return context
+        # Add AI response to conversation history
+        self.memory.add("assistant", "".join(parts))
+    
+    def _build_context_prompt(self) -> str:
+        """
+        Build a context-aware prompt from conversation history
+        """
+        return self.memory.build_context_prompt()
     
     def _preprocess_prompt(self, prompt: str) -> str:
         """
         Preprocess prompts to avoid safety filter triggers
         """
-        # Replace potentially problematic words with neutral alternatives
-        replacements = {
-            "schedule": "organize",
-            "meeting": "appointment",
-            "client": "contact",
-            "book": "arrange"
-        }
-        
-        processed = prompt.lower()
-        for old_word, new_word in replacements.items():
-            processed = processed.replace(old_word, new_word)
-        
-        return processed
+        return preprocess_prompt(prompt, self.rewriter)
+    
+    def summarize_turns(self, summary: str, messages: list) -> str:
+        """
+        Model-backed summarizer for ConversationMemory
+        
+        Use with client.memory.summarizer = client.summarize_turns. Falls back to
+        the extractive summary if the model call fails or is blocked.
+        
+        Args:
+            summary (str): Current running summary
+            messages (list): Messages being folded into the summary
+            
+        Returns:
+            str: Updated summary
+        """
+        transcript = "\n".join(
+            f"{'User' if msg['role'] == 'user' else 'Assistant'}: {msg['content']}" for msg in messages
+        )
+        prompt = (
+            "Update this conversation summary with the new messages. Keep every goal, "
+            "constraint and preference the user stated. Reply with the summary only.\n\n"
+            f"Current summary:\n{summary or '(none)'}\n\nNew messages:\n{transcript}"
+        )
+        try:
+            updated = self.generate_text(prompt, max_tokens=self.memory.summary_budget, temperature=0.2)
+        except Exception:
+            updated = None
+        if not updated or is_fallback_message(updated):
+            return extractive_summarizer(summary, messages, self.memory.summary_budget)
+        return updated.strip()
     
     def clear_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.memory.clear()
     
     def get_history(self):
         """Get conversation history"""
-        return self.conversation_history.copy()
+        return self.memory.messages
 
 
 def main():
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Process-wide Gemini client registry
+Builds configured models once and hands out lightweight per-session clients
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from config import Config
+from gemini_client import GeminiClient, create_model, make_fallback_strategy, start_warm_up
+from safety_fallback import FallbackStrategy
+
+# Conversations kept before the least recently used one is dropped
+MAX_SESSIONS = 256
+
+
+class GeminiRegistry:
+    """Thread-safe pool of configured models and per-session GeminiClient handles"""
+
+    def __init__(self, pool_size: int = 1, model_factory: Callable = create_model,
+                 max_sessions: int = MAX_SESSIONS, fallback: Optional[FallbackStrategy] = None):
+        """
+        Initialize the registry
+
+        Args:
+            pool_size: Number of model instances sessions are spread across
+            model_factory: Callable returning a configured model (default: create_model)
+            max_sessions: Maximum number of sessions kept alive
+            fallback: FallbackStrategy whose win statistics every session shares. If not provided, one is created
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.pool_size = pool_size
+        self.model_factory = model_factory
+        self.max_sessions = max_sessions
+        # One strategy for all sessions: shared win statistics and template ordering;
+        # each call fans its rephrasings out on its own threads
+        self.fallback = fallback or make_fallback_strategy()
+
+        self._models: list = []
+        self._next_model = itertools.count()
+        self.sessions: "OrderedDict[str, GeminiClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_model(self):
+        """Return the next pooled model, building the pool on first use"""
+        with self._lock:
+            if not self._models:
+                # Built under the lock so concurrent first callers share one pool
+                self._models = [self.model_factory() for _ in range(self.pool_size)]
+            return self._models[next(self._next_model) % self.pool_size]
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Build the model pool in a background thread
+
+        Returns:
+            threading.Thread: The started warm-up thread
+        """
+        return start_warm_up(self.get_model, name="gemini-pool-warm-up")
+
+    def session(self, session_id: str = "default") -> GeminiClient:
+        """
+        Get the client for a session, creating it on first use
+
+        Args:
+            session_id: Conversation key
+
+        Returns:
+            GeminiClient: Client sharing a pooled model and keeping this session's history
+        """
+        with self._lock:
+            client = self.sessions.get(session_id)
+            if client is not None:
+                self.sessions.move_to_end(session_id)
+                return client
+
+        client = GeminiClient(model=self.get_model(), fallback=self.fallback)
+
+        with self._lock:
+            # Another thread may have created the session meanwhile
+            existing = self.sessions.get(session_id)
+            if existing is not None:
+                return existing
+            self.sessions[session_id] = client
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+            return client
+
+    def release(self, session_id: str):
+        """Forget a session and its conversation history"""
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool and session counts"""
+        with self._lock:
+            return {"models": len(self._models), "pool_size": self.pool_size, "sessions": len(self.sessions)}
+
+
+_registry: Optional[GeminiRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> GeminiRegistry:
+    """Return the process-wide registry, sized by Config.GEMINI_MODEL_POOL_SIZE"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = GeminiRegistry(pool_size=Config.GEMINI_MODEL_POOL_SIZE)
+    return _registry
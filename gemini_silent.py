@@ -1,23 +1,18 @@
 #!/usr/bin/env python3
 """
-Silent Gemini chat - hides warnings by redirecting stderr
+Silent Gemini chat - hides warnings by talking to the Gemini worker
 """
 
-import subprocess
-import sys
-import os
-
 def run_silent_gemini():
     """Run Gemini chat with warnings hidden"""
     
-    # The simplest solution: redirect stderr to /dev/null when running the script
+    # The Gemini worker runs with stderr discarded, so no warnings reach this terminal
     print("🤖 Silent Gemini AI Chat")
     print("Type your message and press Enter. Type 'quit' to exit.\n")
     
-    # Import here to minimize warning exposure
-    from gemini_client import GeminiClient
+    from gemini_worker import GeminiWorkerClient
     
-    client = GeminiClient()
+    client = GeminiWorkerClient("gemini_silent")
     
     while True:
         user_input = input("You: ").strip()
@@ -28,15 +23,7 @@ def run_silent_gemini():
         
         if user_input:
             try:
-                # Capture stderr during the API call
-                with open(os.devnull, 'w') as devnull:
-                    old_stderr = sys.stderr
-                    sys.stderr = devnull
-                    try:
-                        response = client.simple_prompt(user_input)
-                    finally:
-                        sys.stderr = old_stderr
-                
+                response = client.prompt(user_input)
                 print(f"Gemini: {response}\n")
             except Exception as e:
                 print(f"Error: {e}\n")
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Persistent Gemini worker - keeps the SDK loaded and conversations warm
+Front-ends talk to it over a local Unix socket (named pipe on Windows)
+
+Usage:
+    python gemini_worker.py          # run the worker in the foreground
+    python gemini_worker.py --stop   # ask a running worker to exit
+"""
+
+import hashlib
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import Any, Dict, Iterator, Optional
+
+from config import Config
+
+# Conversations kept warm before the least recently used one is dropped
+MAX_SESSIONS = 256
+
+
+def runtime_dir() -> str:
+    """
+    Private per-user directory holding the worker socket and its lock file
+
+    Uses $XDG_RUNTIME_DIR when set, otherwise a 0700 directory under the temp dir.
+
+    Raises:
+        PermissionError: If the fallback directory is not private to the current user
+    """
+    base = os.getenv('XDG_RUNTIME_DIR')
+    if base and os.path.isdir(base):
+        return base
+
+    path = os.path.join(tempfile.gettempdir(), f"gemini-worker-{os.getuid()}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    # Someone else may have created it first in a world-writable temp dir
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} must be a directory only you can access")
+    return path
+
+
+def default_address() -> str:
+    """Per-user socket path (or pipe name) the worker listens on"""
+    if sys.platform == 'win32':
+        return rf"\\.\pipe\gemini-worker-{os.getenv('USERNAME', 'user')}"
+    return os.path.join(runtime_dir(), "gemini-worker.sock")
+
+
+def worker_authkey() -> bytes:
+    """Shared secret for the connection handshake, derived from the API key both sides load"""
+    return hashlib.sha256(f"gemini-worker:{Config.GEMINI_API_KEY}".encode('utf-8')).digest()
+
+
+class GeminiWorker:
+    """Long-lived process serving Gemini prompts for many front-ends"""
+
+    def __init__(self, address: Optional[str] = None, model=None):
+        """
+        Initialize the worker
+
+        Args:
+            address: Socket path or pipe name. Defaults to default_address()
+            model: Pre-configured GenerativeModel to share. If not provided, one is created
+        """
+        self.address = address or default_address()
+        self.sessions: "OrderedDict[str, Any]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._listener: Optional[Listener] = None
+        self._address_lock = None
+        self._running = False
+
+        # Imported here so the SDK is loaded once, in the worker only
+        from gemini_client import GeminiClient, create_model, make_fallback_strategy
+        self._client_class = GeminiClient
+        self.model = model if model is not None else create_model()
+        # Shared by every session for one set of win statistics; each call fans out on its own threads
+        self.fallback = make_fallback_strategy()
+
+    def _session(self, session_id: str):
+        """Return the client and lock for a session, creating them on first use"""
+        with self._sessions_lock:
+            client = self.sessions.get(session_id)
+            if client is None:
+                client = self._client_class(model=self.model, fallback=self.fallback)
+                self.sessions[session_id] = client
+                self._session_locks[session_id] = threading.Lock()
+            self.sessions.move_to_end(session_id)
+            while len(self.sessions) > MAX_SESSIONS:
+                evicted, _ = self.sessions.popitem(last=False)
+                self._session_locks.pop(evicted, None)
+            return client, self._session_locks[session_id]
+
+    def handle(self, request: Dict[str, Any], send) -> Optional[Dict[str, Any]]:
+        """
+        Process one request
+
+        Args:
+            request: Dictionary with an 'op' key and op-specific fields
+            send: Callable used to push intermediate stream chunks
+
+        Returns:
+            dict: Final reply for the request
+        """
+        op = request.get("op")
+        session_id = request.get("session", "default")
+
+        if op == "ping":
+            return {"ok": True, "sessions": len(self.sessions), "pid": os.getpid()}
+        if op == "shutdown":
+            # Flag only; serve_forever closes the listener once accept() returns
+            self._running = False
+            threading.Thread(target=self._wake_listener, daemon=True).start()
+            return {"ok": True}
+
+        client, lock = self._session(session_id)
+        with lock:
+            if op == "prompt":
+                return {"ok": True, "response": client.simple_prompt(request["text"])}
+            if op == "stream":
+                for chunk in client.stream_prompt(request["text"]):
+                    send({"chunk": chunk})
+                return {"ok": True, "done": True}
+            if op == "clear":
+                client.clear_history()
+                return {"ok": True}
+            if op == "history":
+                return {"ok": True, "history": client.get_history()}
+
+        return {"ok": False, "error": f"Unknown operation: {op}"}
+
+    def _serve_connection(self, conn):
+        try:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    break
+                try:
+                    reply = self.handle(request, conn.send)
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                conn.send(reply)
+        finally:
+            conn.close()
+
+    def _worker_answers(self) -> bool:
+        """Whether something is already listening on the address"""
+        try:
+            Client(self.address, authkey=worker_authkey()).close()
+            return True
+        except AuthenticationError:
+            # Listening, just not with our key; still not ours to take over
+            return True
+        except (OSError, EOFError):
+            return False
+
+    def _claim_address(self) -> bool:
+        """
+        Take exclusive ownership of the address
+
+        A lock file next to the socket serializes workers starting at the same time,
+        so only a socket nobody answers on is treated as stale and removed.
+
+        Returns:
+            bool: False if another worker already owns the address
+        """
+        if sys.platform == 'win32':
+            return not self._worker_answers()
+
+        import fcntl
+        lock_file = open(f"{self.address}.lock", 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        if os.path.exists(self.address):
+            if self._worker_answers():
+                lock_file.close()
+                return False
+            # Left behind by a worker that did not exit cleanly
+            os.remove(self.address)
+        self._address_lock = lock_file
+        return True
+
+    def serve_forever(self) -> bool:
+        """
+        Accept connections until a shutdown request arrives
+
+        Returns:
+            bool: False without serving if another worker already listens on the address
+        """
+        if not self._claim_address():
+            return False
+
+        self._listener = Listener(self.address, authkey=worker_authkey())
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError):
+                    # Failed handshake or a closed listener
+                    continue
+                if not self._running:
+                    conn.close()
+                    break
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.stop()
+        return True
+
+    def _wake_listener(self):
+        """Unblock a pending accept() with a throwaway connection"""
+        try:
+            Client(self.address, authkey=worker_authkey()).close()
+        except (OSError, EOFError):
+            pass
+
+    def stop(self):
+        """Stop accepting connections and remove the socket"""
+        self._running = False
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            listener.close()
+        if self._address_lock is not None:
+            lock_file, self._address_lock = self._address_lock, None
+            lock_file.close()
+
+
+def start_worker(address: Optional[str] = None) -> subprocess.Popen:
+    """
+    Launch a detached worker process with its stderr discarded
+
+    Args:
+        address: Socket path or pipe name for the worker
+
+    Returns:
+        subprocess.Popen: Handle of the started process
+    """
+    script = os.path.abspath(__file__)
+    kwargs = {}
+    if sys.platform == 'win32':
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    return subprocess.Popen(
+        [sys.executable, script, "--address", address or default_address()],
+        cwd=os.path.dirname(script),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs
+    )
+
+
+class GeminiWorkerClient:
+    """Front-end handle for one conversation served by the Gemini worker"""
+
+    def __init__(self, session_id: str = "default", address: Optional[str] = None,
+                 autostart: bool = True, start_timeout: float = 30.0):
+        """
+        Connect to the worker, starting it if needed
+
+        Args:
+            session_id: Conversation this client talks to
+            address: Socket path or pipe name. Defaults to default_address()
+            autostart: Launch the worker if none is running
+            start_timeout: Seconds to wait for a freshly started worker
+        """
+        self.session_id = session_id
+        self.address = address or default_address()
+        self._lock = threading.Lock()
+        self._conn = self._connect(autostart, start_timeout)
+
+    def _connect(self, autostart: bool, start_timeout: float):
+        try:
+            return Client(self.address, authkey=worker_authkey())
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not autostart:
+                raise
+
+        process = start_worker(self.address)
+        deadline = time.monotonic() + start_timeout
+        while time.monotonic() < deadline:
+            try:
+                return Client(self.address, authkey=worker_authkey())
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+            # Exit code 0 means another front-end's worker won the race for the address
+            if process.poll() not in (None, 0):
+                raise Exception("Gemini worker exited during startup. Check GEMINI_API_KEY in your .env file.")
+            time.sleep(0.1)
+        raise Exception(f"Gemini worker did not start within {start_timeout} seconds")
+
+    def _request(self, op: str, **payload) -> Dict[str, Any]:
+        with self._lock:
+            self._conn.send({"op": op, "session": self.session_id, **payload})
+            reply = self._conn.recv()
+        if not reply.get("ok"):
+            raise Exception(reply.get("error", "Gemini worker request failed"))
+        return reply
+
+    def prompt(self, text: str) -> str:
+        """Send a message and return the AI response"""
+        return self._request("prompt", text=text)["response"]
+
+    def simple_prompt(self, text: str) -> str:
+        """Same as prompt, named like GeminiClient so front-ends can use either"""
+        return self.prompt(text)
+
+    def stream_prompt(self, text: str) -> Iterator[str]:
+        """Same as stream, named like GeminiClient so front-ends can use either"""
+        return self.stream(text)
+
+    def stream(self, text: str) -> Iterator[str]:
+        """Send a message and yield the AI response in chunks"""
+        with self._lock:
+            self._conn.send({"op": "stream", "session": self.session_id, "text": text})
+            finished = False
+            try:
+                while True:
+                    reply = self._conn.recv()
+                    if "chunk" in reply:
+                        yield reply["chunk"]
+                        continue
+                    finished = True
+                    if not reply.get("ok"):
+                        raise Exception(reply.get("error", "Gemini worker request failed"))
+                    return
+            finally:
+                if not finished:
+                    # Abandoned mid-stream: consume the rest so the next reply lines up with its request
+                    try:
+                        while "chunk" in self._conn.recv():
+                            pass
+                    except (EOFError, OSError):
+                        pass
+
+    def clear_history(self):
+        """Clear the conversation history kept by the worker"""
+        self._request("clear")
+
+    def get_history(self) -> list:
+        """Get the conversation history kept by the worker"""
+        return self._request("history")["history"]
+
+    def ping(self) -> Dict[str, Any]:
+        """Check that the worker is alive"""
+        return self._request("ping")
+
+    def shutdown(self):
+        """Ask the worker process to exit"""
+        self._request("shutdown")
+        self.close()
+
+    def close(self):
+        """Close the connection (the worker and its sessions stay up)"""
+        self._conn.close()
+
+
+def connect_worker(session_id: str = "default", **kwargs) -> Optional[GeminiWorkerClient]:
+    """
+    Attach to the worker, starting it if needed
+
+    Args:
+        session_id: Conversation to talk to
+        **kwargs: Passed to GeminiWorkerClient (address, autostart, start_timeout)
+
+    Returns:
+        GeminiWorkerClient: Connected client, or None if no worker could be reached and the
+            caller should run Gemini in-process instead
+    """
+    try:
+        return GeminiWorkerClient(session_id, **kwargs)
+    except Exception:
+        return None
+
+
+def main():
+    args = sys.argv[1:]
+    address = args[args.index("--address") + 1] if "--address" in args else None
+
+    if "--stop" in args:
+        try:
+            GeminiWorkerClient(address=address, autostart=False).shutdown()
+            print("Gemini worker stopped")
+        except (FileNotFoundError, ConnectionRefusedError):
+            print("No Gemini worker is running")
+        return
+
+    # Keep Google's internal warnings out of every front-end
+    sys.stderr = open(os.devnull, 'w')
+
+    worker = GeminiWorker(address)
+    print(f"Gemini worker listening on {worker.address}")
+    if not worker.serve_forever():
+        print("Another Gemini worker is already listening there")
+
+
+if __name__ == "__main__":
+    main()
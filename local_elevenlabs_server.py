@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the 11Labs HTTP API
+Used by the offline tests and benchmarks; serves canned responses over HTTP/1.1 keep-alive
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+# Canned transcript returned by the speech-to-text endpoint
+SAMPLE_TRANSCRIPT = {
+    "language_code": "eng",
+    "language_probability": 0.99,
+    "text": "Hello world.",
+    "words": [
+        {"text": "Hello", "start": 0.0, "end": 0.4, "type": "word", "speaker_id": "speaker_0", "logprob": 0.0},
+        {"text": " ", "start": 0.4, "end": 0.5, "type": "spacing", "speaker_id": "speaker_0", "logprob": 0.0},
+        {"text": "world.", "start": 0.5, "end": 0.9, "type": "word", "speaker_id": "speaker_0", "logprob": 0.0},
+    ],
+    "transcription_id": "local-transcription",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's algorithm
+    # plus delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str, retry_after: Optional[float] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunked(self, body: bytes, content_type: str):
+        """Send the body with chunked transfer encoding, pausing between chunks"""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        size = self.server.stream_chunk_size
+        for offset in range(0, len(body), size):
+            if offset and self.server.chunk_delay:
+                time.sleep(self.server.chunk_delay)
+            chunk = body[offset:offset + size]
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _begin(self) -> Optional[tuple]:
+        """Count the request, drain its body and return an injected (status, retry_after) if any"""
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+            if self.server.upload_bytes_per_second:
+                time.sleep(length / self.server.upload_bytes_per_second)
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.bytes_received += length
+            failure = self.server.fail_statuses.pop(0) if self.server.fail_statuses else None
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        return failure
+
+    def do_GET(self):
+        failure = self._begin()
+        if failure:
+            self._send(failure[0], b'{"detail": "injected failure"}', "application/json", failure[1])
+        elif self.path.endswith("/voices"):
+            body = json.dumps({"voices": [{"voice_id": "local", "name": "Local Voice"}]}).encode()
+            self._send(200, body, "application/json")
+        else:
+            self._send(404, b'{"detail": "not found"}', "application/json")
+
+    def do_POST(self):
+        failure = self._begin()
+        if failure:
+            self._send(failure[0], b'{"detail": "injected failure"}', "application/json", failure[1])
+        elif "/text-to-speech/" in self.path and self.path.endswith("/stream"):
+            self._send_chunked(self.server.audio_bytes, "audio/mpeg")
+        elif "/text-to-speech/" in self.path:
+            self._send(200, self.server.audio_bytes, "audio/mpeg")
+        elif self.path.endswith("/speech-to-text"):
+            self._send(200, json.dumps(self.server.transcript).encode(), "application/json")
+        else:
+            self._send(404, b'{"detail": "not found"}', "application/json")
+
+
+class LocalElevenLabsServer:
+    """Threaded HTTP server mimicking the 11Labs endpoints, for use as a context manager"""
+
+    def __init__(self, latency: float = 0.0, audio_bytes: bytes = b"\xff\xfb" * 2048,
+                 transcript: Optional[dict] = None, stream_chunk_size: int = 1024,
+                 chunk_delay: float = 0.0, upload_bytes_per_second: Optional[float] = None):
+        """
+        Initialize the stand-in server
+
+        Args:
+            latency: Seconds of simulated processing time per request
+            audio_bytes: Body returned by the text-to-speech endpoint
+            transcript: JSON returned by the speech-to-text endpoint
+            stream_chunk_size: Bytes per chunk sent by the streaming text-to-speech endpoint
+            chunk_delay: Seconds of simulated synthesis time between streamed chunks
+            upload_bytes_per_second: Simulated upload bandwidth; request bodies cost length / rate seconds
+        """
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.lock = threading.Lock()
+        self.httpd.connections = 0
+        self.httpd.requests = 0
+        self.httpd.bytes_received = 0
+        self.httpd.latency = latency
+        self.httpd.audio_bytes = audio_bytes
+        self.httpd.transcript = transcript or SAMPLE_TRANSCRIPT
+        self.httpd.stream_chunk_size = stream_chunk_size
+        self.httpd.chunk_delay = chunk_delay
+        self.httpd.upload_bytes_per_second = upload_bytes_per_second
+        self.httpd.fail_statuses = []
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use in place of https://api.elevenlabs.io/v1"""
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def connections(self) -> int:
+        """TCP connections accepted so far"""
+        return self.httpd.connections
+
+    @property
+    def requests(self) -> int:
+        """Requests served so far"""
+        return self.httpd.requests
+
+    @property
+    def bytes_received(self) -> int:
+        """Request body bytes received so far"""
+        return self.httpd.bytes_received
+
+    def fail_next(self, *statuses: int, retry_after: Optional[float] = None):
+        """Answer the next requests with these status codes, in order, optionally with a Retry-After header"""
+        with self.httpd.lock:
+            self.httpd.fail_statuses.extend((status, retry_after) for status in statuses)
+
+    def __enter__(self) -> "LocalElevenLabsServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
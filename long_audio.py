@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Long-audio helpers for chunked Speech-to-Text
+Splits recordings on quiet regions and stitches the chunk transcripts back together
+"""
+
+import io
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Analysis frame used to find quiet regions
+FRAME_MS = 20
+
+# Overlap-region words are matched to the previous chunk's words within this many seconds
+MATCH_TOLERANCE = 0.25
+
+
+def load_audio(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Decode an audio file to mono float32 samples
+
+    soundfile handles WAV/FLAC/OGG directly; other formats (MP3, M4A) go through
+    pydub, which needs ffmpeg on the PATH.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        tuple: (samples in [-1, 1], sample rate)
+    """
+    import soundfile as sf
+    try:
+        samples, sample_rate = sf.read(path, dtype='float32', always_2d=True)
+        return samples.mean(axis=1), sample_rate
+    except RuntimeError:
+        pass
+
+    from pydub import AudioSegment
+    segment = AudioSegment.from_file(path)
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+    samples = samples.reshape(-1, segment.channels).mean(axis=1)
+    return samples / float(1 << (8 * segment.sample_width - 1)), segment.frame_rate
+
+
+def frame_energy(samples: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS) -> np.ndarray:
+    """RMS energy of consecutive non-overlapping frames (the partial tail frame is dropped)"""
+    frame = max(1, sample_rate * frame_ms // 1000)
+    count = len(samples) // frame
+    frames = samples[:count * frame].reshape(count, frame)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+
+
+def find_split_points(samples: np.ndarray, sample_rate: int, chunk_seconds: float = 60.0,
+                      search_seconds: float = 10.0, frame_ms: int = FRAME_MS) -> List[int]:
+    """
+    Choose chunk boundaries that fall in the quietest frame near each target length
+
+    Args:
+        samples: Mono samples
+        sample_rate: Samples per second
+        chunk_seconds: Longest chunk to produce
+        search_seconds: How far before each target boundary to look for a quiet frame
+        frame_ms: Analysis frame length
+
+    Returns:
+        list: Sample indices starting each chunk, beginning with 0
+    """
+    frame = max(1, sample_rate * frame_ms // 1000)
+    energy = frame_energy(samples, sample_rate, frame_ms)
+    chunk_frames = max(1, int(chunk_seconds * 1000 / frame_ms))
+    search_frames = min(chunk_frames - 1, int(search_seconds * 1000 / frame_ms))
+
+    points = [0]
+    start = 0
+    while len(samples) - start * frame > chunk_seconds * sample_rate:
+        window = energy[start + chunk_frames - search_frames:start + chunk_frames]
+        if len(window) == 0:
+            break
+        # Latest of the quietest frames, so chunks stay close to chunk_seconds
+        quietest = len(window) - 1 - int(np.argmin(window[::-1]))
+        start = start + chunk_frames - search_frames + quietest
+        points.append(start * frame)
+    return points
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono samples as 16-bit PCM WAV"""
+    import soundfile as sf
+    buffer = io.BytesIO()
+    sf.write(buffer, samples, sample_rate, format='WAV', subtype='PCM_16')
+    return buffer.getvalue()
+
+
+def _shift(word: Dict[str, Any], offset: float) -> Dict[str, Any]:
+    shifted = dict(word)
+    # Audio events and some tokens come without timestamps; those stay untimed
+    for key in ("start", "end"):
+        if word.get(key) is not None:
+            shifted[key] = round(word[key] + offset, 3)
+    return shifted
+
+
+def _match_speakers(overlap_words: List[Dict[str, Any]], merged: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map a chunk's speaker labels onto labels already used, from words both chunks heard"""
+    votes = Counter()
+    overlap_words = [word for word in overlap_words if word.get("start") is not None]
+    if not overlap_words:
+        return {}
+    earliest = min(word["start"] for word in overlap_words) - MATCH_TOLERANCE
+    tail = []
+    for earlier in reversed(merged):
+        if earlier.get("start") is None:
+            continue
+        if earlier["start"] < earliest:
+            break
+        if earlier.get("type") == "word":
+            tail.append(earlier)
+
+    for word in overlap_words:
+        if word.get("type") != "word" or word.get("speaker_id") is None:
+            continue
+        for earlier in tail:
+            if (earlier["text"].strip() == word["text"].strip()
+                    and abs(earlier["start"] - word["start"]) <= MATCH_TOLERANCE):
+                votes[(word["speaker_id"], earlier["speaker_id"])] += 1
+                break
+
+    mapping = {}
+    for (local, known), _ in votes.most_common():
+        if local not in mapping and known not in mapping.values():
+            mapping[local] = known
+    return mapping
+
+
+def stitch_transcripts(chunks: List[Tuple[List[Dict[str, Any]], float, float]]) -> List[Dict[str, Any]]:
+    """
+    Merge per-chunk word lists into one timeline
+
+    Each chunk's audio starts at `offset` but only owns the words from `start` on;
+    the words in [offset, start) re-transcribe the end of the previous chunk. They are
+    dropped from the output and used to match the chunk's speaker labels (which the API
+    numbers independently per request) to the labels already assigned. Speakers that
+    cannot be matched get new labels. Words without timestamps are kept unshifted and
+    belong to whichever side the timed word before them falls on.
+
+    Args:
+        chunks: (words, offset, start) per chunk in order, with times in seconds
+
+    Returns:
+        list: Words with absolute start/end times and consistent speaker_id labels
+    """
+    merged: List[Dict[str, Any]] = []
+    speakers = set()
+
+    for words, offset, start in chunks:
+        overlap_words, kept = [], []
+        # Untimed words go with the timed word before them
+        owned = start <= offset
+        for word in words:
+            word = _shift(word, offset)
+            if word.get("start") is not None:
+                owned = word["start"] >= start
+            (kept if owned else overlap_words).append(word)
+
+        mapping = _match_speakers(overlap_words, merged) if overlap_words else {}
+        for word in kept:
+            local = word.get("speaker_id")
+            if local is None:
+                continue
+            if local not in mapping:
+                mapping[local] = f"speaker_{len(speakers)}"
+            word["speaker_id"] = mapping[local]
+            speakers.add(mapping[local])
+        merged.extend(kept)
+
+    return merged
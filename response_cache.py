@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Response cache for Gemini text generation
+In-memory LRU with TTL plus an optional on-disk tier that survives restarts
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write data to path so readers never see a partially written file"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ResponseCache:
+    """LRU + TTL cache for generated responses with an optional disk tier"""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = 3600,
+                 cache_dir: Optional[str] = None, max_disk_entries: int = 10000):
+        """
+        Initialize the response cache
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            ttl_seconds: Seconds before an entry expires (None keeps entries forever)
+            cache_dir: Directory for the on-disk tier. If not provided, the cache is memory-only
+            max_disk_entries: Maximum number of responses kept on disk
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # Scanned once here, then tracked on write so pruning does not walk the tree each time
+        self._disk_count = len(self._disk_files())
+
+    @staticmethod
+    def make_key(prompt: str, model_name: str, max_tokens: int, temperature: float,
+                 safety_settings: Any = None) -> str:
+        """Build a cache key from everything that influences the generated text"""
+        payload = json.dumps(
+            [prompt, model_name, max_tokens, temperature, safety_settings],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            str: Cached response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if not self._expired(created, now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        entry = self._read_disk(key, now)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, entry)
+            return entry[1]
+
+    def put(self, key: str, value: str):
+        """
+        Store a response
+
+        Args:
+            key: Key returned by make_key
+            value: Response text
+        """
+        entry = (time.time(), value)
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self):
+        """Remove every entry from memory and disk"""
+        with self._lock:
+            self._entries.clear()
+            self._disk_count = 0
+        for path in self._disk_files():
+            os.remove(path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created > self.ttl_seconds
+
+    def _store(self, key: str, entry: tuple):
+        # Caller holds the lock
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _disk_files(self) -> list:
+        if not self.cache_dir:
+            return []
+        paths = []
+        for root, _, files in os.walk(self.cache_dir):
+            paths.extend(os.path.join(root, name) for name in files if name.endswith('.json'))
+        return paths
+
+    def _read_disk(self, key: str, now: float) -> Optional[tuple]:
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._expired(data["created"], now):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        # Refresh mtime so disk pruning evicts least recently used entries first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data["created"], data["response"]
+
+    def _write_disk(self, key: str, entry: tuple):
+        if not self.cache_dir:
+            return
+        created, value = entry
+        path = self._disk_path(key)
+        is_new = not os.path.exists(path)
+        data = json.dumps({"created": created, "response": value}).encode('utf-8')
+        atomic_write_bytes(path, data)
+
+        with self._lock:
+            if is_new:
+                self._disk_count += 1
+            over_limit = self._disk_count > self.max_disk_entries
+        if over_limit:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Drop the oldest disk entries once the disk tier is over its bound"""
+        paths = self._disk_files()
+        overflow = len(paths) - self.max_disk_entries
+        if overflow <= 0:
+            with self._lock:
+                self._disk_count = len(paths)
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:overflow]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self.evictions += overflow
+            self._disk_count = len(paths) - overflow
@@ -1,39 +1,52 @@
 #!/usr/bin/env python3
 """
 Clean Gemini runner - suppresses all warnings
+Prompts go to the persistent Gemini worker, or to the in-process registry when no worker can be started
 """
 
 import os
-import sys
 import warnings
 
-# Suppress all warnings and redirect stderr
+# Suppress all warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 warnings.filterwarnings('ignore')
 
-# Redirect stderr to suppress Google's internal warnings
-class SuppressStderr:
-    def __enter__(self):
-        self._original_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
-        return self
+from typing import Dict, Optional
 
-    def __exit__(self, *args):
-        sys.stderr.close()
-        sys.stderr = self._original_stderr
+# Importing is cheap - the SDK itself is loaded on first use or by warm_up()
+from gemini_client import suppress_stderr
+from gemini_pool import get_registry
+from gemini_worker import GeminiWorkerClient, connect_worker
 
-# Now import and use Gemini
-with SuppressStderr():
-    from gemini_client import GeminiClient
+# Worker connection per session; None once the worker could not be reached
+_worker_clients: Dict[str, Optional[GeminiWorkerClient]] = {}
 
-def clean_gemini_prompt(prompt: str) -> str:
+
+def _worker_session(session_id: str) -> Optional[GeminiWorkerClient]:
+    if session_id not in _worker_clients:
+        _worker_clients[session_id] = connect_worker(session_id)
+    return _worker_clients[session_id]
+
+
+def clean_gemini_prompt(prompt: str, session_id: str = "default") -> str:
     """Run Gemini with no warnings"""
-    with SuppressStderr():
-        client = GeminiClient()
+    worker = _worker_session(session_id)
+    if worker is not None:
+        try:
+            return worker.prompt(prompt)
+        except (EOFError, OSError):
+            # The worker went away; carry on in-process
+            _worker_clients[session_id] = None
+
+    # Shared model; the session keeps its conversation between calls
+    client = get_registry().session(session_id)
+    with suppress_stderr():
         return client.simple_prompt(prompt)
 
 if __name__ == "__main__":
-    # Interactive mode
+    # Interactive mode - attach to the worker, or load the SDK while the user types the first message
+    if _worker_session("default") is None:
+        get_registry().warm_up()
     print("🤖 Clean Gemini AI Chat")
     print("Type your message and press Enter. Type 'quit' to exit.\n")
     
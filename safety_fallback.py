@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Hedged safety-fallback retries
+Sends rephrasings of a blocked prompt concurrently and keeps the first usable answer
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# Key used in the win statistics for the unmodified prompt
+ORIGINAL_PROMPT = "original"
+
+# Rephrasings in flight at once for a single call
+FALLBACK_WORKERS = 8
+
+
+class FallbackStrategy:
+    """Races rephrased prompts against a blocked one and learns which rephrasing wins"""
+
+    def __init__(self, templates: List[str], is_blocked: Callable[[str], bool],
+                 hedge_delay: Optional[float] = None, max_workers: int = FALLBACK_WORKERS):
+        """
+        Initialize the fallback strategy
+
+        Args:
+            templates: Rephrasing templates containing a {user_input} placeholder
+            is_blocked: Returns True when a response is the blocked fallback message
+            hedge_delay: Seconds to wait on a pending request before launching the next
+                rephrasing. If not provided, rephrasings only start once a response is blocked
+            max_workers: Most rephrasings one call sends at a time
+        """
+        self.templates = list(templates)
+        self.is_blocked = is_blocked
+        self.hedge_delay = hedge_delay
+        self.max_workers = max_workers
+
+        self.attempts = 0
+        self.wins: Dict[str, int] = {ORIGINAL_PROMPT: 0}
+        self.wins.update({template: 0 for template in self.templates})
+
+        self._lock = threading.Lock()
+
+    def ordered_templates(self) -> List[str]:
+        """Templates ordered by how often they produced the winning response"""
+        with self._lock:
+            return sorted(self.templates, key=lambda template: -self.wins[template])
+
+    def stats(self) -> Dict[str, object]:
+        """Get win counts per rephrasing"""
+        with self._lock:
+            return {"attempts": self.attempts, "wins": dict(self.wins)}
+
+    def _record(self, template: Optional[str]):
+        with self._lock:
+            self.attempts += 1
+            if template is not None:
+                self.wins[template] += 1
+
+    def _candidates(self, user_input: str) -> List[tuple]:
+        return [(template, template.format(user_input=user_input)) for template in self.ordered_templates()]
+
+    def _stagger(self, executor: ThreadPoolExecutor, queue: List[tuple], launched: Dict[Future, str],
+                 lock: threading.Lock, settled: threading.Event, generate: Callable[[str], str]):
+        """Launch one queued rephrasing per hedge_delay until the original prompt settles"""
+        while not settled.wait(self.hedge_delay):
+            with lock:
+                if settled.is_set() or not queue:
+                    return
+                template, alt_prompt = queue.pop(0)
+                launched[executor.submit(generate, alt_prompt)] = template
+
+    def resolve(self, prompt: str, user_input: str, generate: Callable[[str], str]) -> str:
+        """
+        Generate a response, falling back to concurrent rephrasings if it is blocked
+
+        The original prompt runs on the calling thread. Rephrasings are sent from a pool
+        owned by this call, so concurrent callers sharing the strategy never wait on
+        each other; only the win statistics are shared.
+
+        Args:
+            prompt: Prompt sent first
+            user_input: Raw user message the rephrasings are built from
+            generate: Blocking call returning the response text for a prompt
+
+        Returns:
+            str: The original response if it is not blocked, otherwise the first rephrased
+                response that is not, or the last blocked response
+
+        Raises:
+            Exception: If the original prompt failed with an error; rephrasings are only
+                tried when a response is blocked
+        """
+        queue = self._candidates(user_input)
+        launched: Dict[Future, str] = {}
+        lock = threading.Lock()
+        settled = threading.Event()
+        # Threads are only started when a rephrasing is submitted
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gemini-fallback")
+
+        if self.hedge_delay is not None and queue:
+            # Rephrasings start in the background while the original is pending
+            threading.Thread(target=self._stagger,
+                             args=(executor, queue, launched, lock, settled, generate),
+                             name="gemini-fallback-hedge", daemon=True).start()
+
+        try:
+            try:
+                response = generate(prompt)
+            except Exception:
+                # Auth, quota or network trouble is not a safety block; rephrasing won't help
+                self._record(None)
+                raise
+            finally:
+                settled.set()
+
+            if not self.is_blocked(response):
+                self._record(ORIGINAL_PROMPT)
+                return response
+            blocked_response = response
+
+            # Blocked - send the rephrasings not already launched all at once
+            with lock:
+                for template, alt_prompt in queue:
+                    launched[executor.submit(generate, alt_prompt)] = template
+                queue.clear()
+                pending = dict(launched)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    template = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception:
+                        continue
+                    if not self.is_blocked(response):
+                        self._record(template)
+                        return response
+                    blocked_response = response
+        finally:
+            # Queued rephrasings are dropped; requests already on the wire finish and are ignored
+            with lock:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        self._record(None)
+        return blocked_response
+
+    async def resolve_async(self, prompt: str, user_input: str,
+                            generate: Callable[[str], Awaitable[str]]) -> str:
+        """
+        Async version of resolve - losing requests are cancelled
+
+        Args:
+            prompt: Prompt sent first
+            user_input: Raw user message the rephrasings are built from
+            generate: Coroutine function returning the response text for a prompt
+
+        Returns:
+            str: First response that is not blocked, or the last blocked response
+
+        Raises:
+            Exception: If the original prompt failed with an error
+        """
+        queue = self._candidates(user_input)
+        launched = {asyncio.ensure_future(generate(prompt)): ORIGINAL_PROMPT}
+        blocked_response = None
+
+        try:
+            while launched:
+                timeout = self.hedge_delay if queue and self.hedge_delay is not None else None
+                done, _ = await asyncio.wait(launched, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    template, alt_prompt = queue.pop(0)
+                    launched[asyncio.ensure_future(generate(alt_prompt))] = template
+                    continue
+
+                for task in done:
+                    template = launched.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception:
+                        if template == ORIGINAL_PROMPT:
+                            # Auth, quota or network trouble is not a safety block; rephrasing won't help
+                            self._record(None)
+                            raise
+                        continue
+                    if not self.is_blocked(response):
+                        self._record(template)
+                        return response
+                    blocked_response = response
+
+                if blocked_response is None:
+                    continue
+                for template, alt_prompt in queue:
+                    launched[asyncio.ensure_future(generate(alt_prompt))] = template
+                queue = []
+        finally:
+            for task in launched:
+                task.cancel()
+
+        self._record(None)
+        return blocked_response
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Diarization analytics over Speech-to-Text words
+Speaker turns, talk time, overlaps, gaps and speaking rates, computed with vectorized NumPy passes
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from columnar_transcript import NO_SPEAKER, ColumnarTranscript
+
+
+def _as_transcript(transcript: Union[ColumnarTranscript, List[Dict[str, Any]], Dict[str, Any]]) -> ColumnarTranscript:
+    if isinstance(transcript, ColumnarTranscript):
+        return transcript
+    if isinstance(transcript, dict):
+        if isinstance(transcript.get("transcript"), ColumnarTranscript):
+            return transcript["transcript"]
+        return ColumnarTranscript.from_response(transcript)
+    return ColumnarTranscript.from_words(transcript)
+
+
+def speaker_turns(transcript: Union[ColumnarTranscript, List[Dict[str, Any]], Dict[str, Any]],
+                  max_pause: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Merge consecutive words of the same speaker into turns
+
+    Spacing tokens, audio events, and words without a speaker or timestamps are ignored.
+
+    Args:
+        transcript: ColumnarTranscript, list of word dicts, or speech-to-text result
+        max_pause: Split a speaker's run into separate turns at pauses longer than this (seconds)
+
+    Returns:
+        Dictionary of parallel arrays, one entry per turn: speaker (index into speakers),
+        start, end, words; plus the speakers tuple
+    """
+    transcript = _as_transcript(transcript)
+    words = transcript[transcript.type_mask("word") & (transcript.speaker_codes != NO_SPEAKER)
+                       & ~np.isnan(transcript.start) & ~np.isnan(transcript.end)]
+    codes, starts, ends = words.speaker_codes, words.start, words.end
+
+    if len(words) == 0:
+        empty = np.zeros(0)
+        return {"speaker": codes, "start": empty, "end": empty,
+                "words": np.zeros(0, dtype=np.int64), "speakers": transcript.speakers}
+
+    boundary = codes[1:] != codes[:-1]
+    if max_pause is not None:
+        boundary |= starts[1:] - ends[:-1] > max_pause
+    first = np.concatenate(([0], np.flatnonzero(boundary) + 1))
+
+    return {
+        "speaker": codes[first],
+        "start": starts[first],
+        "end": np.maximum.reduceat(ends, first),
+        "words": np.diff(np.append(first, len(words))),
+        "speakers": transcript.speakers
+    }
+
+
+def diarization_stats(transcript: Union[ColumnarTranscript, List[Dict[str, Any]], Dict[str, Any]],
+                      max_pause: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Summarize who spoke when
+
+    Overlap is time during which a turn starts before an earlier turn has ended; gaps
+    are silences between the end of all earlier turns and the start of the next one.
+
+    Args:
+        transcript: ColumnarTranscript, list of word dicts, or speech-to-text result
+        max_pause: Split a speaker's run into separate turns at pauses longer than this (seconds)
+
+    Returns:
+        Dictionary containing per-speaker talk_time, share, turns, words and
+        words_per_minute; overall duration, words_per_minute, turn_count,
+        overlap/gap totals and counts, longest_gap and longest_monologue
+    """
+    turns = speaker_turns(transcript, max_pause)
+    speakers = turns["speakers"]
+    codes, starts, ends, counts = turns["speaker"], turns["start"], turns["end"], turns["words"]
+
+    durations = ends - starts
+    talk_time = np.bincount(codes, weights=durations, minlength=len(speakers))
+    turn_count = np.bincount(codes, minlength=len(speakers))
+    word_count = np.bincount(codes, weights=counts, minlength=len(speakers)).astype(np.int64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speaker_wpm = np.where(talk_time > 0, word_count / (talk_time / 60), 0.0)
+
+    # Compare each turn with the latest end of all turns before it
+    latest_end = np.maximum.accumulate(ends)[:-1]
+    transition = starts[1:] - latest_end
+    overlaps = np.minimum(-transition, durations[1:])[transition < 0]
+    gaps = transition[transition > 0]
+
+    total_talk = float(talk_time.sum())
+    duration = float(ends.max() - starts[0]) if len(starts) else 0.0
+    total_words = int(counts.sum())
+
+    longest = None
+    if len(durations):
+        index = int(np.argmax(durations))
+        longest = {
+            "speaker_id": speakers[codes[index]],
+            "turn": index,
+            "start": float(starts[index]),
+            "end": float(ends[index]),
+            "duration": float(durations[index]),
+            "words": int(counts[index])
+        }
+
+    return {
+        "speakers": {
+            speaker_id: {
+                "talk_time": float(talk_time[code]),
+                "share": float(talk_time[code] / total_talk) if total_talk else 0.0,
+                "turns": int(turn_count[code]),
+                "words": int(word_count[code]),
+                "words_per_minute": float(speaker_wpm[code])
+            }
+            for code, speaker_id in enumerate(speakers) if turn_count[code]
+        },
+        "duration": duration,
+        "words": total_words,
+        "words_per_minute": total_words / (duration / 60) if duration else 0.0,
+        "turn_count": len(starts),
+        "overlap_time": float(overlaps.sum()),
+        "overlap_count": len(overlaps),
+        "gap_time": float(gaps.sum()),
+        "gap_count": len(gaps),
+        "longest_gap": float(gaps.max()) if len(gaps) else 0.0,
+        "longest_monologue": longest
+    }
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+11Labs Speech-to-Text service with batch transcription
+Transcribes many files, or long recordings in chunks, concurrently within the account's rate limits
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from columnar_transcript import ColumnarTranscript
+from config import Config
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from long_audio import encode_wav, find_split_points, load_audio, stitch_transcripts
+from rate_limiter import TokenBucket
+
+# Status codes worth retrying: rate limited or a temporary server-side failure
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def is_transient_failure(result: Dict[str, Any]) -> bool:
+    """Return whether a failed speech_to_text result is worth retrying"""
+    status_code = result.get("status_code")
+    if status_code is not None:
+        return status_code in TRANSIENT_STATUS_CODES
+    # Without a status code only connection failures and timeouts are worth another try;
+    # local errors (missing or undecodable files, bad arguments) would fail the same way again
+    return result.get("transient", False)
+
+
+class SpeechToTextService:
+    """Speech-to-Text front end with single-file and concurrent batch transcription"""
+
+    def __init__(self, api_key: Optional[str] = None, transport: Optional[ElevenLabsTransport] = None,
+                 service: Optional[ElevenLabsAudioService] = None,
+                 max_concurrency: Optional[int] = None, requests_per_second: Optional[float] = None,
+                 max_retries: Optional[int] = None, retry_delay: float = 1.0):
+        """
+        Initialize the Speech-to-Text service
+
+        Args:
+            api_key: 11Labs API key. If not provided, will use from environment
+            transport: HTTP transport to use. Defaults to the shared pooled transport
+            service: Audio service to send requests through. Built from api_key/transport if not provided
+            max_concurrency: Files transcribed at the same time. Defaults to Config.ELEVENLABS_MAX_CONCURRENCY
+            requests_per_second: Request rate ceiling. Defaults to Config.ELEVENLABS_RATE_LIMIT (0 = unlimited)
+            max_retries: Retries for a file after a transient failure. Defaults to 3
+            retry_delay: Seconds before the first retry, doubled on every further attempt
+            
+        When the transport has its own resilience layer (the shared transport does), it already
+        rate-limits and retries every request, so both default to off here.
+        """
+        self.service = service or ElevenLabsAudioService(api_key=api_key, transport=transport)
+        self.max_concurrency = max_concurrency or Config.ELEVENLABS_MAX_CONCURRENCY
+        resilient = self.service.transport.resilience is not None
+        if requests_per_second is None:
+            requests_per_second = 0 if resilient else Config.ELEVENLABS_RATE_LIMIT
+        if max_retries is None:
+            max_retries = 0 if resilient else 3
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def transcribe_audio(self, audio_file_path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe one file, retrying transient failures
+
+        Args:
+            audio_file_path: Path to the audio file
+            **kwargs: Additional parameters passed to speech_to_text (model_id, language_code, diarize, etc.)
+
+        Returns:
+            Dictionary containing the transcription, the file path, model and number of attempts
+        """
+        result = self._with_retries(lambda: self.service.speech_to_text(audio_file_path, **kwargs))
+        result["file_path"] = audio_file_path
+        result["model"] = kwargs.get('model_id', Config.STT_MODEL)
+        return result
+
+    def _with_retries(self, request: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Send a request within the rate limit, retrying transient failures with exponential backoff"""
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            result = request()
+            attempt += 1
+            if result["success"] or attempt > self.max_retries or not is_transient_failure(result):
+                break
+            time.sleep(self.retry_delay * 2 ** (attempt - 1))
+
+        result["attempts"] = attempt
+        return result
+
+    def transcribe_long_audio(self, audio_file_path: str, chunk_seconds: float = 60.0,
+                              overlap_seconds: float = 2.0, search_seconds: float = 10.0,
+                              **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe a long recording in chunks split on quiet regions
+
+        The audio is decoded locally, cut near every chunk_seconds at the quietest
+        frame, and the chunks are transcribed in parallel. Each chunk also re-sends
+        the overlap_seconds before its start, which lets speaker labels be matched
+        across chunks. A failed chunk is retried on its own.
+
+        Args:
+            audio_file_path: Path to the audio file
+            chunk_seconds: Longest chunk sent in one request
+            overlap_seconds: Audio shared with the previous chunk, used to match speakers
+            search_seconds: How far before each target boundary to look for a quiet frame
+            **kwargs: Additional parameters passed to speech_to_text (model_id, language_code, diarize, etc.)
+
+        Returns:
+            Dictionary containing the stitched text and words, plus per-chunk timing
+        """
+        if not os.path.exists(audio_file_path):
+            return {"success": False, "error": f"File not found: {audio_file_path}", "file_path": audio_file_path}
+
+        # Chunks come back as word dicts for stitching; the columnar form is built once at the end
+        columnar = kwargs.pop('columnar', False)
+
+        try:
+            samples, sample_rate = load_audio(audio_file_path)
+        except Exception as e:
+            return {"success": False, "error": f"Could not decode audio: {e}", "file_path": audio_file_path}
+
+        points = find_split_points(samples, sample_rate, chunk_seconds, search_seconds)
+        bounds = list(zip(points, points[1:] + [len(samples)]))
+        overlap = int(overlap_seconds * sample_rate)
+        name = os.path.splitext(os.path.basename(audio_file_path))[0]
+
+        def transcribe_chunk(index: int) -> Dict[str, Any]:
+            start, end = bounds[index]
+            audio = encode_wav(samples[max(0, start - overlap):end], sample_rate)
+            return self._with_retries(lambda: self.service.speech_to_text_data(
+                audio, f"{name}_{index}.wav", 'audio/wav', **kwargs))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(bounds)))) as executor:
+            results = list(executor.map(transcribe_chunk, range(len(bounds))))
+
+        failed = [index for index, result in enumerate(results) if not result["success"]]
+        if failed:
+            return {
+                "success": False,
+                "error": f"{len(failed)} of {len(bounds)} chunks failed: {results[failed[0]]['error']}",
+                "file_path": audio_file_path,
+                "failed_chunks": failed
+            }
+
+        words = stitch_transcripts([
+            (result["words"], max(0, start - overlap) / sample_rate, start / sample_rate)
+            for result, (start, _) in zip(results, bounds)
+        ])
+        result = {
+            "success": True,
+            "text": "".join(word["text"] for word in words).strip(),
+            "language": results[0]["language"],
+            "confidence": min(result["confidence"] for result in results),
+            "words": words,
+            "file_path": audio_file_path,
+            "model": kwargs.get('model_id', Config.STT_MODEL),
+            "duration": len(samples) / sample_rate,
+            "chunks": [
+                {"start": start / sample_rate, "end": end / sample_rate, "attempts": result["attempts"]}
+                for result, (start, end) in zip(results, bounds)
+            ]
+        }
+        if columnar:
+            result["transcript"] = ColumnarTranscript.from_words(result.pop("words"))
+        return result
+
+    def transcribe_multiple_files(self, audio_file_paths: List[str],
+                                  progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+                                  **kwargs) -> Dict[str, Any]:
+        """
+        Transcribe many files concurrently
+
+        Args:
+            audio_file_paths: Paths of the audio files
+            progress_callback: Called as progress_callback(completed, total, result) after each file finishes
+            **kwargs: Additional parameters passed to speech_to_text
+
+        Returns:
+            Dictionary containing the summary counts and the per-file results, in input order
+        """
+        total = len(audio_file_paths)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        completed = 0
+        lock = threading.Lock()
+        started = time.perf_counter()
+
+        def report(index: int, future):
+            nonlocal completed
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e), "file_path": audio_file_paths[index]}
+            results[index] = result
+            # Done-callbacks run on the worker threads
+            with lock:
+                completed += 1
+                done = completed
+            if progress_callback:
+                progress_callback(done, total, result)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, total))) as executor:
+            for index, path in enumerate(audio_file_paths):
+                future = executor.submit(self.transcribe_audio, path, **kwargs)
+                future.add_done_callback(lambda f, i=index: report(i, f))
+
+        successful = sum(1 for result in results if result["success"])
+        return {
+            "success": successful == total,
+            "total_files": total,
+            "successful_transcriptions": successful,
+            "failed_transcriptions": total - successful,
+            "results": results,
+            "total_time": time.perf_counter() - started
+        }
+
+    def get_service_info(self) -> Dict[str, Any]:
+        """Get information about the service"""
+        return {
+            "service": "11Labs Speech-to-Text",
+            "config": {
+                "default_model": Config.STT_MODEL,
+                "max_concurrency": self.max_concurrency,
+                "requests_per_second": self.rate_limiter.rate if self.rate_limiter else None,
+                "max_retries": self.max_retries
+            },
+            "base_url": self.service.base_url
+        }
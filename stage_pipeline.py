@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Queue-connected processing stages
+Each stage runs its own worker threads, so different items are in different stages at once
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+_DONE = object()
+
+
+class Stage:
+    """One pipeline step with a fixed number of worker threads and usage counters"""
+
+    def __init__(self, name: str, process: Callable[[Dict[str, Any]], Dict[str, Any]], workers: int = 1):
+        """
+        Initialize the stage
+
+        Args:
+            name: Name used in the stats
+            process: Function taking a job dict and returning it updated; set "success" to False to
+                make later stages pass the job through untouched
+            workers: Jobs processed at the same time
+        """
+        self.name = name
+        self.process = process
+        self.workers = workers
+        self.processed = 0
+        self.busy_time = 0.0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def stats(self, wall_time: float) -> Dict[str, Any]:
+        """Throughput and utilization of the stage over a run lasting wall_time seconds"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "processed": self.processed,
+                "busy_time": self.busy_time,
+                "throughput": self.processed / wall_time if wall_time else 0.0,
+                "utilization": self.busy_time / (self.workers * wall_time) if wall_time else 0.0
+            }
+
+    def _run(self, inbox: queue.Queue, outbox: queue.Queue, downstream_workers: int):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            index, job = item
+            if job.get("success", True):
+                started = time.perf_counter()
+                try:
+                    job = self.process(job)
+                except Exception as e:
+                    job["success"] = False
+                    job["error"] = f"{self.name} failed: {e}"
+                with self._lock:
+                    self.processed += 1
+                    self.busy_time += time.perf_counter() - started
+            outbox.put((index, job))
+
+        # The last worker out tells every downstream worker to stop
+        with self._lock:
+            self._active -= 1
+            last = self._active == 0
+        if last:
+            for _ in range(downstream_workers):
+                outbox.put(_DONE)
+
+
+def run_pipeline(jobs: Iterable[Dict[str, Any]], stages: List[Stage],
+                 queue_size: int = 8) -> Tuple[List[Dict[str, Any]], float]:
+    """
+    Push jobs through the stages, all stages running concurrently
+
+    Queues between stages hold at most queue_size jobs, so a slow stage holds back
+    the ones before it instead of letting work pile up in memory.
+
+    Args:
+        jobs: Job dicts to process
+        stages: Stages in order
+        queue_size: Capacity of each queue between stages
+
+    Returns:
+        tuple: (finished jobs in input order, wall time in seconds)
+
+    Raises:
+        Exception: Whatever iterating over jobs raised, after the jobs before it have finished
+    """
+    inboxes = [queue.Queue(maxsize=queue_size) for _ in stages]
+    results_queue: queue.Queue = queue.Queue()
+    outboxes = inboxes[1:] + [results_queue]
+    downstream = [stage.workers for stage in stages[1:]] + [1]
+
+    started = time.perf_counter()
+    threads = []
+    for stage, inbox, outbox, workers in zip(stages, inboxes, outboxes, downstream):
+        stage._active = stage.workers
+        for _ in range(stage.workers):
+            thread = threading.Thread(target=stage._run, args=(inbox, outbox, workers), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+    feed_errors: List[BaseException] = []
+
+    def feed():
+        try:
+            for index, job in enumerate(jobs):
+                inboxes[0].put((index, job))
+        except BaseException as e:
+            # Handed to the caller once the jobs already fed have drained
+            feed_errors.append(e)
+        finally:
+            for _ in range(stages[0].workers):
+                inboxes[0].put(_DONE)
+
+    threading.Thread(target=feed, daemon=True).start()
+
+    finished = {}
+    while True:
+        item = results_queue.get()
+        if item is _DONE:
+            break
+        index, job = item
+        finished[index] = job
+
+    for thread in threads:
+        thread.join()
+    if feed_errors:
+        raise feed_errors[0]
+    return [finished[index] for index in range(len(finished))], time.perf_counter() - started
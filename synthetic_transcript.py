@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Synthetic Speech-to-Text transcripts for benchmarks
+Produces responses in the 11Labs Scribe format at any length, deterministically
+"""
+
+import random
+from typing import Any, Dict, List
+
+VOCABULARY = ("the", "a", "we", "project", "meeting", "today", "think", "should", "really", "budget",
+              "design", "review", "next", "week", "because", "customer", "data", "model", "plan", "okay")
+
+
+def make_words(hours: float = 1.0, speakers: int = 3, words_per_minute: int = 150,
+               seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate word and spacing tokens covering `hours` of conversation
+
+    Speakers take turns of a few sentences; turns sometimes overlap slightly or leave a pause.
+
+    Args:
+        hours: Length of the conversation
+        speakers: Number of distinct speakers
+        words_per_minute: Average speaking rate
+        seed: Random seed
+
+    Returns:
+        list: Tokens as returned in the "words" field of a speech-to-text response
+    """
+    rng = random.Random(seed)
+    total_words = int(hours * 60 * words_per_minute)
+    word_seconds = 60.0 / words_per_minute
+    words: List[Dict[str, Any]] = []
+    t = 0.0
+    speaker = 0
+    while len(words) < total_words * 2:
+        for _ in range(rng.randint(5, 60)):
+            duration = word_seconds * rng.uniform(0.5, 0.9)
+            words.append({"text": rng.choice(VOCABULARY), "start": round(t, 3), "end": round(t + duration, 3),
+                          "type": "word", "speaker_id": f"speaker_{speaker}", "logprob": 0.0})
+            gap = word_seconds - duration
+            words.append({"text": " ", "start": round(t + duration, 3), "end": round(t + duration + gap, 3),
+                          "type": "spacing", "speaker_id": f"speaker_{speaker}", "logprob": 0.0})
+            t += word_seconds
+        # Next turn: a pause, or a short overlap with the end of this one
+        t += rng.uniform(-0.4, 1.5)
+        speaker = (speaker + rng.randint(1, speakers - 1)) % speakers if speakers > 1 else 0
+    return words[:total_words * 2]
+
+
+def make_response(hours: float = 1.0, **kwargs) -> Dict[str, Any]:
+    """Full speech-to-text response dict around make_words(hours, **kwargs)"""
+    words = make_words(hours, **kwargs)
+    return {
+        "language_code": "eng",
+        "language_probability": 0.99,
+        "text": "".join(word["text"] for word in words),
+        "words": words,
+        "transcription_id": "synthetic"
+    }
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the async Gemini client
+Uses an in-process stand-in model so no API key is needed
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from gemini_async_client import AsyncGeminiClient
+
+
+class FakeAsyncModel:
+    """Stand-in for GenerativeModel that records concurrency"""
+
+    def __init__(self, delay: float = 0.01, blocked_prompts=()):
+        self.delay = delay
+        self.blocked_prompts = blocked_prompts
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.calls.append(prompt)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if any(blocked in prompt for blocked in self.blocked_prompts):
+            return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=2)], text="")
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=1)], text=f"echo: {prompt}")
+
+
+def test_sessions_keep_separate_history():
+    model = FakeAsyncModel()
+    client = AsyncGeminiClient(model=model)
+
+    async def run():
+        await client.simple_prompt("hello", session_id="a")
+        await client.simple_prompt("hi", session_id="b")
+
+    asyncio.run(run())
+
+    assert [m["content"] for m in client.get_history("a")][0] == "hello"
+    assert [m["content"] for m in client.get_history("b")][0] == "hi"
+    assert len(client.get_history("a")) == 2
+
+
+def test_concurrency_limit_is_respected():
+    model = FakeAsyncModel(delay=0.02)
+    client = AsyncGeminiClient(max_concurrency=5, model=model)
+
+    prompts = {f"session-{i}": f"message {i}" for i in range(200)}
+    responses = asyncio.run(client.run_sessions(prompts))
+
+    assert len(responses) == 200
+    assert model.peak_in_flight == 5
+    assert responses["session-7"] == "echo: message 7"
+
+
+def test_safety_fallback_uses_alternative_prompts():
+    model = FakeAsyncModel(blocked_prompts=("weapon",))
+    client = AsyncGeminiClient(model=model)
+
+    response = asyncio.run(client.simple_prompt("organize weapon training"))
+
+    # Every rephrasing still contains the blocked word, so all four calls are made
+    assert "safety guidelines" in response
+    assert len(model.calls) == 4
+
+
+if __name__ == "__main__":
+    test_sessions_keep_separate_history()
+    test_concurrency_limit_is_respected()
+    test_safety_fallback_uses_alternative_prompts()
+    print("SUCCESS: Async Gemini client tests passed!")
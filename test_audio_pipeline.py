@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the pipelined transcribe-and-speak workflow
+Runs against a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+from stage_pipeline import Stage, run_pipeline
+
+
+def test_stages_overlap_and_keep_order():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer(latency=0.05) as server:
+        paths = []
+        for i in range(8):
+            path = os.path.join(tmp, f"clip_{i}.m4a")
+            with open(path, "wb") as f:
+                f.write(b"\x00" * 64)
+            paths.append(path)
+        paths.insert(3, os.path.join(tmp, "missing.m4a"))
+
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(pool_maxsize=8))
+        service.base_url = server.base_url
+        out_dir = os.path.join(tmp, "out")
+        os.mkdir(out_dir)
+
+        batch = service.transcribe_and_speak_many(paths, stt_workers=2, tts_workers=2, output_dir=out_dir)
+
+        assert batch["total_files"] == 9
+        assert batch["successful"] == 8 and batch["failed"] == 1
+        assert [result["original_audio"] for result in batch["results"]] == paths
+        assert batch["results"][3]["error"].startswith("STT failed")
+        assert batch["results"][0]["transcribed_text"] == "Hello world."
+        assert os.path.exists(os.path.join(out_dir, "processed_clip_0.m4a.mp3"))
+        assert len(os.listdir(out_dir)) == 8
+
+        # Run back to back, 16 requests of 50 ms take 0.8 s; two workers per stage overlap them
+        assert batch["total_time"] < 0.8 / 2
+        assert batch["stages"]["stt"]["processed"] == 9
+        assert batch["stages"]["tts"]["processed"] == 8
+        assert 0 < batch["stages"]["tts"]["utilization"] <= 1
+
+
+def test_bounded_queue_applies_backpressure():
+    lead = [0]
+    produced = [0]
+    consumed = [0]
+    lock = threading.Lock()
+
+    def fast(job):
+        with lock:
+            produced[0] += 1
+            lead[0] = max(lead[0], produced[0] - consumed[0])
+        return job
+
+    def slow(job):
+        time.sleep(0.01)
+        with lock:
+            consumed[0] += 1
+        job["success"] = True
+        return job
+
+    jobs = ({"n": n} for n in range(40))
+    results, _ = run_pipeline(jobs, [Stage("fast", fast), Stage("slow", slow)], queue_size=2)
+
+    assert [result["n"] for result in results] == list(range(40))
+    # At most: one job in the slow stage, two queued, one held by the fast worker
+    assert lead[0] <= 4
+
+
+def test_stage_exceptions_fail_the_job_only():
+    def explode(job):
+        if job["n"] == 1:
+            raise ValueError("boom")
+        return job
+
+    stages = [Stage("first", explode, workers=2), Stage("second", lambda job: dict(job, success=True))]
+    results, wall_time = run_pipeline(({"n": n} for n in range(3)), stages)
+
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[1]["error"] == "first failed: boom"
+    assert stages[1].stats(wall_time)["processed"] == 2
+
+
+def test_failing_job_source_is_raised():
+    processed = []
+
+    def jobs():
+        yield {"n": 0}
+        raise OSError("input folder went away")
+
+    def run():
+        try:
+            run_pipeline(jobs(), [Stage("only", lambda job: processed.append(job) or job)])
+        except OSError as e:
+            outcome.append(e)
+
+    outcome = []
+    # Run aside so a hang shows up as a failure rather than a stuck test run
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert str(outcome[0]) == "input folder went away"
+    assert processed == [{"n": 0}]
+
+
+if __name__ == "__main__":
+    test_stages_overlap_and_keep_order()
+    test_bounded_queue_applies_backpressure()
+    test_stage_exceptions_fail_the_job_only()
+    test_failing_job_source_is_raised()
+    print("SUCCESS: Audio pipeline tests passed!")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for audio preconditioning before STT upload
+Uses synthetic audio and a local stand-in server, no API key needed
+"""
+
+import io
+import os
+import tempfile
+
+import numpy as np
+import soundfile as sf
+
+from audio_preprocessing import (SEGMENT_GAP_SECONDS, detect_speech, precondition_samples, remap_timestamps,
+                                 resample, trim_silence)
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+
+RATE = 44100
+
+
+def stereo_recording(lead=1.0, voiced=2.0, tail=1.5):
+    """Stereo 44.1 kHz clip: silence, a 440 Hz tone with noise, silence"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(voiced * RATE)) / RATE
+    voice = 0.5 * np.sin(2 * np.pi * 440 * t) + 0.05 * rng.standard_normal(len(t))
+    mono = np.concatenate([np.zeros(int(lead * RATE)), voice, np.zeros(int(tail * RATE))])
+    return np.stack([mono, mono * 0.8], axis=1).astype(np.float32)
+
+
+def bursty_recording(bursts=((1.0, 2.0), (5.0, 6.5), (9.0, 9.5)), length=12.0):
+    """Mono clip with noisy tones at the given (start, end) seconds and faint noise elsewhere"""
+    rng = np.random.default_rng(1)
+    mono = 0.002 * rng.standard_normal(int(length * RATE))
+    for start, end in bursts:
+        t = np.arange(int((end - start) * RATE)) / RATE
+        mono[int(start * RATE):int(start * RATE) + len(t)] += 0.4 * np.sin(2 * np.pi * 220 * t)
+    return mono.astype(np.float32)
+
+
+def test_resample_keeps_speech_band():
+    t = np.arange(RATE) / RATE
+    tone = np.sin(2 * np.pi * 440 * t) + np.sin(2 * np.pi * 15000 * t)
+    out = resample(tone.astype(np.float32), RATE, 16000)
+
+    assert len(out) == 16000
+    spectrum = np.abs(np.fft.rfft(out))
+    # 440 Hz survives; 15 kHz is above the new Nyquist and must not alias into the band
+    assert spectrum[440] > 1000
+    assert spectrum[1000:8000].max() < spectrum[440] / 50
+
+
+def test_trim_finds_the_voiced_span():
+    mono = stereo_recording().mean(axis=1)
+    start, end = trim_silence(mono, RATE, pad_seconds=0.1)
+    assert abs(start / RATE - 0.9) < 0.03
+    assert abs(end / RATE - 3.1) < 0.03
+
+
+def test_precondition_shrinks_and_reports_offsets():
+    result = precondition_samples(stereo_recording(), RATE)
+    assert result["content_type"] == "audio/ogg" and result["sample_rate"] == 16000
+    assert abs(result["leading_trim"] - 0.9) < 0.03
+    assert abs(result["duration"] - 2.2) < 0.05
+    assert len(result["data"]) < stereo_recording().nbytes / 20
+
+    decoded, rate = sf.read(io.BytesIO(result["data"]))
+    assert rate == 16000 and decoded.ndim == 1
+
+
+def test_preconditioned_upload_maps_timestamps_back():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        path = os.path.join(tmp, "meeting.wav")
+        sf.write(path, stereo_recording(), RATE)
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+
+        plain = service.speech_to_text(path)
+        uploaded_plain = server.bytes_received
+        result = service.speech_to_text(path, precondition={"audio_format": "flac"})
+        uploaded_processed = server.bytes_received - uploaded_plain
+
+        assert result["success"]
+        report = result["preconditioning"]
+        assert report["bytes_saved"] > 0 and report["processed_bytes"] < report["original_bytes"] / 4
+        assert uploaded_processed < uploaded_plain / 4
+        # The stand-in returns the same words; here they are shifted by the trimmed lead-in
+        shift = result["words"][0]["start"] - plain["words"][0]["start"]
+        assert abs(shift - report["leading_trim"]) < 1e-3
+        assert result["raw_response"]["words"][0]["start"] == result["words"][0]["start"]
+
+
+def test_vad_finds_each_voiced_region():
+    regions = detect_speech(bursty_recording(), RATE, pad_seconds=0.1) / RATE
+    assert len(regions) == 3
+    assert np.allclose(regions, [[0.9, 2.1], [4.9, 6.6], [8.9, 9.6]], atol=0.03)
+
+    # Short pauses do not split a region, and silence yields nothing
+    assert len(detect_speech(bursty_recording(((1.0, 2.0), (2.3, 3.0))), RATE)) == 1
+    assert len(detect_speech(np.zeros(RATE, dtype=np.float32), RATE)) == 0
+
+
+def test_vad_keeps_quieter_speech_without_pauses():
+    # 30 s of loud speech straight into 30 s of speech 20 dB quieter: no silence to estimate a floor from
+    rng = np.random.default_rng(2)
+    t = np.arange(30 * RATE) / RATE
+    voice = np.sin(2 * np.pi * 180 * t) + 0.1 * rng.standard_normal(len(t))
+    samples = np.concatenate([0.4 * voice, 0.04 * voice]).astype(np.float32)
+
+    regions = detect_speech(samples, RATE) / RATE
+    assert regions.tolist() == [[0.0, 60.0]]
+    result = precondition_samples(samples, RATE, vad=True, audio_format="flac")
+    assert result["skipped_fraction"] < 0.01
+
+
+def test_remap_timestamps():
+    segments = [[0.0, 1.0, 2.0], [2.3, 5.0, 1.0]]
+    times = np.array([0.0, 1.5, 2.1, 2.3, 3.0, 3.5])
+    assert np.allclose(remap_timestamps(times, segments), [1.0, 2.5, 3.0, 5.0, 5.7, 6.2])
+
+
+def test_vad_upload_skips_silence_and_keeps_timestamps():
+    samples = bursty_recording()
+    result = precondition_samples(samples, RATE, vad=True, audio_format="flac")
+    segments = result["segments"]
+    assert len(segments) == 3
+    assert abs(result["skipped_fraction"] - (1 - result["voiced_duration"] / 12.0)) < 1e-9
+    assert result["skipped_fraction"] > 0.6
+    assert abs(result["duration"] - (result["voiced_duration"] + 2 * SEGMENT_GAP_SECONDS)) < 0.01
+
+    # Words placed at each burst in the uploaded clip land back on the original timeline
+    words = [{"text": "w", "start": segment[0] + 0.2, "end": segment[0] + 0.4, "type": "word",
+              "speaker_id": "speaker_0", "logprob": 0.0} for segment in segments]
+    with tempfile.TemporaryDirectory() as tmp, \
+            LocalElevenLabsServer(transcript={"text": "w w w", "words": words}) as server:
+        path = os.path.join(tmp, "meeting.wav")
+        sf.write(path, samples, RATE)
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+
+        for columnar in (False, True):
+            result = service.speech_to_text(path, precondition={"vad": True}, columnar=columnar)
+            assert result["success"]
+            starts = result["transcript"].start if columnar else [word["start"] for word in result["words"]]
+            expected = [segment[1] + 0.2 for segment in result["preconditioning"]["segments"]]
+            assert np.allclose(starts, expected, atol=1e-3)
+
+
+if __name__ == "__main__":
+    test_resample_keeps_speech_band()
+    test_trim_finds_the_voiced_span()
+    test_precondition_shrinks_and_reports_offsets()
+    test_preconditioned_upload_maps_timestamps_back()
+    test_vad_finds_each_voiced_region()
+    test_vad_keeps_quieter_speech_without_pauses()
+    test_remap_timestamps()
+    test_vad_upload_skips_silence_and_keeps_timestamps()
+    print("SUCCESS: Audio preconditioning tests passed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent batch transcription
+Runs against a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+import time
+
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+from rate_limiter import TokenBucket
+from speech_to_text_service import SpeechToTextService
+
+
+def make_files(directory, count):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"clip_{i}.m4a")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 64)
+        paths.append(path)
+    return paths
+
+
+def make_service(server, **kwargs):
+    service = SpeechToTextService(api_key="test", transport=ElevenLabsTransport(pool_maxsize=8), **kwargs)
+    service.service.base_url = server.base_url
+    return service
+
+
+def test_batch_runs_concurrently_and_keeps_order():
+    progress = []
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer(latency=0.05) as server:
+        paths = make_files(tmp, 16) + [os.path.join(tmp, "missing.m4a")]
+        service = make_service(server, max_concurrency=8, requests_per_second=0)
+
+        batch = service.transcribe_multiple_files(
+            paths, progress_callback=lambda done, total, result: progress.append((done, total)))
+
+        assert batch["total_files"] == 17
+        assert batch["successful_transcriptions"] == 16
+        assert batch["failed_transcriptions"] == 1
+        assert [result["file_path"] for result in batch["results"]] == paths
+        assert batch["results"][0]["text"] == "Hello world."
+        assert batch["results"][-1]["attempts"] == 1
+        assert sorted(progress) == [(i, 17) for i in range(1, 18)]
+        # 16 requests of 50 ms, 8 at a time
+        assert batch["total_time"] < 16 * 0.05 / 2
+
+
+def test_transient_failures_are_retried():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        paths = make_files(tmp, 3)
+        service = make_service(server, max_concurrency=1, requests_per_second=0, retry_delay=0.01)
+
+        server.fail_next(429, 503)
+        batch = service.transcribe_multiple_files(paths)
+        assert batch["successful_transcriptions"] == 3
+        assert batch["results"][0]["attempts"] == 3
+
+        # Client errors are not retried
+        server.fail_next(401)
+        result = service.transcribe_audio(paths[0])
+        assert not result["success"] and result["attempts"] == 1
+
+
+def test_only_connection_failures_are_retried_without_a_status():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_files(tmp, 1)
+        with LocalElevenLabsServer() as server:
+            service = make_service(server, max_retries=2, requests_per_second=0, retry_delay=0.01)
+
+        # Nothing listens on the port any more
+        result = service.transcribe_audio(paths[0])
+        assert not result["success"] and result["transient"] and result["attempts"] == 3
+
+        # Local failures happen before any request and are permanent
+        result = service.transcribe_audio(paths[0], precondition=True)
+        assert not result["success"] and "precondition" in result["error"] and result["attempts"] == 1
+
+
+def test_rate_limit_is_respected():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        paths = make_files(tmp, 6)
+        service = make_service(server, max_concurrency=6, requests_per_second=20)
+        service.rate_limiter = TokenBucket(20, capacity=1)
+
+        started = time.perf_counter()
+        batch = service.transcribe_multiple_files(paths)
+        assert batch["successful_transcriptions"] == 6
+        # First token is free, the other five arrive 50 ms apart
+        assert time.perf_counter() - started >= 0.24
+
+
+def test_token_bucket_timeout():
+    bucket = TokenBucket(1, capacity=1)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert not bucket.acquire(timeout=0.05)
+
+
+if __name__ == "__main__":
+    test_batch_runs_concurrently_and_keeps_order()
+    test_transient_failures_are_retried()
+    test_only_connection_failures_are_retried_without_a_status()
+    test_rate_limit_is_respected()
+    test_token_bucket_timeout()
+    print("SUCCESS: Batch transcription tests passed!")
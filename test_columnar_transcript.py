@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar transcript representation
+Uses the saved sample transcript and a local stand-in server, no API key needed
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from columnar_transcript import ColumnarTranscript
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+
+SAMPLE = "transcription_results_20251003_232901.json"
+
+
+def load_sample():
+    with open(SAMPLE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_round_trip_matches_the_api_dicts():
+    response = load_sample()
+    transcript = ColumnarTranscript.from_response(response)
+
+    assert len(transcript) == len(response["words"])
+    assert transcript.text == response["text"]
+    assert transcript.to_dicts() == response["words"]
+    assert transcript[5] == response["words"][5]
+
+
+def test_vectorized_filters_share_the_text_buffer():
+    response = load_sample()
+    transcript = ColumnarTranscript.from_response(response)
+
+    words = transcript.words_only()
+    expected = [w for w in response["words"] if w["type"] == "word"]
+    assert len(words) == len(expected)
+    assert words.text_buffer is transcript.text_buffer
+    assert [w["text"] for w in words.iter_dicts()] == [w["text"] for w in expected]
+    assert words.text == "".join(w["text"] for w in expected)
+
+    speaker = response["words"][0]["speaker_id"]
+    assert len(transcript.filter(speaker_id=speaker)) == sum(w["speaker_id"] == speaker for w in response["words"])
+    assert len(transcript.filter(speaker_id="nobody")) == 0
+
+    late = transcript[transcript.start > 2.0]
+    assert np.all(late.start > 2.0)
+
+
+def test_missing_fields_and_unknown_types():
+    transcript = ColumnarTranscript.from_words([
+        {"text": "(laughs)", "start": 1.0, "end": 1.5, "type": "audio_event"},
+        {"text": "hm", "start": 2.0, "end": 2.2, "type": "filler", "speaker_id": "speaker_3"},
+    ])
+    assert transcript[0]["speaker_id"] is None
+    assert np.isnan(transcript.logprob[0])
+    assert transcript[1]["type"] == "filler"
+    assert len(transcript.filter(word_type="audio_event")) == 1
+
+
+def test_missing_values_round_trip_as_none():
+    words = [{"text": "(music)", "start": None, "end": None, "type": "audio_event",
+              "speaker_id": None, "logprob": None}]
+    rebuilt = ColumnarTranscript.from_words(words).to_dicts()
+
+    assert rebuilt == words
+    # Standard JSON, no NaN literals
+    json.dumps(rebuilt, allow_nan=False)
+
+
+def test_speech_to_text_can_return_columnar_results():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        path = os.path.join(tmp, "clip.m4a")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 64)
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+
+        result = service.speech_to_text(path, columnar=True)
+        assert "words" not in result and "raw_response" not in result
+        assert result["transcript"].text == result["text"]
+        assert len(result["transcript"].words_only()) == 2
+
+
+if __name__ == "__main__":
+    test_round_trip_matches_the_api_dicts()
+    test_vectorized_filters_share_the_text_buffer()
+    test_missing_fields_and_unknown_types()
+    test_missing_values_round_trip_as_none()
+    test_speech_to_text_can_return_columnar_results()
+    print("SUCCESS: Columnar transcript tests passed!")
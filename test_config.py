@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for lazily loaded configuration
+"""
+
+import os
+
+from config import Config
+
+
+def reload_settings():
+    """Forget resolved settings so the next access reads the environment again"""
+    for name in Config._ENV_SETTINGS:
+        if name in Config.__dict__:
+            delattr(Config, name)
+
+
+def test_malformed_setting_keeps_its_default():
+    names = ("ELEVENLABS_POOL_SIZE", "ELEVENLABS_MAX_RETRIES")
+    saved = {name: os.environ.get(name) for name in names}
+    os.environ.update({"ELEVENLABS_POOL_SIZE": "ten", "ELEVENLABS_MAX_RETRIES": "7"})
+    reload_settings()
+    try:
+        assert Config.ELEVENLABS_POOL_SIZE == 10
+        # Other settings are unaffected by the bad one
+        assert Config.ELEVENLABS_MAX_RETRIES == 7
+        assert Config.ELEVENLABS_CIRCUIT_RESET == 30.0
+    finally:
+        for name, value in saved.items():
+            os.environ.pop(name)
+            if value is not None:
+                os.environ[name] = value
+        reload_settings()
+
+
+if __name__ == "__main__":
+    test_malformed_setting_keeps_its_default()
+    print("SUCCESS: Config tests passed!")
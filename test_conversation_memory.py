@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for token-budgeted conversation memory
+"""
+
+from conversation_memory import ConversationMemory, estimate_tokens, extractive_summarizer
+
+
+def test_first_message_is_returned_as_is():
+    memory = ConversationMemory()
+    memory.add("user", "Hello there")
+
+    assert memory.build_context_prompt() == "Hello there"
+
+
+def test_prompt_size_stays_flat_over_long_session():
+    memory = ConversationMemory(token_budget=400)
+    memory.add("user", "Please protect 8 hours of sleep. Everything else is flexible.")
+
+    sizes = []
+    for turn in range(200):
+        memory.add("assistant", f"Suggestion {turn}: move the gym session to the morning. " * 3)
+        memory.add("user", f"Question {turn} about my Tuesday plans?")
+        sizes.append(estimate_tokens(memory.build_context_prompt()))
+
+    assert max(sizes) <= 400
+    assert len(memory) < 20
+    # The earliest constraint survives compaction
+    assert "protect 8 hours of sleep" in memory.build_context_prompt()
+
+
+def test_later_instructions_in_a_turn_are_summarized():
+    turn = {"role": "user", "content": "Plan my week around the conference. It runs Tuesday to "
+                                       "Thursday in Lyon. Answer in French. Never book flights before 9am."}
+    summary = extractive_summarizer("", [turn, {"role": "assistant", "content": "D'accord."}])
+
+    assert summary == ("- User said: Plan my week around the conference. "
+                       "Answer in French. Never book flights before 9am.")
+
+
+def test_summarizer_only_sees_evicted_turns():
+    seen = []
+
+    def summarizer(summary, messages):
+        seen.append(len(messages))
+        return (summary + " " + " ".join(m["content"] for m in messages)).strip()
+
+    memory = ConversationMemory(token_budget=40, summary_budget=10, summarizer=summarizer)
+    for i in range(10):
+        memory.add("user", f"message number {i} with some padding text")
+
+    assert sum(seen) == 10 - len(memory)
+    assert "message number 0" in memory.summary
+
+
+if __name__ == "__main__":
+    test_first_message_is_returned_as_is()
+    test_prompt_size_stays_flat_over_long_session()
+    test_later_instructions_in_a_turn_are_summarized()
+    test_summarizer_only_sees_evicted_turns()
+    print("SUCCESS: Conversation memory tests passed!")
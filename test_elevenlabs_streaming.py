@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming text-to-speech
+Runs against a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from elevenlabs_tts_direct import ElevenLabsTTSDirect
+from local_elevenlabs_server import LocalElevenLabsServer
+
+AUDIO = bytes(range(256)) * 40
+
+
+def test_chunks_arrive_before_synthesis_finishes():
+    # 10 chunks, 20 ms apart: the first byte must not wait for the whole clip
+    with LocalElevenLabsServer(audio_bytes=AUDIO, stream_chunk_size=1024, chunk_delay=0.02) as server:
+        client = ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport())
+        client.base_url = server.base_url
+
+        received = []
+        result = client.stream_text_to_speech("hello", on_chunk=received.append, chunk_size=1024)
+
+        assert result["success"]
+        assert b"".join(received) == AUDIO
+        assert result["audio_size"] == len(AUDIO)
+        assert result["chunk_count"] == len(received) >= 10
+        assert "audio_data" not in result
+        assert result["time_to_first_byte"] < result["total_time"] / 2
+        assert result["total_time"] >= 0.15
+
+
+def test_iterator_and_file_sink():
+    with LocalElevenLabsServer(audio_bytes=AUDIO) as server:
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+
+        with service.iter_text_to_speech("hello") as stream:
+            assert b"".join(stream) == AUDIO
+            assert stream.metrics()["audio_size"] == len(AUDIO)
+            assert stream.time_to_first_byte <= stream.total_time
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "reply.mp3")
+            result = service.stream_text_to_speech("hello", save_to_file=True, filename=filename)
+            assert result["saved_file"] == filename
+            assert open(filename, "rb").read() == AUDIO
+            assert os.listdir(tmp) == ["reply.mp3"]
+
+
+def test_api_errors_are_reported():
+    with LocalElevenLabsServer() as server:
+        client = ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport())
+        client.base_url = server.base_url
+
+        server.fail_next(401)
+        result = client.stream_text_to_speech("hello")
+        assert not result["success"]
+        assert "401" in result["error"]
+
+        # The connection goes back to the pool after a failure
+        assert client.stream_text_to_speech("hello")["success"]
+        assert server.connections == 1
+
+
+if __name__ == "__main__":
+    test_chunks_arrive_before_synthesis_finishes()
+    test_iterator_and_file_sink()
+    test_api_errors_are_reported()
+    print("SUCCESS: Streaming TTS tests passed!")
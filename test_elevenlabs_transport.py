@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled 11Labs HTTP transport
+Runs against a local stand-in server, no API key needed
+"""
+
+import threading
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from elevenlabs_tts_direct import ElevenLabsTTSDirect
+from local_elevenlabs_server import LocalElevenLabsServer
+
+
+def test_connections_are_reused_across_clients():
+    transport = ElevenLabsTransport(pool_maxsize=2)
+
+    with LocalElevenLabsServer() as server:
+        service = ElevenLabsAudioService(api_key="test", transport=transport)
+        direct = ElevenLabsTTSDirect(api_key="test", transport=transport)
+        service.base_url = direct.base_url = server.base_url
+
+        for _ in range(10):
+            assert service.text_to_speech("hello")["success"]
+            assert direct.text_to_speech("hello")["success"]
+        assert direct.get_available_voices()["count"] == 1
+
+        assert server.requests == 21
+        assert server.connections == 1
+
+
+def test_concurrent_requests_are_bounded_by_pool_size():
+    transport = ElevenLabsTransport(pool_maxsize=4)
+    results = []
+
+    with LocalElevenLabsServer(latency=0.01) as server:
+        service = ElevenLabsAudioService(api_key="test", transport=transport)
+        service.base_url = server.base_url
+
+        def worker():
+            for _ in range(5):
+                results.append(service.text_to_speech("hello")["success"])
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(results) and len(results) == 80
+        assert server.connections <= 4
+
+
+if __name__ == "__main__":
+    test_connections_are_reused_across_clients()
+    test_concurrent_requests_are_bounded_by_pool_size()
+    print("SUCCESS: Transport tests passed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-turn chat with seeded history
+Uses an in-process stand-in model so no API key is needed
+"""
+
+from types import SimpleNamespace
+
+from gemini_client import GeminiClient
+
+
+class FakeChat:
+    def __init__(self, model, history):
+        self.model = model
+        self.history = list(history)
+
+    def send_message(self, content, generation_config=None):
+        self.model.requests.append(self.history + [{"role": "user", "parts": [content]}])
+        reply = f"reply {len(self.model.requests)}"
+        self.history += [{"role": "user", "parts": [content]}, {"role": "model", "parts": [reply]}]
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=1)], text=reply)
+
+
+class FakeChatModel:
+    def __init__(self):
+        self.requests = []
+        self.started = 0
+
+    def start_chat(self, history=None):
+        self.started += 1
+        return FakeChat(self, history or [])
+
+
+def make_client():
+    return GeminiClient(model=FakeChatModel())
+
+
+def test_history_is_sent_in_one_request():
+    client = make_client()
+    messages = [
+        {"role": "user", "content": "My Tuesdays are too hectic"},
+        {"role": "assistant", "content": "What feels least essential?"},
+        {"role": "user", "content": "The late meeting"},
+        {"role": "assistant", "content": "Could it move to Wednesday?"},
+        {"role": "user", "content": "Yes, do that"},
+    ]
+
+    reply = client.chat_with_context(messages)
+
+    assert reply == "reply 1"
+    assert len(client.model.requests) == 1
+    sent = client.model.requests[0]
+    assert [entry["role"] for entry in sent] == ["user", "model", "user", "model", "user"]
+
+
+def test_live_session_is_extended_not_rebuilt():
+    client = make_client()
+    messages = [{"role": "user", "content": "Hello"}]
+
+    for turn in range(5):
+        reply = client.chat_with_context(messages, conversation_id="abc")
+        messages += [{"role": "assistant", "content": reply}, {"role": "user", "content": f"follow-up {turn}"}]
+
+    assert client.model.started == 1
+    assert len(client.model.requests) == 5
+
+
+def test_edited_history_reseeds_session():
+    client = make_client()
+    client.chat_with_context([{"role": "user", "content": "Hello"}], conversation_id="abc")
+
+    client.chat_with_context([
+        {"role": "user", "content": "Hi instead"},
+        {"role": "assistant", "content": "reply 1"},
+        {"role": "user", "content": "Next"},
+    ], conversation_id="abc")
+
+    assert client.model.started == 2
+
+
+if __name__ == "__main__":
+    test_history_is_sent_in_one_request()
+    test_live_session_is_extended_not_rebuilt()
+    test_edited_history_reseeds_session()
+    print("SUCCESS: Gemini chat context tests passed!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Gemini client registry
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from gemini_client import load_sdk
+from gemini_pool import GeminiRegistry
+
+
+class SlowBlockingModel:
+    """Takes a while per call and blocks everything but one rephrasing"""
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        time.sleep(0.3)
+        finish_reason = 1 if prompt.startswith("Can you help") else 2
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=finish_reason)], text=f"ok: {prompt}")
+
+
+def test_models_are_built_once_and_shared():
+    built = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    registry = GeminiRegistry(pool_size=2, model_factory=factory)
+
+    clients = [registry.session(f"s{i}") for i in range(6)]
+
+    assert len(built) == 2
+    assert {id(client.model) for client in clients} == {id(model) for model in built}
+    assert registry.session("s0") is clients[0]
+
+
+def test_concurrent_first_use_builds_one_pool():
+    built = []
+    registry = GeminiRegistry(pool_size=1, model_factory=lambda: built.append(1) or object())
+    sessions = []
+
+    threads = [threading.Thread(target=lambda: sessions.append(registry.session("shared"))) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1
+    assert len({id(client) for client in sessions}) == 1
+
+
+def test_sessions_are_bounded():
+    registry = GeminiRegistry(model_factory=object, max_sessions=3)
+    for i in range(5):
+        registry.session(f"s{i}")
+
+    assert list(registry.sessions) == ["s2", "s3", "s4"]
+
+
+def test_sessions_share_one_fallback_strategy():
+    registry = GeminiRegistry(model_factory=object)
+    first, second = registry.session("a"), registry.session("b")
+    assert first.fallback is second.fallback is registry.fallback
+
+
+def test_blocked_sessions_fan_out_in_parallel():
+    registry = GeminiRegistry(model_factory=SlowBlockingModel)
+    clients = [registry.session(f"s{i}") for i in range(12)]
+    responses = []
+    # Keep the one-off SDK import out of the timing
+    load_sdk()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=lambda c=client: responses.append(c.simple_prompt("book it")))
+               for client in clients]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    assert all(response.startswith("ok: Can you help") for response in responses)
+    # Blocked original then one round of rephrasings, for every session at once
+    assert elapsed < 0.3 * 3
+    assert registry.fallback.stats()["attempts"] == 12
+
+
+if __name__ == "__main__":
+    test_models_are_built_once_and_shared()
+    test_concurrent_first_use_builds_one_pool()
+    test_sessions_are_bounded()
+    test_sessions_share_one_fallback_strategy()
+    test_blocked_sessions_fan_out_in_parallel()
+    print("SUCCESS: Gemini registry tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming Gemini responses
+Uses an in-process stand-in model so no API key is needed
+"""
+
+from types import SimpleNamespace
+
+from gemini_client import GeminiClient, iter_sentences
+
+
+class FakeStreamResponse:
+    """Mimics a streamed GenerateContentResponse"""
+
+    def __init__(self, chunks, finish_reason=1):
+        self.chunks = chunks
+        self.candidates = [SimpleNamespace(finish_reason=finish_reason)]
+
+    def __iter__(self):
+        for text in self.chunks:
+            yield SimpleNamespace(text=text)
+
+
+class FakeStreamingModel:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        self.prompts.append(prompt)
+        return self.responses.pop(0)
+
+
+def make_client(responses):
+    return GeminiClient(model=FakeStreamingModel(responses))
+
+
+def test_stream_prompt_yields_chunks_and_records_history():
+    client = make_client([FakeStreamResponse(["Sleep is ", "important. ", "Aim for 8 hours."])])
+
+    chunks = list(client.stream_prompt("How much sleep?"))
+
+    assert chunks == ["Sleep is ", "important. ", "Aim for 8 hours."]
+    assert client.get_history()[-1] == {"role": "assistant", "content": "Sleep is important. Aim for 8 hours."}
+
+
+def test_stream_prompt_retries_safety_block():
+    client = make_client([
+        FakeStreamResponse([], finish_reason=2),
+        FakeStreamResponse(["Here is a plan."]),
+    ])
+
+    chunks = list(client.stream_prompt("book a client meeting"))
+
+    assert chunks == ["Here is a plan."]
+    assert client.model.prompts[1].startswith("Please help me organize this:")
+
+
+def test_stream_text_flags_truncated_answer():
+    client = make_client([FakeStreamResponse(["Partial answer"], finish_reason=5)])
+
+    chunks = list(client.stream_text("Explain everything"))
+
+    assert chunks[0] == "Partial answer"
+    assert "too long" in chunks[-1]
+
+
+def test_iter_sentences_regroups_chunks():
+    sentences = list(iter_sentences(["Hello the", "re. How are", " you? Fine"]))
+
+    assert sentences == ["Hello there.", "How are you?", "Fine"]
+
+
+if __name__ == "__main__":
+    test_stream_prompt_yields_chunks_and_records_history()
+    test_stream_prompt_retries_safety_block()
+    test_stream_text_flags_truncated_answer()
+    test_iter_sentences_regroups_chunks()
+    print("SUCCESS: Gemini streaming tests passed!")
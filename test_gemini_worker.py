@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent Gemini worker
+Runs the worker in a thread with an in-process stand-in model
+"""
+
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+
+from gemini_worker import GeminiWorker, GeminiWorkerClient, default_address, runtime_dir
+
+
+class EchoModel:
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        reply = SimpleNamespace(candidates=[SimpleNamespace(finish_reason=1)], text=f"echo: {prompt[-20:]}")
+        return FakeStream(reply) if stream else reply
+
+
+class FakeStream:
+    def __init__(self, reply):
+        self.candidates = reply.candidates
+        self.text = reply.text
+
+    def __iter__(self):
+        for start in range(0, len(self.text), 4):
+            yield SimpleNamespace(text=self.text[start:start + 4])
+
+
+def start_worker():
+    return start_worker_at(os.path.join(tempfile.mkdtemp(), "worker.sock"))
+
+
+def start_worker_at(address):
+    worker = GeminiWorker(address, model=EchoModel())
+    thread = threading.Thread(target=worker.serve_forever, daemon=True)
+    thread.start()
+    return worker, thread, address
+
+
+def connect(address, session_id):
+    # The listener may need a moment to bind
+    for _ in range(50):
+        try:
+            return GeminiWorkerClient(session_id, address=address, autostart=False)
+        except (FileNotFoundError, ConnectionRefusedError):
+            threading.Event().wait(0.02)
+    raise AssertionError("worker did not start")
+
+
+def test_sessions_stay_warm_across_front_ends():
+    worker, thread, address = start_worker()
+
+    first = connect(address, "chat")
+    first.prompt("hello")
+    first.close()
+
+    # A second front-end attaches to the same conversation
+    second = connect(address, "chat")
+    second.prompt("second message")
+    assert len(second.get_history()) == 4
+
+    other = connect(address, "silent")
+    assert other.get_history() == []
+    assert "".join(other.stream("stream me")).startswith("echo:")
+
+    other.shutdown()
+    second.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not os.path.exists(address)
+
+
+def test_abandoned_stream_does_not_desync_the_connection():
+    worker, thread, address = start_worker()
+    client = connect(address, "chat")
+
+    stream = client.stream("a long streamed answer")
+    next(stream)
+    stream.close()
+    assert client.prompt("next question").startswith("echo:")
+    assert len(client.get_history()) == 4
+
+    client.shutdown()
+    thread.join(timeout=5)
+
+
+def test_second_worker_does_not_take_over_the_address():
+    worker, thread, address = start_worker()
+    client = connect(address, "chat")
+    client.prompt("hello")
+
+    # A racing second worker backs off instead of replacing the socket
+    assert GeminiWorker(address, model=EchoModel()).serve_forever() is False
+    assert len(client.get_history()) == 2
+
+    client.shutdown()
+    thread.join(timeout=5)
+
+    # Once the first has exited, a stale socket file does not block a new worker
+    open(address, "w").close()
+    worker, thread, address = start_worker_at(address)
+    connect(address, "chat").shutdown()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_concurrent_clients():
+    worker, thread, address = start_worker()
+    errors = []
+
+    def run(i):
+        try:
+            client = connect(address, f"session-{i}")
+            for n in range(5):
+                client.prompt(f"message {n}")
+            client.close()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(worker.sessions) == 8
+    connect(address, "admin").shutdown()
+    thread.join(timeout=5)
+
+
+def test_socket_lives_in_a_private_directory():
+    saved_runtime, saved_tempdir = os.environ.pop("XDG_RUNTIME_DIR", None), tempfile.tempdir
+    try:
+        tempfile.tempdir = tempfile.mkdtemp()
+        directory = runtime_dir()
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+        assert os.path.dirname(default_address()) == directory
+
+        # A directory someone else could write to is refused
+        os.chmod(directory, 0o777)
+        try:
+            runtime_dir()
+            assert False, "expected PermissionError"
+        except PermissionError:
+            pass
+
+        os.environ["XDG_RUNTIME_DIR"] = tempfile.tempdir
+        assert default_address() == os.path.join(tempfile.tempdir, "gemini-worker.sock")
+    finally:
+        tempfile.tempdir = saved_tempdir
+        os.environ.pop("XDG_RUNTIME_DIR", None)
+        if saved_runtime is not None:
+            os.environ["XDG_RUNTIME_DIR"] = saved_runtime
+
+
+def test_run_gemini_clean_attaches_to_the_worker():
+    saved_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    os.environ["XDG_RUNTIME_DIR"] = tempfile.mkdtemp()
+    try:
+        worker, thread, address = start_worker_at(default_address())
+        connect(address, "admin").close()
+
+        import run_gemini_clean
+        assert run_gemini_clean.clean_gemini_prompt("hello", "clean").startswith("echo:")
+        assert "clean" in worker.sessions
+
+        run_gemini_clean._worker_clients.pop("clean").shutdown()
+        thread.join(timeout=5)
+    finally:
+        os.environ.pop("XDG_RUNTIME_DIR")
+        if saved_runtime is not None:
+            os.environ["XDG_RUNTIME_DIR"] = saved_runtime
+
+
+if __name__ == "__main__":
+    test_sessions_stay_warm_across_front_ends()
+    test_abandoned_stream_does_not_desync_the_connection()
+    test_second_worker_does_not_take_over_the_address()
+    test_concurrent_clients()
+    test_socket_lives_in_a_private_directory()
+    test_run_gemini_clean_attaches_to_the_worker()
+    print("SUCCESS: Gemini worker tests passed!")
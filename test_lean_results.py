@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for lean TTS/STT results
+Runs against a local stand-in server, no API key needed
+"""
+
+import json
+import os
+import tempfile
+import tracemalloc
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_streaming import audio_view
+from elevenlabs_transport import ElevenLabsTransport
+from elevenlabs_tts_direct import ElevenLabsTTSDirect
+from local_elevenlabs_server import LocalElevenLabsServer
+from tts_cache import TTSCache
+
+AUDIO = bytes(range(256)) * 16384  # 4 MiB
+
+
+def test_lean_tts_streams_to_file_and_returns_metadata():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer(audio_bytes=AUDIO) as server:
+        client = ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport())
+        client.base_url = server.base_url
+        filename = os.path.join(tmp, "reply.mp3")
+
+        result = client.text_to_speech("hello", save_to_file=True, filename=filename, lean=True)
+        assert result["success"]
+        assert "audio_data" not in result
+        assert result["audio_size"] == result["file_size"] == len(AUDIO)
+
+        view = audio_view(filename)
+        assert view[:256] == AUDIO[:256] and len(view) == len(AUDIO)
+        view.release()
+
+        unsaved = client.text_to_speech("hello", lean=True)
+        assert isinstance(unsaved["audio_data"], memoryview)
+        assert unsaved["audio_data"].readonly and bytes(unsaved["audio_data"]) == AUDIO
+
+
+def test_lean_tts_peak_memory_is_flat():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer(audio_bytes=AUDIO) as server:
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+        filename = os.path.join(tmp, "reply.mp3")
+
+        peaks = {}
+        for lean in (False, True):
+            tracemalloc.start()
+            result = service.text_to_speech("hello", save_to_file=True, filename=filename, lean=lean)
+            peaks[lean] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert result["success"] and os.path.getsize(filename) == len(AUDIO)
+            del result
+
+        assert peaks[True] < len(AUDIO) / 4 < peaks[False]
+
+
+def test_lean_tts_with_cache_still_fills_the_cache():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer(audio_bytes=b"abc") as server:
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(),
+                                         cache=TTSCache(os.path.join(tmp, "cache")))
+        service.base_url = server.base_url
+        filename = os.path.join(tmp, "reply.mp3")
+
+        for _ in range(2):
+            result = service.text_to_speech("hello", save_to_file=True, filename=filename, lean=True)
+            assert "audio_data" not in result and open(filename, "rb").read() == b"abc"
+        assert result["cached"] and server.requests == 1
+
+
+def test_lean_stt_keeps_one_copy_of_the_transcript():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        path = os.path.join(tmp, "clip.m4a")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 64)
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())
+        service.base_url = server.base_url
+
+        full = service.speech_to_text(path)
+        lean = service.speech_to_text(path, lean=True)
+
+        assert "raw_response" not in lean
+        assert lean["words"] == full["words"] and lean["text"] == full["text"]
+        assert len(json.dumps(lean)) < len(json.dumps(full)) * 0.6
+
+
+def test_lean_tts_errors_keep_the_status_code():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        filename = os.path.join(tmp, "reply.mp3")
+        for client in (ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport()),
+                       ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport())):
+            client.base_url = server.base_url
+            server.fail_next(503, 503)
+            lean = client.text_to_speech("hello", save_to_file=True, filename=filename, lean=True)
+            plain = client.text_to_speech("hello", save_to_file=True, filename=filename)
+            assert not lean["success"] and lean["status_code"] == plain["status_code"] == 503
+            assert not os.path.exists(filename)
+
+
+if __name__ == "__main__":
+    test_lean_tts_streams_to_file_and_returns_metadata()
+    test_lean_tts_peak_memory_is_flat()
+    test_lean_tts_with_cache_still_fills_the_cache()
+    test_lean_stt_keeps_one_copy_of_the_transcript()
+    test_lean_tts_errors_keep_the_status_code()
+    print("SUCCESS: Lean result tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for chunked long-audio transcription
+Uses synthetic audio and a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import soundfile as sf
+
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+from long_audio import find_split_points, stitch_transcripts
+from speech_to_text_service import SpeechToTextService
+
+SAMPLE_RATE = 16000
+# Quiet gaps (start, end) in seconds in the synthetic recording
+GAPS = [(8.0, 8.6), (17.2, 17.8)]
+
+
+def synthetic_speech(seconds=25.0):
+    """Noise bursts standing in for speech, with silent gaps at GAPS"""
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.3).astype(np.float32)
+    for start, end in GAPS:
+        samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] *= 0.001
+    return samples
+
+
+def word(text, start, end, speaker):
+    return {"text": text, "start": start, "end": end, "type": "word", "speaker_id": speaker}
+
+
+def test_splits_land_in_quiet_gaps():
+    points = find_split_points(synthetic_speech(), SAMPLE_RATE, chunk_seconds=10, search_seconds=3)
+    assert len(points) == 3
+    for point, (start, end) in zip(points[1:], GAPS):
+        assert start <= point / SAMPLE_RATE <= end
+
+
+def test_stitching_shifts_times_and_matches_speakers():
+    first = [word("Hi", 0.5, 0.8, "speaker_0"), word("there", 8.5, 8.9, "speaker_1")]
+    # Second chunk starts at 10 s but its audio begins at 8 s; the API numbers its speakers afresh
+    second = [word("there", 0.52, 0.9, "speaker_0"), word("Bye", 3.0, 3.4, "speaker_0"),
+              word("now", 4.0, 4.3, "speaker_1"), word("Ok", 5.0, 5.2, "speaker_2")]
+
+    words = stitch_transcripts([(first, 0.0, 0.0), (second, 8.0, 10.0)])
+
+    assert [w["text"] for w in words] == ["Hi", "there", "Bye", "now", "Ok"]
+    assert words[2]["start"] == 11.0 and words[2]["end"] == 11.4
+    # speaker_0 of the second chunk said "there", so it is speaker_1; the others cannot be matched
+    assert [w["speaker_id"] for w in words] == ["speaker_0", "speaker_1", "speaker_1", "speaker_2", "speaker_3"]
+
+
+def test_untimed_audio_events_are_stitched_unshifted():
+    laughter = {"text": "(laughter)", "start": None, "end": None, "type": "audio_event"}
+    first = [word("Hi", 0.5, 0.8, "speaker_0"), dict(laughter), word("there", 8.5, 8.9, "speaker_0")]
+    second = [word("there", 0.52, 0.9, "speaker_0"), dict(laughter, text="(overlap)"),
+              word("Bye", 3.0, 3.4, "speaker_0"), dict(laughter)]
+
+    words = stitch_transcripts([(first, 0.0, 0.0), (second, 8.0, 10.0)])
+
+    assert [w["text"] for w in words] == ["Hi", "(laughter)", "there", "Bye", "(laughter)"]
+    assert words[1]["start"] is None and words[4]["end"] is None
+    assert words[3]["start"] == 11.0 and words[3]["speaker_id"] == "speaker_0"
+
+
+def test_long_file_is_transcribed_in_chunks():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        path = os.path.join(tmp, "lecture.wav")
+        sf.write(path, synthetic_speech(), SAMPLE_RATE)
+
+        service = SpeechToTextService(api_key="test", transport=ElevenLabsTransport(),
+                                      max_concurrency=4, requests_per_second=0, retry_delay=0.01)
+        service.service.base_url = server.base_url
+
+        # One chunk fails once and is retried on its own
+        server.fail_next(503)
+        result = service.transcribe_long_audio(path, chunk_seconds=10, overlap_seconds=0, search_seconds=3)
+
+        assert result["success"]
+        assert len(result["chunks"]) == 3
+        assert server.requests == 4
+        assert sorted(chunk["attempts"] for chunk in result["chunks"]) == [1, 1, 2]
+        assert result["text"].count("Hello world.") == 3
+        starts = [w["start"] for w in result["words"]]
+        assert starts == sorted(starts)
+        assert starts[-1] > result["chunks"][-1]["start"]
+        assert abs(result["duration"] - 25.0) < 1e-6
+
+
+if __name__ == "__main__":
+    test_splits_land_in_quiet_gaps()
+    test_stitching_shifts_times_and_matches_speakers()
+    test_untimed_audio_events_are_stitched_unshifted()
+    test_long_file_is_transcribed_in_chunks()
+    print("SUCCESS: Long-audio transcription tests passed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for sentence-chunked parallel TTS
+Runs against fake synthesizers and a local stand-in server, no API key needed
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from local_elevenlabs_server import LocalElevenLabsServer
+from parallel_tts import ParallelTTS, split_for_speech
+
+REPLY = " ".join(f"This is sentence number {i} of a long reply." for i in range(12))
+
+
+def test_split_keeps_text_and_isolates_first_sentence():
+    chunks = split_for_speech(REPLY, max_chars=120)
+    assert chunks[0] == "This is sentence number 0 of a long reply."
+    assert all(len(chunk) <= 120 for chunk in chunks)
+    assert " ".join(chunks) == REPLY
+
+    long_sentence = ", ".join(["a clause that keeps going"] * 20) + "."
+    clauses = split_for_speech(long_sentence, max_chars=100)
+    assert len(clauses) > 1 and all(len(chunk) <= 100 for chunk in clauses)
+    assert " ".join(clauses) == long_sentence
+
+    assert split_for_speech("   ") == []
+
+
+def test_tts_layer_does_not_load_the_gemini_client():
+    check = "import sys, parallel_tts; sys.exit('gemini_client' in sys.modules)"
+    here = os.path.dirname(os.path.abspath(__file__))
+    assert subprocess.run([sys.executable, "-c", check], cwd=here).returncode == 0
+
+
+def test_audio_is_emitted_in_order_and_in_parallel():
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def synthesize(chunk):
+        with lock:
+            active.append(chunk)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(random.uniform(0.01, 0.05))
+        with lock:
+            active.remove(chunk)
+        return {"success": True, "audio_data": chunk.encode()}
+
+    received = []
+    result = ParallelTTS(synthesize, max_workers=4, max_chars=50).run(REPLY, on_chunk=received.append)
+
+    assert result["success"]
+    assert b" ".join(received).decode() == REPLY
+    assert result["chunk_count"] == len(split_for_speech(REPLY, 50))
+    assert 1 < peak[0] <= 4
+    assert result["time_to_first_audio"] < result["total_time"]
+
+
+def test_failed_chunk_stops_the_pipeline():
+    def synthesize(chunk):
+        if "number 3" in chunk:
+            return {"success": False, "error": "API error: 500"}
+        return {"success": True, "audio_data": b"x"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "reply.mp3")
+        result = ParallelTTS(synthesize, max_chars=50).run(REPLY, filename=filename)
+        assert not result["success"]
+        assert "API error: 500" in result["error"]
+        assert result["completed_chunks"] == 3
+        assert os.listdir(tmp) == []
+
+
+def test_service_wall_time_tracks_slowest_chunk():
+    with LocalElevenLabsServer(latency=0.1) as server:
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(pool_maxsize=8))
+        service.base_url = server.base_url
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "reply.mp3")
+            result = service.text_to_speech_chunked(REPLY, max_workers=8, max_chars=50,
+                                                    save_to_file=True, filename=filename)
+            assert result["success"]
+            assert result["chunk_count"] >= 8
+            assert os.path.getsize(filename) == result["audio_size"]
+
+        # Sequential synthesis would take chunk_count * 100 ms
+        assert result["total_time"] < result["chunk_count"] * 0.1 / 2
+
+
+if __name__ == "__main__":
+    test_split_keeps_text_and_isolates_first_sentence()
+    test_tts_layer_does_not_load_the_gemini_client()
+    test_audio_is_emitted_in_order_and_in_parallel()
+    test_failed_chunk_stops_the_pipeline()
+    test_service_wall_time_tracks_slowest_chunk()
+    print("SUCCESS: Parallel TTS tests passed!")
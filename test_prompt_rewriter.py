@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test script for the precompiled prompt rewriter
+"""
+
+import json
+import tempfile
+
+from prompt_rewriter import PromptRewriter
+
+
+def test_whole_words_only():
+    rewriter = PromptRewriter()
+
+    assert rewriter.rewrite("booking a book") == "booking a arrange"
+    assert rewriter.rewrite("our clients and one client") == "our contacts and one contact"
+    assert rewriter.rewrite("rescheduled") == "rescheduled"
+
+
+def test_case_is_preserved():
+    rewriter = PromptRewriter()
+
+    assert rewriter.rewrite("Schedule a MEETING with my Client") == "Organize a APPOINTMENT with my Contact"
+
+
+def test_rules_load_from_file():
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump({"deadline": "target date", "crunch time": "busy period"}, f)
+
+    rewriter = PromptRewriter.from_file(f.name)
+
+    assert rewriter.rewrite("Crunch time before the deadline") == "Busy period before the target date"
+
+
+def test_many_rules_share_prefixes():
+    rules = {f"word{i}": f"term{i}" for i in range(1000)}
+    rewriter = PromptRewriter(rules)
+
+    assert rewriter.rewrite("word7 word999 word1000") == "term7 term999 word1000"
+
+
+if __name__ == "__main__":
+    test_whole_words_only()
+    test_case_is_preserved()
+    test_rules_load_from_file()
+    test_many_rules_share_prefixes()
+    print("SUCCESS: Prompt rewriter tests passed!")
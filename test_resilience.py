@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Test script for the 11Labs resilience layer
+Runs against a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from elevenlabs_tts_direct import ElevenLabsTTSDirect
+from local_elevenlabs_server import LocalElevenLabsServer
+from rate_limiter import TokenBucket
+from resilience import CircuitBreaker, Resilience, parse_retry_after
+
+
+def make_client(server, resilience):
+    client = ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport(resilience=resilience))
+    client.base_url = server.base_url
+    return client
+
+
+def test_throttling_and_server_errors_are_retried():
+    resilience = Resilience(max_retries=3, base_delay=0.01)
+    with LocalElevenLabsServer() as server:
+        client = make_client(server, resilience)
+
+        server.fail_next(429, retry_after=0.1)
+        server.fail_next(503)
+        started = time.perf_counter()
+        assert client.text_to_speech("hello")["success"]
+        assert time.perf_counter() - started >= 0.1
+
+        stats = resilience.stats()
+        assert stats["attempts"] == 3 and stats["retries"] == 2
+        assert stats["throttled"] == 1 and stats["server_errors"] == 1
+
+        # Client errors come straight back
+        server.fail_next(401)
+        result = client.get_available_voices()
+        assert not result["success"] and "401" in result["error"]
+        assert resilience.stats()["retries"] == 2
+
+
+def test_uploads_are_resent_on_retry():
+    resilience = Resilience(max_retries=2, base_delay=0.01)
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        path = os.path.join(tmp, "clip.m4a")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 4096)
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(resilience=resilience))
+        service.base_url = server.base_url
+
+        server.fail_next(500)
+        assert service.speech_to_text(path)["success"]
+        assert server.requests == 2
+
+
+def test_circuit_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.2)
+    resilience = Resilience(max_retries=0, breaker=breaker)
+    with LocalElevenLabsServer() as server:
+        client = make_client(server, resilience)
+
+        server.fail_next(500, 500, 500)
+        for _ in range(3):
+            assert not client.text_to_speech("hello")["success"]
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # Fails fast without touching the network
+        result = client.text_to_speech("hello")
+        assert not result["success"] and "circuit is open" in result["error"]
+        assert server.requests == 3
+        assert resilience.stats()["rejected"] == 1
+
+        time.sleep(0.25)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert client.text_to_speech("hello")["success"]
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unexpected_errors_settle_the_half_open_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    resilience = Resilience(max_retries=0, breaker=breaker)
+
+    class Response:
+        status_code = 200
+
+    def broken():
+        raise requests.exceptions.ChunkedEncodingError("connection broken mid-body")
+
+    try:
+        resilience.send(broken)
+    except requests.exceptions.ChunkedEncodingError:
+        pass
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.15)
+    try:
+        resilience.send(broken)
+    except requests.exceptions.ChunkedEncodingError:
+        pass
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # The failed trial must not block the next one once the reset timeout passes again
+    time.sleep(0.15)
+    assert resilience.send(Response).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_local_errors_do_not_trip_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    resilience = Resilience(max_retries=0, breaker=breaker)
+
+    class Response:
+        status_code = 500
+
+    def bad_url():
+        raise requests.exceptions.InvalidURL("no host supplied")
+
+    for _ in range(3):
+        try:
+            resilience.send(bad_url)
+        except requests.exceptions.InvalidURL:
+            pass
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    resilience.send(Response)
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.15)
+    try:
+        resilience.send(bad_url)
+    except requests.exceptions.InvalidURL:
+        pass
+    # The trial slot is handed back and the breaker is still waiting for a real answer
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_burst_load_stays_at_quota():
+    # Quota: 100 requests/s with bursts of 10
+    resilience = Resilience(rate_limiter=TokenBucket(100, capacity=10), max_concurrency=4)
+
+    with LocalElevenLabsServer(latency=0.005) as server:
+        client = make_client(server, resilience)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=lambda: [client.text_to_speech("hi") for _ in range(5)])
+                   for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        assert server.requests == 60
+        # 10 free tokens, then 50 more at 100/s
+        assert 0.45 <= elapsed < 1.0
+        assert resilience.stats()["attempts"] == 60
+
+
+def test_concurrency_is_capped():
+    resilience = Resilience(max_concurrency=3)
+    in_flight = [0, 0]
+    lock = threading.Lock()
+
+    class Response:
+        status_code = 200
+
+    def request():
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return Response()
+
+    threads = [threading.Thread(target=resilience.send, args=(request,)) for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert in_flight[1] == 3
+
+
+def test_retry_after_parsing():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+if __name__ == "__main__":
+    test_throttling_and_server_errors_are_retried()
+    test_uploads_are_resent_on_retry()
+    test_circuit_opens_and_recovers()
+    test_unexpected_errors_settle_the_half_open_trial()
+    test_local_errors_do_not_trip_the_breaker()
+    test_burst_load_stays_at_quota()
+    test_concurrency_is_capped()
+    test_retry_after_parsing()
+    print("SUCCESS: Resilience tests passed!")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the Gemini response cache
+Uses an in-process stand-in model so no API key is needed
+"""
+
+import tempfile
+from types import SimpleNamespace
+
+from gemini_client import GeminiClient
+from response_cache import ResponseCache
+
+
+class CountingModel:
+    model_name = "models/fake"
+
+    def __init__(self, finish_reason=1):
+        self.finish_reason = finish_reason
+        self.calls = 0
+
+    def generate_content(self, prompt, generation_config=None):
+        self.calls += 1
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason=self.finish_reason)],
+                               text=f"answer to {prompt}")
+
+
+def test_repeated_prompt_is_served_from_cache():
+    model = CountingModel()
+    client = GeminiClient(model=model, cache=ResponseCache())
+
+    first = client.generate_text("Explain quantum computing in simple terms")
+    second = client.generate_text("Explain quantum computing in simple terms")
+    client.generate_text("Explain quantum computing in simple terms", temperature=0.2)
+
+    assert first == second
+    assert model.calls == 2
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_blocked_responses_are_not_cached():
+    model = CountingModel(finish_reason=2)
+    client = GeminiClient(model=model, cache=ResponseCache())
+
+    client.generate_text("blocked prompt")
+    client.generate_text("blocked prompt")
+
+    assert model.calls == 2
+    assert client.cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_and_ttl():
+    cache = ResponseCache(max_entries=2, ttl_seconds=None)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats()["evictions"] == 1
+
+    expiring = ResponseCache(ttl_seconds=-1)
+    expiring.put("a", "1")
+    assert expiring.get("a") is None
+
+
+def test_disk_tier_survives_restart():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ResponseCache(cache_dir=cache_dir).put("key", "value")
+
+        restarted = ResponseCache(cache_dir=cache_dir)
+        assert restarted.get("key") == "value"
+        assert restarted.stats()["disk_hits"] == 1
+
+        bounded = ResponseCache(cache_dir=cache_dir, max_disk_entries=2)
+        for i in range(5):
+            bounded.put(f"k{i}", str(i))
+        assert len(bounded._disk_files()) == 2
+
+
+if __name__ == "__main__":
+    test_repeated_prompt_is_served_from_cache()
+    test_blocked_responses_are_not_cached()
+    test_lru_eviction_and_ttl()
+    test_disk_tier_survives_restart()
+    print("SUCCESS: Response cache tests passed!")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for hedged safety-fallback retries
+"""
+
+import asyncio
+import threading
+import time
+
+from gemini_client import make_fallback_strategy
+
+BLOCKED = "I apologize, but I cannot provide a response to that request due to safety guidelines."
+
+
+def make_generate(delay, blocked_prefixes):
+    calls = []
+
+    def generate(prompt):
+        calls.append(prompt)
+        time.sleep(delay)
+        if any(prompt.startswith(prefix) for prefix in blocked_prefixes):
+            return BLOCKED
+        return f"ok: {prompt}"
+
+    return generate, calls
+
+
+def test_rephrasings_run_concurrently():
+    strategy = make_fallback_strategy()
+    generate, calls = make_generate(0.2, ["book", "Please help", "I need"])
+
+    start = time.perf_counter()
+    response = strategy.resolve("book the client", "book the client", generate)
+    elapsed = time.perf_counter() - start
+
+    assert response == "ok: Can you help me with this task: book the client"
+    assert len(calls) == 4
+    # Original plus one parallel round, not four sequential calls
+    assert elapsed < 0.2 * 2.5
+    assert strategy.stats()["wins"]["Can you help me with this task: {user_input}"] == 1
+
+
+def test_winning_rephrasing_is_tried_first_next_time():
+    strategy = make_fallback_strategy()
+    generate, _ = make_generate(0.0, ["book", "Please help", "I need"])
+
+    strategy.resolve("book", "book", generate)
+
+    assert strategy.ordered_templates()[0] == "Can you help me with this task: {user_input}"
+
+
+def test_hedged_requests_overlap_a_slow_original():
+    strategy = make_fallback_strategy(hedge_delay=0.05)
+    generate, calls = make_generate(0.3, ["book"])
+
+    start = time.perf_counter()
+    response = strategy.resolve("book", "book", generate)
+    elapsed = time.perf_counter() - start
+
+    assert not response.startswith("I apologize")
+    assert elapsed < 0.3 * 1.5
+    assert len(calls) >= 2
+
+
+def test_original_prompt_runs_on_the_calling_thread():
+    strategy = make_fallback_strategy()
+    threads = []
+
+    def generate(prompt):
+        threads.append((prompt, threading.current_thread()))
+        return BLOCKED if prompt == "book" else f"ok: {prompt}"
+
+    assert strategy.resolve("fine", "fine", generate) == "ok: fine"
+    assert threads == [("fine", threading.current_thread())]
+
+    strategy.resolve("book", "book", generate)
+    assert threads[1] == ("book", threading.current_thread())
+    assert all(thread.name.startswith("gemini-fallback") for _, thread in threads[2:])
+
+
+def test_async_resolve_cancels_losers():
+    strategy = make_fallback_strategy()
+    cancelled = []
+
+    async def generate(prompt):
+        try:
+            await asyncio.sleep(0.01 if prompt.startswith(("Please", "book")) else 1.0)
+        except asyncio.CancelledError:
+            cancelled.append(prompt)
+            raise
+        return BLOCKED if prompt.startswith("book") else f"ok: {prompt}"
+
+    response = asyncio.run(strategy.resolve_async("book", "book", generate))
+
+    assert response == "ok: Please help me organize this: book"
+    assert len(cancelled) == 2
+
+
+def test_errors_are_not_rephrased():
+    strategy = make_fallback_strategy()
+    calls = []
+
+    def generate(prompt):
+        calls.append(prompt)
+        raise PermissionError("API key not valid")
+
+    try:
+        strategy.resolve("book", "book", generate)
+        assert False, "expected the original error"
+    except PermissionError:
+        pass
+    assert calls == ["book"]
+
+    async def generate_async(prompt):
+        calls.append(prompt)
+        raise PermissionError("API key not valid")
+
+    try:
+        asyncio.run(strategy.resolve_async("book", "book", generate_async))
+        assert False, "expected the original error"
+    except PermissionError:
+        pass
+    assert calls == ["book", "book"]
+
+
+if __name__ == "__main__":
+    test_rephrasings_run_concurrently()
+    test_winning_rephrasing_is_tried_first_next_time()
+    test_hedged_requests_overlap_a_slow_original()
+    test_original_prompt_runs_on_the_calling_thread()
+    test_async_resolve_cancels_losers()
+    test_errors_are_not_rephrased()
+    print("SUCCESS: Safety fallback tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for diarization analytics
+Uses hand-built and synthetic transcripts, no API key needed
+"""
+
+import json
+import time
+
+from columnar_transcript import ColumnarTranscript
+from speaker_analytics import diarization_stats, speaker_turns
+from synthetic_transcript import make_words
+
+SAMPLE = "transcription_results_20251003_232901.json"
+
+
+def word(text, start, end, speaker):
+    return {"text": text, "start": start, "end": end, "type": "word", "speaker_id": speaker, "logprob": 0.0}
+
+
+WORDS = [
+    word("hello", 0.0, 1.0, "a"),
+    {"text": " ", "start": 1.0, "end": 1.5, "type": "spacing", "speaker_id": "a", "logprob": 0.0},
+    word("there", 1.5, 2.0, "a"),
+    word("hi", 1.5, 3.0, "b"),          # overlaps a by 0.5 s
+    word("yes", 5.0, 6.0, "a"),         # 2 s gap
+    word("so", 6.0, 7.0, "a"),
+    {"text": "(laughs)", "start": 7.0, "end": 8.0, "type": "audio_event", "speaker_id": "b", "logprob": 0.0},
+    word("then", 9.0, 13.0, "a"),       # same speaker after a 2 s pause
+    word("ok", 14.0, 15.0, "b"),
+]
+
+
+def test_turns_are_merged():
+    turns = speaker_turns(WORDS)
+    assert [turns["speakers"][code] for code in turns["speaker"]] == ["a", "b", "a", "b"]
+    assert turns["start"].tolist() == [0.0, 1.5, 5.0, 14.0]
+    assert turns["end"].tolist() == [2.0, 3.0, 13.0, 15.0]
+    assert turns["words"].tolist() == [2, 1, 3, 1]
+
+    # Long pauses split a speaker's run
+    assert len(speaker_turns(WORDS, max_pause=1.5)["start"]) == 5
+
+
+def test_stats():
+    stats = diarization_stats(WORDS)
+    assert stats["speakers"]["a"] == {"talk_time": 10.0, "share": 10.0 / 12.5, "turns": 2, "words": 5,
+                                      "words_per_minute": 30.0}
+    assert stats["speakers"]["b"]["talk_time"] == 2.5
+    assert stats["duration"] == 15.0 and stats["words"] == 7
+    assert stats["words_per_minute"] == 28.0
+    assert stats["overlap_time"] == 0.5 and stats["overlap_count"] == 1
+    assert stats["gap_time"] == 3.0 and stats["gap_count"] == 2 and stats["longest_gap"] == 2.0
+    assert stats["longest_monologue"] == {"speaker_id": "a", "turn": 2, "start": 5.0, "end": 13.0,
+                                          "duration": 8.0, "words": 3}
+
+
+def test_words_without_timestamps_are_skipped():
+    untimed = WORDS + [{"text": "um", "start": 15.5, "type": "word", "speaker_id": "b"},
+                       {"text": "er", "end": 16.0, "type": "word", "speaker_id": "a"}]
+    assert diarization_stats(untimed) == diarization_stats(WORDS)
+
+
+def test_accepts_results_and_empty_transcripts():
+    with open(SAMPLE, encoding="utf-8") as f:
+        response = json.load(f)
+    stats = diarization_stats(response)
+    assert list(stats["speakers"]) == ["speaker_0"] and stats["turn_count"] == 1
+    assert diarization_stats({"transcript": ColumnarTranscript.from_response(response)}) == stats
+
+    empty = diarization_stats([])
+    assert empty["speakers"] == {} and empty["longest_monologue"] is None and empty["words_per_minute"] == 0.0
+
+
+def test_multi_hour_transcript_is_fast():
+    transcript = ColumnarTranscript.from_words(make_words(hours=8))
+    started = time.perf_counter()
+    stats = diarization_stats(transcript)
+    elapsed = time.perf_counter() - started
+
+    assert stats["words"] == 72000 and len(stats["speakers"]) == 3
+    assert stats["overlap_count"] > 0 and stats["gap_count"] > 0
+    assert elapsed < 0.5, f"took {elapsed:.3f}s"
+
+
+if __name__ == "__main__":
+    test_turns_are_merged()
+    test_stats()
+    test_words_without_timestamps_are_skipped()
+    test_accepts_results_and_empty_transcripts()
+    test_multi_hour_transcript_is_fast()
+    print("SUCCESS: Speaker analytics tests passed!")
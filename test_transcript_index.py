@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for time lookups and the full-text transcript index
+Uses the saved sample transcript, no API key needed
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from columnar_transcript import ColumnarTranscript
+from transcript_index import DOCS_FILE, POSTINGS_FILE, TranscriptIndex, tokenize
+
+SAMPLE = "transcription_results_20251003_232901.json"
+
+
+def load_sample():
+    with open(SAMPLE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_result(directory, name, words):
+    path = os.path.join(directory, f"transcription_results_{name}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"text": "".join(word["text"] for word in words), "words": words}, f)
+    return path
+
+
+def test_time_lookup():
+    words = load_sample()["words"]
+    transcript = ColumnarTranscript.from_words(words)
+
+    for index in (0, 2, len(words) - 1):
+        word = words[index]
+        middle = (word["start"] + word["end"]) / 2
+        assert transcript.index_at(middle) == index
+        assert transcript.word_at(middle) == word
+        assert transcript.speaker_at(middle) == word["speaker_id"]
+
+    assert transcript.index_at(words[0]["start"] - 0.1) == -1
+    assert transcript.word_at(words[-1]["end"] + 1) is None
+    assert transcript.speaker_at(-1) is None
+
+
+def test_search_returns_time_offsets():
+    words = load_sample()["words"]
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(SAMPLE, tmp)
+        index = TranscriptIndex(tmp)
+        assert index.update() == 1
+
+        yale = next(word for word in words if word["text"].startswith("Yale"))
+        assert index.search("yale") == [{"file": SAMPLE, "time": yale["start"], "position": 8}]
+
+        # Phrases must be consecutive; punctuation and case are ignored
+        hits = index.search("My name is")
+        assert len(hits) == 1 and hits[0]["time"] == words[2]["start"]
+        assert index.search("name my") == []
+        assert index.search("I") and len(index.search("I", limit=1)) == 1
+
+
+def test_incremental_update_and_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        first = save_result(tmp, "a", [{"text": "hello", "start": 0.0, "end": 0.5, "type": "word"}])
+        index = TranscriptIndex(tmp)
+        assert index.update() == 1
+        assert index.update() == 0
+
+        postings_size = os.path.getsize(os.path.join(tmp, POSTINGS_FILE))
+        save_result(tmp, "b", [{"text": "hello", "start": 3.0, "end": 3.5, "type": "word"},
+                               {"text": " ", "start": 3.5, "end": 3.6, "type": "spacing"},
+                               {"text": "world", "start": 3.6, "end": 4.0, "type": "word"}])
+        assert index.update() == 1
+        # The new document is appended, not rebuilt
+        with open(os.path.join(tmp, POSTINGS_FILE), encoding="utf-8") as f:
+            f.seek(postings_size)
+            assert len(f.readlines()) == 1
+
+        reloaded = TranscriptIndex(tmp)
+        assert reloaded.update() == 0
+        assert [hit["time"] for hit in reloaded.search("hello")] == [0.0, 3.0]
+        assert reloaded.search("hello world")[0]["file"] == "transcription_results_b.json"
+
+        # A changed file replaces its old entries
+        save_result(tmp, "a", [{"text": "goodbye, friend", "start": 1.0, "end": 2.0, "type": "word"}])
+        os.utime(first, (1, 1))
+        assert reloaded.update() == 1
+        assert [hit["time"] for hit in reloaded.search("hello")] == [3.0]
+        assert reloaded.search("goodbye friend")[0]["time"] == 1.0
+
+        # Superseded postings stay gone after a reload, before any compaction
+        before_compact = TranscriptIndex(tmp)
+        assert before_compact.update() == 0
+        assert [hit["time"] for hit in before_compact.search("hello")] == [3.0]
+        assert before_compact.stats() == reloaded.stats()
+
+        reloaded.compact()
+        compacted = TranscriptIndex(tmp)
+        assert compacted.stats() == reloaded.stats()
+        assert compacted.stats()["documents"] == 2
+
+
+def test_torn_append_is_reindexed():
+    with tempfile.TemporaryDirectory() as tmp:
+        save_result(tmp, "a", [{"text": "hello", "start": 0.0, "end": 0.5, "type": "word"}])
+        save_result(tmp, "b", [{"text": "world", "start": 1.0, "end": 1.5, "type": "word"}])
+        TranscriptIndex(tmp).update()
+        postings = os.path.join(tmp, POSTINGS_FILE)
+        with open(postings, encoding="utf-8") as f:
+            first_line = f.readline()
+        # A crash halfway through appending the second document
+        with open(postings, "w", encoding="utf-8") as f:
+            f.write(first_line + '{"doc": 1, "ter')
+
+        index = TranscriptIndex(tmp)
+        assert index.search("world") == []
+        assert index.update() == 1
+        assert index.search("world")[0]["time"] == 1.0
+        assert os.path.exists(os.path.join(tmp, DOCS_FILE))
+
+        # Recovered for good: later opens neither re-index nor append
+        size = os.path.getsize(postings)
+        for _ in range(3):
+            reopened = TranscriptIndex(tmp)
+            assert reopened.update() == 0
+            assert reopened.search("hello") and reopened.search("world")
+        assert os.path.getsize(postings) == size
+
+
+def test_results_without_words_are_indexed_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        save_result(tmp, "silent", [])
+        assert TranscriptIndex(tmp).update() == 1
+        size = os.path.getsize(os.path.join(tmp, POSTINGS_FILE))
+        for _ in range(3):
+            assert TranscriptIndex(tmp).update() == 0
+        assert os.path.getsize(os.path.join(tmp, POSTINGS_FILE)) == size
+
+
+def test_tokenize():
+    assert tokenize("Hi, I'm at Yale.") == ["hi", "i'm", "at", "yale"]
+    assert tokenize(" ") == []
+
+
+if __name__ == "__main__":
+    test_time_lookup()
+    test_search_returns_time_offsets()
+    test_incremental_update_and_reload()
+    test_torn_append_is_reindexed()
+    test_results_without_words_are_indexed_once()
+    test_tokenize()
+    print("SUCCESS: Transcript index tests passed!")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental reading and writing of transcription results
+Uses the saved sample transcript and synthetic transcripts, no API key needed
+"""
+
+import json
+import os
+import tempfile
+
+from columnar_transcript import ColumnarTranscript
+from synthetic_transcript import make_response
+from transcript_json import TranscriptWriter, iter_words, read_fields, write_result
+
+SAMPLE = "transcription_results_20251003_232901.json"
+
+
+def test_reads_the_saved_sample():
+    with open(SAMPLE, encoding="utf-8") as f:
+        response = json.load(f)
+
+    # Tiny chunks force every value to straddle refills
+    assert list(iter_words(SAMPLE, chunk_size=7)) == response["words"]
+    fields = read_fields(SAMPLE, chunk_size=7)
+    assert fields == {key: value for key, value in response.items() if key not in ("words", "text")}
+    assert read_fields(SAMPLE, skip=("words",))["text"] == response["text"]
+
+
+def test_writer_round_trips_through_json_load():
+    response = make_response(0.05, seed=3)
+    response["words"][0]["text"] = 'say "hi" \\ café'
+    response["text"] = "".join(word["text"] for word in response["words"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "result.json")
+        with TranscriptWriter(path, language_code="eng") as writer:
+            for word in response["words"]:
+                writer.write_word(word)
+            assert not os.path.exists(path)
+        assert writer.word_count == len(response["words"])
+
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["words"] == response["words"]
+        assert saved["text"] == response["text"]
+        assert saved["language_code"] == "eng"
+        assert list(iter_words(path, chunk_size=13)) == response["words"]
+
+        # Fields after the words, and columnar transcripts as the source
+        transcript = ColumnarTranscript.from_response(response)
+        write_result(path, {"words": transcript.iter_dicts(), "transcription_id": "t1"})
+        assert read_fields(path) == {"transcription_id": "t1"}
+        assert len(list(iter_words(path))) == len(transcript)
+
+
+def test_failed_write_leaves_no_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "result.json")
+        try:
+            with TranscriptWriter(path) as writer:
+                writer.write_word({"text": "hi"})
+                raise RuntimeError("upload interrupted")
+        except RuntimeError:
+            pass
+        assert os.listdir(tmp) == []
+
+
+def test_skips_nested_and_empty_values():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "result.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"raw_response": {"words": [{"text": "] } \" \\"}], "n": [1, [2, {}]]},
+                      "count": 12345, "words": [], "after": True}, f)
+
+        assert list(iter_words(path, chunk_size=3)) == []
+        assert read_fields(path, skip=("raw_response", "words"), chunk_size=3) == {"count": 12345, "after": True}
+
+
+if __name__ == "__main__":
+    test_reads_the_saved_sample()
+    test_writer_round_trips_through_json_load()
+    test_failed_write_leaves_no_file()
+    test_skips_nested_and_empty_values()
+    print("SUCCESS: Transcript JSON tests passed!")
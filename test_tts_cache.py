@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk TTS audio cache
+Runs against a local stand-in server, no API key needed
+"""
+
+import os
+import tempfile
+import time
+
+from elevenlabs_audio_service import ElevenLabsAudioService
+from elevenlabs_transport import ElevenLabsTransport
+from elevenlabs_tts_direct import ElevenLabsTTSDirect
+from local_elevenlabs_server import LocalElevenLabsServer
+from tts_cache import TTSCache
+
+
+def test_repeated_phrase_skips_the_network():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        cache = TTSCache(tmp)
+        client = ElevenLabsTTSDirect(api_key="test", transport=ElevenLabsTransport(), cache=cache)
+        client.base_url = server.base_url
+
+        first = client.text_to_speech("Hello there")
+        second = client.text_to_speech("Hello there")
+        client.text_to_speech("Hello there", model_id="eleven_flash_v2_5")
+
+        assert not first["cached"] and second["cached"]
+        assert first["audio_data"] == second["audio_data"]
+        assert server.requests == 2
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+        # Failed requests are not cached
+        server.fail_next(500)
+        assert not client.text_to_speech("Goodbye")["success"]
+        assert cache.stats()["entries"] == 2
+
+
+def test_cache_survives_restart():
+    with tempfile.TemporaryDirectory() as tmp, LocalElevenLabsServer() as server:
+        service = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(), cache=TTSCache(tmp))
+        service.base_url = server.base_url
+        service.text_to_speech("Hello there")
+
+        reopened = ElevenLabsAudioService(api_key="test", transport=ElevenLabsTransport(), cache=TTSCache(tmp))
+        reopened.base_url = server.base_url
+        filename = os.path.join(tmp, "hello.mp3")
+        result = reopened.text_to_speech("Hello there", save_to_file=True, filename=filename)
+
+        assert result["cached"]
+        assert os.path.getsize(filename) == result["audio_size"]
+        assert server.requests == 1
+
+
+def test_size_bound_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TTSCache(tmp, max_bytes=300)
+        keys = [TTSCache.make_key(f"phrase {i}", "voice", "model", "mp3") for i in range(4)]
+
+        cache.put(keys[0], b"a" * 100)
+        cache.put(keys[1], b"b" * 100)
+        cache.put(keys[2], b"c" * 100)
+        assert cache.get(keys[0]) == b"a" * 100
+        cache.put(keys[3], b"d" * 100)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        stats = cache.stats()
+        assert stats["entries"] == 3 and stats["bytes"] == 300 and stats["evictions"] == 1
+
+        # Clips larger than the whole cache are not stored
+        cache.put(keys[1], b"x" * 301)
+        assert cache.get(keys[1]) is None
+
+
+def test_unused_clips_expire():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TTSCache(tmp, max_age_seconds=60)
+        old = TTSCache.make_key("old", "voice", "model", "mp3")
+        new = TTSCache.make_key("new", "voice", "model", "mp3")
+        cache.put(old, b"old")
+        cache.put(new, b"new")
+
+        stale = time.time() - 120
+        os.utime(cache._path(old), (stale, stale))
+
+        assert cache.prune() == 1
+        assert cache.get(old) is None
+        assert cache.get(new) == b"new"
+        assert cache.stats()["bytes"] == 3
+
+
+if __name__ == "__main__":
+    test_repeated_phrase_skips_the_network()
+    test_cache_survives_restart()
+    test_size_bound_evicts_least_recently_used()
+    test_unused_clips_expire()
+    print("SUCCESS: TTS cache tests passed!")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Text helpers shared by the Gemini and text-to-speech layers
+Kept free of SDK imports so either side can use them cheaply
+"""
+
+import re
+from typing import Iterable, Iterator
+
+# End of a sentence or clause worth handing to TTS on its own
+SENTENCE_END = re.compile(r'(?<=[.!?;:])\s+|\n+')
+
+
+def iter_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed text chunks into whole sentences
+
+    Lets the TTS layer start speaking as soon as the first sentence is complete.
+
+    Args:
+        chunks: Text chunks, e.g. as produced by GeminiClient.stream_text / stream_prompt
+
+    Yields:
+        str: Complete sentences (the remainder is flushed at the end)
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        parts = SENTENCE_END.split(buffer)
+        for sentence in parts[:-1]:
+            if sentence.strip():
+                yield sentence.strip()
+        buffer = parts[-1]
+    if buffer.strip():
+        yield buffer.strip()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Full-text index over saved transcription results
+An incremental inverted index mapping each term to the files and times where it was spoken
+"""
+
+import glob
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from response_cache import atomic_write_bytes
+from transcript_json import iter_words
+
+RESULTS_PATTERN = "transcription_results_*.json"
+
+# Index files, written next to the results they cover
+DOCS_FILE = "transcript_index.docs.json"
+POSTINGS_FILE = "transcript_index.postings.jsonl"
+
+TERM = re.compile(r"[\w']+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case search terms in a piece of text"""
+    return [term.strip("'") for term in TERM.findall(text.lower()) if term.strip("'")]
+
+
+class TranscriptIndex:
+    """Inverted index from terms to (file, word position, start time) across saved transcripts"""
+
+    def __init__(self, results_dir: str = "."):
+        """
+        Open the index stored in a results directory, creating it if missing
+
+        Args:
+            results_dir: Directory holding the transcription_results_*.json files
+        """
+        self.results_dir = results_dir
+        self._lock = threading.Lock()
+
+        # docs[doc_id] = {"file", "mtime", "size"}
+        self.docs: List[Dict[str, Any]] = []
+        # postings[term][doc_id] = [(position, start_time), ...]
+        self.postings: Dict[str, Dict[int, List[tuple]]] = defaultdict(dict)
+        self._load()
+
+    @property
+    def _docs_path(self) -> str:
+        return os.path.join(self.results_dir, DOCS_FILE)
+
+    @property
+    def _postings_path(self) -> str:
+        return os.path.join(self.results_dir, POSTINGS_FILE)
+
+    def _load(self):
+        try:
+            with open(self._docs_path, 'r', encoding='utf-8') as f:
+                self.docs = json.load(f)
+        except (OSError, ValueError):
+            self.docs = []
+            return
+
+        # Later lines for a document supersede earlier ones
+        latest: Dict[int, Dict[str, List[list]]] = {}
+        complete = 0
+        try:
+            with open(self._postings_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Torn by a crash mid-append; that document is re-added by update()
+                        break
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry["doc"] < len(self.docs):
+                        latest[entry["doc"]] = entry["terms"]
+            # Cut the torn tail so the next append starts on a fresh line
+            if complete != os.path.getsize(self._postings_path):
+                with open(self._postings_path, 'r+b') as f:
+                    f.truncate(complete)
+        except OSError:
+            pass
+
+        for doc_id, terms in latest.items():
+            self._merge(doc_id, terms)
+
+        # Forget documents whose postings never made it to disk
+        for doc_id, doc in enumerate(self.docs):
+            if doc_id not in latest:
+                doc["mtime"] = None
+
+    def _merge(self, doc_id: int, terms: Dict[str, List[list]]):
+        for term, hits in terms.items():
+            self.postings[term][doc_id] = [tuple(hit) for hit in hits]
+
+    def add(self, path: str, words: Optional[Iterable[Dict[str, Any]]] = None) -> int:
+        """
+        Index one transcription result, appending to the index files
+
+        Re-adding a file replaces its earlier entries.
+
+        Args:
+            path: Result file
+            words: The result's words, if already in memory. Streamed from path if not provided
+
+        Returns:
+            int: Number of words indexed
+        """
+        if words is None:
+            words = iter_words(path)
+
+        terms: Dict[str, List[list]] = defaultdict(list)
+        position = 0
+        for word in words:
+            if word.get("type", "word") != "word":
+                continue
+            for term in tokenize(word.get("text", "")):
+                terms[term].append([position, word.get("start")])
+                position += 1
+
+        stat = os.stat(path)
+        name = os.path.relpath(path, self.results_dir)
+        with self._lock:
+            doc_id = next((i for i, doc in enumerate(self.docs) if doc["file"] == name), len(self.docs))
+            if doc_id == len(self.docs):
+                self.docs.append({})
+            else:
+                for hits in self.postings.values():
+                    hits.pop(doc_id, None)
+            self.docs[doc_id] = {"file": name, "mtime": stat.st_mtime, "size": stat.st_size}
+
+            # Postings first, then the document table, so a crash in between is repaired on load
+            with open(self._postings_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"doc": doc_id, "terms": terms}) + "\n")
+            atomic_write_bytes(self._docs_path, json.dumps(self.docs).encode('utf-8'))
+            self._merge(doc_id, terms)
+        return position
+
+    def update(self) -> int:
+        """
+        Index result files that are new or changed since they were last indexed
+
+        Returns:
+            int: Number of files (re)indexed
+        """
+        with self._lock:
+            known = {doc["file"]: doc for doc in self.docs}
+
+        changed = 0
+        for path in sorted(glob.glob(os.path.join(self.results_dir, RESULTS_PATTERN))):
+            doc = known.get(os.path.relpath(path, self.results_dir))
+            stat = os.stat(path)
+            if doc and doc["mtime"] == stat.st_mtime and doc["size"] == stat.st_size:
+                continue
+            self.add(path)
+            changed += 1
+        return changed
+
+    def compact(self):
+        """Rewrite the postings file without entries superseded by re-added documents"""
+        with self._lock:
+            per_doc: Dict[int, Dict[str, list]] = defaultdict(dict)
+            for term, hits in self.postings.items():
+                for doc_id, occurrences in hits.items():
+                    per_doc[doc_id][term] = [list(hit) for hit in occurrences]
+            lines = "".join(json.dumps({"doc": doc_id, "terms": terms}) + "\n"
+                            for doc_id, terms in sorted(per_doc.items()))
+            atomic_write_bytes(self._postings_path, lines.encode('utf-8'))
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find where a word or phrase was spoken
+
+        Args:
+            query: One or more words; several words must occur consecutively
+            limit: Most hits to return
+
+        Returns:
+            list: Hits as {"file", "time", "position"}, ordered by file then time
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            first = self.postings.get(terms[0], {})
+            others = [self.postings.get(term, {}) for term in terms[1:]]
+            hits = []
+            for doc_id in sorted(first):
+                following = [set(position for position, _ in postings.get(doc_id, ())) for postings in others]
+                if others and not all(following):
+                    continue
+                for position, start in first[doc_id]:
+                    if all(position + offset + 1 in positions for offset, positions in enumerate(following)):
+                        hits.append({"file": self.docs[doc_id]["file"], "time": start, "position": position})
+                        if limit is not None and len(hits) >= limit:
+                            return hits
+        return hits
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the size of the index"""
+        with self._lock:
+            return {
+                "documents": len(self.docs),
+                "terms": len(self.postings),
+                "postings": sum(len(hits) for terms in self.postings.values() for hits in terms.values())
+            }
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON reading and writing for Speech-to-Text results
+Word entries are written as they arrive and read back one at a time, in constant memory
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Dict, Iterable, Iterator
+
+# Characters read from the file per refill
+READ_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"\s*")
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_DELIMITER = re.compile(r"[\s,\]}]")
+
+_decoder = json.JSONDecoder()
+
+
+class TranscriptWriter:
+    """
+    Write a speech-to-text result one word at a time
+
+    Top-level fields are written first, then the "words" array entry by entry. The
+    "text" field is assembled from the words on close unless given explicitly. The
+    file is written to a .part sibling and renamed on close, so readers never see
+    a truncated result.
+
+    Example:
+        with TranscriptWriter("transcription_results.json", language_code="eng") as writer:
+            for word in words:
+                writer.write_word(word)
+    """
+
+    def __init__(self, path: str, **fields):
+        """
+        Start a result file
+
+        Args:
+            path: File to write
+            **fields: Top-level fields written before the words (language_code, ...)
+        """
+        self.path = path
+        self.word_count = 0
+        self._partial = f"{path}.part"
+        self._file = open(self._partial, 'w', encoding='utf-8')
+        # Text is spooled to disk as it arrives so it never accumulates in memory
+        self._text = None if "text" in fields else tempfile.TemporaryFile('w+', encoding='utf-8')
+
+        self._file.write("{")
+        for key, value in fields.items():
+            self._file.write(f"{json.dumps(key)}: {json.dumps(value)}, ")
+        self._file.write('"words": [')
+
+    def write_word(self, word: Dict[str, Any]):
+        """Append one entry to the words array"""
+        if self.word_count:
+            self._file.write(", ")
+        self._file.write(json.dumps(word))
+        if self._text:
+            self._text.write(json.dumps(word.get("text", ""))[1:-1])
+        self.word_count += 1
+
+    def write_words(self, words: Iterable[Dict[str, Any]]):
+        """Append entries from any iterable, e.g. ColumnarTranscript.iter_dicts()"""
+        for word in words:
+            self.write_word(word)
+
+    def close(self, **fields):
+        """
+        Finish the file and move it into place
+
+        Args:
+            **fields: Top-level fields written after the words (transcription_id, ...)
+        """
+        self._file.write("]")
+        if self._text and "text" not in fields:
+            self._file.write(', "text": "')
+            self._text.seek(0)
+            shutil.copyfileobj(self._text, self._file)
+            self._file.write('"')
+        for key, value in fields.items():
+            self._file.write(f", {json.dumps(key)}: {json.dumps(value)}")
+        self._file.write("}")
+        self._release()
+        os.replace(self._partial, self.path)
+
+    def abort(self):
+        """Discard the partial file"""
+        self._release()
+        if os.path.exists(self._partial):
+            os.remove(self._partial)
+
+    def _release(self):
+        self._file.close()
+        if self._text:
+            self._text.close()
+
+    def __enter__(self) -> "TranscriptWriter":
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_result(path: str, result: Dict[str, Any]):
+    """
+    Save a speech-to-text result without serializing it to one string first
+
+    Args:
+        path: File to write
+        result: Response dict; "words" may be any iterable of word dicts
+    """
+    fields = {key: value for key, value in result.items() if key != "words"}
+    with TranscriptWriter(path, **fields) as writer:
+        writer.write_words(result.get("words", ()))
+
+
+class _Scanner:
+    """Pull parser over the top level of a JSON object, refilling a small buffer from the file"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.consumed = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read another chunk, dropping what has been consumed; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.consumed += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON")
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode the value at the cursor, reading more when it runs past the buffer"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut off by the end of the buffer (e.g. "1." of "1.0") may continue in the next chunk
+            if not isinstance(value, (str, dict, list)) and not _DELIMITER.match(self.buffer, end) \
+                    and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Step over the value at the cursor without building it"""
+        char = self.peek()
+        if char == '"':
+            self.pos += 1
+            self._skip_string()
+        elif char in "{[":
+            self.pos += 1
+            depth = 1
+            while depth:
+                match = _STRUCTURE.search(self.buffer, self.pos)
+                if not match:
+                    self.pos = len(self.buffer)
+                    if not self.fill():
+                        raise ValueError("Unexpected end of JSON")
+                    continue
+                self.pos = match.end()
+                if match.group() == '"':
+                    self._skip_string()
+                else:
+                    depth += 1 if match.group() in "{[" else -1
+        else:
+            self.decode()
+
+    def _skip_string(self):
+        # Cursor is just past the opening quote
+        while True:
+            match = _STRING_END.search(self.buffer, self.pos)
+            if not match or (match.group() == "\\" and match.end() == len(self.buffer)):
+                self.pos = match.start() if match else len(self.buffer)
+                if not self.fill():
+                    raise ValueError("Unterminated string in JSON")
+                continue
+            if match.group() == '"':
+                self.pos = match.end()
+                return
+            self.pos = match.end() + 1
+
+    def fields(self) -> Iterator[str]:
+        """Iterate over the keys of the top-level object, leaving the cursor at each value"""
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            start = self.consumed + self.pos
+            yield key
+            if self.consumed + self.pos == start:
+                self.skip()
+            if self.peek() == "}":
+                return
+            self.expect(",")
+
+    def array(self) -> Iterator[Any]:
+        """Iterate over the items of the array at the cursor"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == "]":
+                self.pos += 1
+                return
+            self.expect(",")
+
+
+def iter_words(path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the words of a saved speech-to-text result without loading the file
+
+    Memory use is bounded by chunk_size and the largest single entry, whatever the
+    length of the transcript.
+
+    Args:
+        path: Result file
+        chunk_size: Characters read per refill
+
+    Returns:
+        Iterator: Word dicts in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        scanner = _Scanner(f, chunk_size)
+        for key in scanner.fields():
+            if key == "words":
+                yield from scanner.array()
+                return
+
+
+def read_fields(path: str, skip: Iterable[str] = ("words", "text"),
+                chunk_size: int = READ_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Read the top-level fields of a saved result, stepping over the large ones
+
+    Args:
+        path: Result file
+        skip: Fields not to load (by default the words and the full text)
+        chunk_size: Characters read per refill
+
+    Returns:
+        Dictionary of the remaining fields
+    """
+    skip = set(skip)
+    fields: Dict[str, Any] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        scanner = _Scanner(f, chunk_size)
+        for key in scanner.fields():
+            if key not in skip:
+                fields[key] = scanner.decode()
+    return fields
+
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for synthesized speech
+Identical (text, voice, model, format) requests are served from disk without touching the network
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from response_cache import atomic_write_bytes
+
+AUDIO_SUFFIX = ".audio"
+
+
+class TTSCache:
+    """Sharded on-disk audio cache with size- and age-bounded LRU eviction"""
+
+    def __init__(self, cache_dir: str = ".tts_cache", max_bytes: int = 256 * 1024 * 1024,
+                 max_age_seconds: Optional[float] = None):
+        """
+        Initialize the TTS cache
+
+        Args:
+            cache_dir: Directory holding the cached audio
+            max_bytes: Total audio size kept on disk before least recently used clips are evicted
+            max_age_seconds: Seconds a clip may go unused before it expires (None keeps clips until evicted for size)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Index of key -> size in least-recently-used order, rebuilt once from file mtimes
+        # so lookups and evictions never walk the directory tree
+        found = []
+        for root, _, files in os.walk(cache_dir):
+            for name in files:
+                if name.endswith(AUDIO_SUFFIX):
+                    stat = os.stat(os.path.join(root, name))
+                    found.append((stat.st_mtime, name[:-len(AUDIO_SUFFIX)], stat.st_size))
+        found.sort()
+        self._index: "OrderedDict[str, int]" = OrderedDict((key, size) for _, key, size in found)
+        self._total_bytes = sum(self._index.values())
+
+    @staticmethod
+    def make_key(text: str, voice_id: str, model_id: str, output_format: str) -> str:
+        """Build a cache key from everything that influences the synthesized audio"""
+        payload = json.dumps([text, voice_id, model_id, output_format])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up cached audio
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            bytes: Cached audio, or None on a miss
+        """
+        path = self._path(key)
+        with self._lock:
+            known = key in self._index
+
+        audio = None
+        if known:
+            try:
+                if self._expired(os.path.getmtime(path)):
+                    self._discard(key)
+                else:
+                    with open(path, 'rb') as f:
+                        audio = f.read()
+                    # Refresh mtime so the LRU order survives restarts
+                    os.utime(path)
+            except OSError:
+                self._forget(key)
+
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+                return None
+            if key in self._index:
+                self._index.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, key: str, audio: bytes):
+        """
+        Store synthesized audio
+
+        Args:
+            key: Key returned by make_key
+            audio: Audio bytes
+        """
+        if len(audio) > self.max_bytes:
+            return
+        atomic_write_bytes(self._path(key), audio)
+
+        with self._lock:
+            self._total_bytes += len(audio) - self._index.pop(key, 0)
+            self._index[key] = len(audio)
+            victims = []
+            while self._total_bytes > self.max_bytes:
+                victim, size = self._index.popitem(last=False)
+                self._total_bytes -= size
+                self.evictions += 1
+                victims.append(victim)
+
+        for victim in victims:
+            self._remove_file(victim)
+
+    def prune(self) -> int:
+        """
+        Remove clips that have gone unused for longer than max_age_seconds
+
+        Returns:
+            int: Number of clips removed
+        """
+        if self.max_age_seconds is None:
+            return 0
+        with self._lock:
+            keys = list(self._index)
+
+        removed = 0
+        for key in keys:
+            try:
+                mtime = os.path.getmtime(self._path(key))
+            except OSError:
+                self._forget(key)
+                continue
+            if not self._expired(mtime):
+                # Index is in LRU order, so everything after this is newer
+                break
+            self._discard(key)
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every cached clip"""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_file(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and disk usage for the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}{AUDIO_SUFFIX}")
+
+    def _expired(self, mtime: float) -> bool:
+        return self.max_age_seconds is not None and time.time() - mtime > self.max_age_seconds
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+
+    def _discard(self, key: str):
+        with self._lock:
+            if key not in self._index:
+                return
+            self._total_bytes -= self._index.pop(key)
+            self.evictions += 1
+        self._remove_file(key)
+
+    def _remove_file(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass